@@ -3,6 +3,10 @@ from .client import Edit
 from .client import Note
 from .client import Invitation
 from .client import Edge
+from .client import EdgeBatch
 from .client import Group
 from .client import Tag
+from .client import Record
+from .client import ProcessStatus
+from .async_client import AsyncOpenReviewClient
 from .iThenticate_client import iThenticateClient
@@ -0,0 +1,660 @@
+#!/usr/bin/python
+import asyncio
+import os
+import re
+import sys
+import time
+import jwt
+import json as jsonlib
+from .. import tools
+from ..openreview import Profile
+from ..openreview import OpenReviewException
+from .client import Note, Edge, EdgeBatch, Group, Invitation, Tag, Record, ProcessStatus
+
+class AsyncOpenReviewClient(object):
+    """
+    Asyncio version of OpenReviewClient. The requests are sent through a pool of keep-alive connections shared by all the coroutines,
+    so thousands of requests can run concurrently from the same event loop, e.g.
+
+    ``async with AsyncOpenReviewClient(baseurl='https://api2.openreview.net', username=username, password=password) as client:``
+    ``    notes = await asyncio.gather(*[client.get_note(note_id) for note_id in note_ids])``
+
+    The methods return the same Note, Edge, Group, Invitation and Tag objects as OpenReviewClient. It requires the aiohttp package.
+
+    Only a subset of OpenReviewClient is supported:
+
+    - login_user and get_profile
+    - get_note, get_notes, get_all_notes and post_note_edit
+    - get_group, get_groups, get_all_groups and post_group_edit
+    - get_invitation, get_invitations, get_all_invitations and post_invitation_edit
+    - get_edges, get_all_edges (without groupby), get_edges_count, post_edge, post_edges and delete_edges
+    - get_tags, get_all_tags, post_tag and post_tags
+    - get_process_logs and await_processes
+
+    Any other call, e.g. get_profiles, search_profiles, post_message, add_members_to_group or the rename methods, should use OpenReviewClient.
+
+    A response with status 429 is retried for any method after the seconds of its Retry-After header. The GET and DELETE requests are also
+    retried after a 500, 502, 503 or 504 response, honoring the Retry-After header of a 503.
+
+    :param baseurl: URL to the host, example: https://api2.openreview.net (should be replaced by 'host' name). If none is provided, it defaults to the environment variable `OPENREVIEW_BASEURL`
+    :type baseurl: str, optional
+    :param username: OpenReview username. If none is provided, it defaults to the environment variable `OPENREVIEW_USERNAME`
+    :type username: str, optional
+    :param password: OpenReview password. If none is provided, it defaults to the environment variable `OPENREVIEW_PASSWORD`
+    :type password: str, optional
+    :param token: Session token. This token can be provided instead of the username and password if the user had already logged in
+    :type token: str, optional
+    :param tokenExpiresIn: Time in seconds before the token expires
+    :type tokenExpiresIn: number, optional
+    :param max_connections: Maximum number of open connections, the requests above it wait for a free connection
+    :type max_connections: int, optional
+    :param keepalive_timeout: Seconds an idle connection is kept open to be reused
+    :type keepalive_timeout: float, optional
+    """
+    def __init__(self, baseurl = None, username = None, password = None, token = None, tokenExpiresIn = None, max_connections = 100, keepalive_timeout = 60):
+        self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_BASEURL', 'http://localhost:3001')
+        self.groups_url = self.baseurl + '/groups'
+        self.login_url = self.baseurl + '/login'
+        self.profiles_url = self.baseurl + '/profiles'
+        self.notes_url = self.baseurl + '/notes'
+        self.tags_url = self.baseurl + '/tags'
+        self.bulk_tags_url = self.baseurl + '/tags/bulk'
+        self.edges_url = self.baseurl + '/edges'
+        self.bulk_edges_url = self.baseurl + '/edges/bulk'
+        self.edges_count_url = self.baseurl + '/edges/count'
+        self.invitations_url = self.baseurl + '/invitations'
+        self.process_logs_url = self.baseurl + '/logs/process'
+        self.note_edits_url = self.baseurl + '/notes/edits'
+        self.invitation_edits_url = self.baseurl + '/invitations/edits'
+        self.group_edits_url = self.baseurl + '/groups/edits'
+        self.user_agent = 'OpenReviewPy/v' + str(sys.version_info[0])
+
+        self.limit = 1000
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.max_retries = 3
+        self.token = token.replace('Bearer ', '') if token else None
+        self.profile = None
+        self.user = jwt.decode(self.token, options={"verify_signature": False}) if self.token else None
+        self.headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'application/json'
+        }
+        if self.token:
+            self.headers['Authorization'] = 'Bearer ' + self.token
+
+        self.__username = username or os.environ.get('OPENREVIEW_USERNAME')
+        self.__password = password or os.environ.get('OPENREVIEW_PASSWORD')
+        self.__token_expires_in = tokenExpiresIn
+        self.session = None
+        self.request_hooks = []
+        self.__batch_process_logs = True
+
+    async def __aenter__(self):
+        if not self.token and (self.__username or self.__password):
+            await self.login_user(self.__username, self.__password, expiresIn=self.__token_expires_in)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __get_session(self):
+        if self.session is None:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections, keepalive_timeout=self.keepalive_timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=300))
+        return self.session
+
+    async def close(self):
+        """
+        Closes the connections of the pool
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def add_request_hook(self, hook):
+        """
+        Adds a function that is called with a tools.RequestRecord after every HTTP request, e.g. tools.RequestMetrics or tools.OTLPFileExporter
+
+        :param hook: function that receives the RequestRecord
+        :type hook: callable
+        """
+        self.request_hooks.append(hook)
+
+    def remove_request_hook(self, hook):
+        """
+        Removes a function added with add_request_hook
+
+        :param hook: function that receives the RequestRecord
+        :type hook: callable
+        """
+        self.request_hooks.remove(hook)
+
+    async def __request(self, method, url, params=None, json=None):
+        ## Same error format as OpenReviewClient. A 429 response was rejected before it was processed so it is retried for any method, but
+        ## only the idempotent GET and DELETE requests are retried after a 500, 502, 503 or 504 response, a POST is sent once since the
+        ## server may have saved it before failing
+        session = self.__get_session()
+        record = tools.RequestRecord(method, url[len(self.baseurl):], params=','.join(sorted(params)) if params else '') if self.request_hooks else None
+        start = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                async with session.request(method, url, params=tools.format_params(params) if params else None, json=json, headers=self.headers) as response:
+                    if record:
+                        record.retries = attempt
+                        record.status = response.status
+                    body = await response.read()
+                    if record:
+                        record.bytes_in = len(body)
+                    if response.status < 400:
+                        return jsonlib.loads(body) if body else None
+                    if 'application/json' in response.headers.get('Content-Type', ''):
+                        error = jsonlib.loads(body)
+                    else:
+                        error = { 'name': 'Error', 'message': body.decode(errors='replace') or response.reason }
+                    exception = OpenReviewException(error)
+                    exception.status = response.status
+                    exception.retry_after = response.headers.get('Retry-After')
+                retryable = response.status == 429 or (method in ('GET', 'DELETE') and response.status in (500, 502, 503, 504))
+                if not retryable or attempt >= self.max_retries:
+                    raise exception
+                retry_after = tools.RequestScheduler.get_retry_after(exception, attempt)
+                await asyncio.sleep(retry_after if retry_after is not None else 2 ** attempt)
+        except Exception as e:
+            if record and record.status is None:
+                record.error = type(e).__name__
+            raise
+        finally:
+            if record:
+                record.latency = time.perf_counter() - start
+                record.bytes_out = len(jsonlib.dumps(json)) if json is not None else 0
+                for hook in self.request_hooks:
+                    try:
+                        hook(record)
+                    except Exception as e:
+                        print('Request hook failed', hook, e)
+
+    def __clean_params(self, params):
+        return { key: value for key, value in params.items() if value is not None }
+
+    async def __get_all(self, get_function, **params):
+        ## Gets the first page with the count, then the rest of the pages concurrently
+        params['limit'] = self.limit
+        params['with_count'] = True
+        params.pop('offset', None)
+        results, count = await get_function(**params)
+        params.pop('with_count')
+        pages = await asyncio.gather(*[get_function(offset=offset, **params) for offset in range(self.limit, count, self.limit)])
+        for page in pages:
+            results.extend(page)
+        return results
+
+    async def login_user(self, username=None, password=None, expiresIn=None):
+        """
+        Logs in a registered user
+
+        :param username: OpenReview username
+        :type username: str, optional
+        :param password: OpenReview password
+        :type password: str, optional
+
+        :return: Dictionary containing user information and the authentication token
+        :rtype: dict
+        """
+        user = { 'id': username, 'password': password, 'expiresIn': expiresIn }
+        json_response = await self.__request('POST', self.login_url, json=user)
+        self.token = str(json_response['token'])
+        self.user = jwt.decode(self.token, options={"verify_signature": False})
+        self.headers['Authorization'] = 'Bearer ' + self.token
+        self.profile = Profile(id = json_response['user']['profile']['id'])
+        return json_response
+
+    async def get_profile(self, email_or_id = None):
+        """
+        Get a single Profile by id, if available
+
+        :param email_or_id: e-mail or id of the profile
+        :type email_or_id: str, optional
+
+        :return: Profile object with its information
+        :rtype: Profile
+        """
+        params = {}
+        if email_or_id:
+            params['id' if re.match('~.+', email_or_id) else 'email'] = email_or_id
+        profiles = (await self.__request('GET', self.profiles_url, params=params))['profiles']
+        if profiles:
+            return Profile.from_json(profiles[0])
+        raise OpenReviewException(['Profile Not Found'])
+
+    async def get_note(self, id, details=None):
+        """
+        Get a single Note by id if available
+
+        :param id: id of the note
+        :type id: str
+
+        :return: Note matching the passed id
+        :rtype: Note
+        """
+        json_response = await self.__request('GET', self.notes_url, params=self.__clean_params({ 'id': id, 'details': details }))
+        return Note.from_json(json_response['notes'][0])
+
+    async def get_notes(self, id = None, paperhash = None, forum = None, invitation = None, parent_invitations = None, replyto = None, tauthor = None, signature = None,
+            transitive_members = None, signatures = None, writer = None, trash = None, number = None, content = None, limit = None, offset = None, after = None,
+            mintcdate = None, domain = None, details = None, sort = None, with_count = None, select = None):
+        """
+        Gets list of Note objects based on the filters provided. The parameters are the same as OpenReviewClient.get_notes.
+
+        :return: List of Notes, or the list and the count if with_count is True
+        :rtype: list[Note]
+        """
+        params = self.__clean_params({
+            'id': id,
+            'paperhash': paperhash,
+            'forum': forum,
+            'invitation': invitation,
+            'parentInvitations': parent_invitations,
+            'replyto': replyto,
+            'tauthor': tauthor,
+            'signature': signature,
+            'transitiveMembers': transitive_members,
+            'signatures': signatures,
+            'writer': writer,
+            'trash': True if trash == True else None,
+            'number': number,
+            'limit': limit,
+            'offset': offset,
+            'after': after,
+            'mintcdate': mintcdate,
+            'domain': domain,
+            'details': details,
+            'sort': sort,
+            'count': with_count,
+            'select': select or None
+        })
+        for k in (content or {}):
+            params['content.' + k] = content[k]
+
+        from_json = Record.get_class('NoteRecord', select).from_json if select else Note.from_json
+        json_response = await self.__request('GET', self.notes_url, params=params)
+        notes = [from_json(n) for n in json_response['notes']]
+        if with_count and offset is None:
+            return notes, json_response['count']
+        return notes
+
+    async def get_all_notes(self, **params):
+        """
+        Gets all the Notes that match the filters, the pages are requested concurrently. The parameters are the same as get_notes.
+
+        :return: List of Notes
+        :rtype: list[Note]
+        """
+        return await self.__get_all(self.get_notes, **params)
+
+    async def get_group(self, id, details=None):
+        """
+        Get a single Group by id if available
+
+        :param id: id of the group
+        :type id: str
+
+        :return: Group matching the passed id
+        :rtype: Group
+        """
+        json_response = await self.__request('GET', self.groups_url, params=self.__clean_params({ 'id': id, 'details': details }))
+        return Group.from_json(json_response['groups'][0])
+
+    async def get_groups(self, id=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, sort=None, with_count=None, select=None):
+        """
+        Gets list of Group objects based on the filters provided. The parameters are the same as OpenReviewClient.get_groups.
+
+        :return: List of Groups, or the list and the count if with_count is True
+        :rtype: list[Group]
+        """
+        params = self.__clean_params({
+            'id': id,
+            'prefix': prefix,
+            'member': member,
+            'members': members,
+            'signatory': signatory,
+            'web': web,
+            'limit': limit,
+            'offset': offset,
+            'after': after,
+            'sort': sort,
+            'count': with_count,
+            'select': select or None
+        })
+        from_json = Record.get_class('GroupRecord', select).from_json if select else Group.from_json
+        json_response = await self.__request('GET', self.groups_url, params=params)
+        groups = [from_json(g) for g in json_response['groups']]
+        if with_count and offset is None:
+            return groups, json_response['count']
+        return groups
+
+    async def get_all_groups(self, **params):
+        """
+        Gets all the Groups that match the filters, the pages are requested concurrently. The parameters are the same as get_groups.
+
+        :return: List of Groups
+        :rtype: list[Group]
+        """
+        return await self.__get_all(self.get_groups, **params)
+
+    async def get_invitation(self, id):
+        """
+        Get a single invitation by id if available
+
+        :param id: id of the invitation
+        :type id: str
+
+        :return: Invitation matching the passed id
+        :rtype: Invitation
+        """
+        json_response = await self.__request('GET', self.invitations_url, params={ 'id': id })
+        return Invitation.from_json(json_response['invitations'][0])
+
+    async def get_invitations(self, id=None, ids=None, invitee=None, replytoNote=None, replyForum=None, signature=None, note=None, prefix=None, tags=None,
+            limit=None, offset=None, after=None, minduedate=None, duedate=None, pastdue=None, replyto=None, details=None, expired=None, sort=None, type=None,
+            with_count=None, invitation=None, trash=None, domain=None):
+        """
+        Gets list of Invitation objects based on the filters provided. The parameters are the same as OpenReviewClient.get_invitations.
+
+        :return: List of Invitations, or the list and the count if with_count is True
+        :rtype: list[Invitation]
+        """
+        params = self.__clean_params({
+            'id': id,
+            'ids': ','.join(ids) if ids else None,
+            'invitee': invitee,
+            'replytoNote': replytoNote,
+            'replyForum': replyForum,
+            'signature': signature,
+            'note': note,
+            'prefix': prefix,
+            'tags': tags,
+            'minduedate': minduedate,
+            'duedate': duedate,
+            'pastdue': pastdue,
+            'replyto': replyto,
+            'details': details,
+            'expired': expired,
+            'sort': sort,
+            'type': type,
+            'invitation': invitation,
+            'trash': True if trash == True else None,
+            'domain': domain,
+            'limit': limit,
+            'offset': offset,
+            'after': after,
+            'count': with_count
+        })
+        json_response = await self.__request('GET', self.invitations_url, params=params)
+        invitations = [Invitation.from_json(i) for i in json_response['invitations']]
+        if with_count and offset is None:
+            return invitations, json_response['count']
+        return invitations
+
+    async def get_all_invitations(self, **params):
+        """
+        Gets all the Invitations that match the filters, the pages are requested concurrently. The parameters are the same as get_invitations.
+
+        :return: List of Invitations
+        :rtype: list[Invitation]
+        """
+        return await self.__get_all(self.get_invitations, **params)
+
+    async def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None, select=None):
+        """
+        Returns a list of Edge objects based on the filters provided. The parameters are the same as OpenReviewClient.get_edges.
+
+        :return: List of Edges, or the list and the count if with_count is True
+        :rtype: list[Edge]
+        """
+        params = self.__clean_params({
+            'id': id,
+            'invitation': invitation,
+            'head': head,
+            'tail': tail,
+            'label': label,
+            'limit': limit,
+            'offset': offset,
+            'trash': True if trash == True else None,
+            'count': with_count,
+            'select': select or None
+        })
+        from_json = Record.get_class('EdgeRecord', select).from_json if select else Edge.from_json
+        json_response = await self.__request('GET', self.edges_url, params=params)
+        edges = [from_json(e) for e in json_response['edges']]
+        if with_count and offset is None:
+            return edges, json_response['count']
+        return edges
+
+    async def get_all_edges(self, **params):
+        """
+        Gets all the Edges that match the filters, the pages are requested concurrently. The parameters are the same as get_edges.
+
+        :return: List of Edges
+        :rtype: list[Edge]
+        """
+        return await self.__get_all(self.get_edges, **params)
+
+    async def get_edges_count(self, id = None, invitation = None, head = None, tail = None, label = None):
+        """
+        Returns the number of edges that match the filters
+        """
+        params = self.__clean_params({ 'id': id, 'invitation': invitation, 'head': head, 'tail': tail, 'label': label })
+        return (await self.__request('GET', self.edges_count_url, params=params))['count']
+
+    async def post_edge(self, edge):
+        """
+        Posts the edge. Upon success, returns the posted Edge object.
+        """
+        return Edge.from_json(await self.__request('POST', self.edges_url, json=edge.to_json()))
+
+    async def post_edges(self, edges):
+        """
+        Posts the list of Edges or an EdgeBatch. Returns a list Edge objects updated with their ids.
+        """
+        send_json = edges.to_json() if isinstance(edges, EdgeBatch) else [edge.to_json() for edge in edges]
+        return [Edge.from_json(edge) for edge in await self.__request('POST', self.bulk_edges_url, json=send_json)]
+
+    async def delete_edges(self, invitation, id=None, label=None, head=None, tail=None, wait_to_finish=False, soft_delete=False):
+        """
+        Deletes edges by a combination of invitation id and one or more of the optional filters. The parameters are the same as OpenReviewClient.delete_edges.
+
+        :return: a {status = 'ok'} in case of a successful deletion and an OpenReview exception otherwise
+        :rtype: dict
+        """
+        delete_query = { 'invitation': invitation }
+        if label:
+            delete_query['label'] = label
+        if head:
+            delete_query['head'] = head
+        if tail:
+            delete_query['tail'] = tail
+        if id:
+            delete_query['id'] = id
+        delete_query['waitToFinish'] = wait_to_finish
+        delete_query['softDelete'] = soft_delete
+        return await self.__request('DELETE', self.edges_url, json=delete_query)
+
+    async def get_tags(self, id = None, invitation = None, parent_invitations = None, forum = None, profile = None, signature = None, tag = None, limit = None, offset = None, with_count=None, mintmdate=None):
+        """
+        Gets a list of Tag objects based on the filters provided. The parameters are the same as OpenReviewClient.get_tags.
+
+        :return: List of Tags, or the list and the count if with_count is True
+        :rtype: list[Tag]
+        """
+        params = self.__clean_params({
+            'id': id,
+            'invitation': invitation,
+            'parentInvitations': parent_invitations,
+            'forum': forum,
+            'profile': profile,
+            'signature': signature,
+            'tag': tag,
+            'limit': limit,
+            'offset': offset,
+            'count': with_count,
+            'mintmdate': mintmdate
+        })
+        json_response = await self.__request('GET', self.tags_url, params=params)
+        tags = [Tag.from_json(t) for t in json_response['tags']]
+        if with_count and offset is None:
+            return tags, json_response['count']
+        return tags
+
+    async def get_all_tags(self, **params):
+        """
+        Gets all the Tags that match the filters, the pages are requested concurrently. The parameters are the same as get_tags.
+
+        :return: List of Tags
+        :rtype: list[Tag]
+        """
+        return await self.__get_all(self.get_tags, **params)
+
+    async def post_tag(self, tag):
+        """
+        Posts the tag.
+
+        :param tag: Tag to be posted
+        :type tag: Tag
+
+        :return Tag: The posted Tag
+        """
+        return Tag.from_json(await self.__request('POST', self.tags_url, json=tag.to_json()))
+
+    async def post_tags(self, tags):
+        """
+        Posts the list of Tags. Returns a list Tag objects updated with their ids.
+        """
+        return [Tag.from_json(tag) for tag in await self.__request('POST', self.bulk_tags_url, json=[tag.to_json() for tag in tags])]
+
+    async def post_note_edit(self, invitation, signatures, note=None, readers=None, writers=None, nonreaders=None, content=None, await_process=False):
+        """
+        Posts a note edit. The parameters are the same as OpenReviewClient.post_note_edit.
+        """
+        edit_json = {
+            'invitation': invitation,
+            'note': note.to_json() if note else {}
+        }
+        edit_json.update(self.__clean_params({ 'signatures': signatures, 'readers': readers, 'writers': writers, 'nonreaders': nonreaders, 'content': content }))
+        return await self.__post_edit(self.note_edits_url, edit_json, await_process)
+
+    async def post_group_edit(self, invitation, signatures=None, group=None, readers=None, writers=None, content=None, replacement=None, await_process=False):
+        """
+        Posts a group edit. The parameters are the same as OpenReviewClient.post_group_edit.
+        """
+        edit_json = { 'invitation': invitation }
+        if group is not None:
+            edit_json['group'] = group.to_json()
+        edit_json.update(self.__clean_params({ 'signatures': signatures, 'readers': readers, 'writers': writers, 'content': content, 'replacement': replacement }))
+        return await self.__post_edit(self.group_edits_url, edit_json, await_process)
+
+    async def post_invitation_edit(self, invitations, readers=None, writers=None, signatures=None, invitation=None, content=None, replacement=None, domain=None, await_process=False):
+        """
+        Posts an invitation edit. The parameters are the same as OpenReviewClient.post_invitation_edit.
+        """
+        edit_json = self.__clean_params({ 'invitations': invitations, 'readers': readers, 'writers': writers, 'signatures': signatures, 'content': content, 'replacement': replacement, 'domain': domain })
+        if invitation is not None:
+            edit_json['invitation'] = invitation.to_json()
+        return await self.__post_edit(self.invitation_edits_url, edit_json, await_process)
+
+    async def __post_edit(self, url, edit_json, await_process):
+        posted_edit = await self.__request('POST', url, json=edit_json)
+        if await_process:
+            ## a single edit is polled every 0.5 seconds
+            status = (await self.await_processes([posted_edit['id']], min_delay=0.5, max_delay=0.5))[posted_edit['id']]
+            if status.status == 'error':
+                raise OpenReviewException(status.log or 'No log available')
+            if status.status == 'timeout':
+                raise OpenReviewException('Process timed out')
+        return posted_edit
+
+    async def get_process_logs(self, id = None, invitation = None, status = None, min_sdate = None):
+        """
+        **Only for Super User**. Retrieves the logs of the process function executed by an Invitation
+
+        :param id: Edit id, or several comma separated edit ids
+        :type id: str, optional
+        :param invitation: Invitation id that executed the process function that produced the logs
+        :type invitation: str, optional
+
+        :return: Logs of the process
+        :rtype: list[dict]
+        """
+        params = self.__clean_params({ 'id': id, 'invitation': invitation, 'status': status, 'minsdate': min_sdate })
+        return (await self.__request('GET', self.process_logs_url, params=params))['logs']
+
+    async def await_processes(self, edit_ids, timeout=50, batch_size=50, min_delay=0.5, max_delay=5):
+        """
+        Waits for the process functions of several edits to finish, with the same polling as OpenReviewClient.await_processes: all the
+        pending edits are checked in the same poll, the delay between polls grows from min_delay to max_delay, and the edits that are
+        still pending after a last poll at the deadline get the 'timeout' status.
+
+        :param edit_ids: ids of the edits
+        :type edit_ids: list[str]
+        :param timeout: Maximum number of seconds to wait for all the processes
+        :type timeout: float, optional
+        :param batch_size: Maximum number of edit ids per request
+        :type batch_size: int, optional
+        :param min_delay: Seconds to wait before the second poll
+        :type min_delay: float, optional
+        :param max_delay: Maximum seconds to wait between polls
+        :type max_delay: float, optional
+
+        :return: Dictionary of edit id to ProcessStatus, in the same order as edit_ids
+        :rtype: dict
+        """
+        statuses = { edit_id: ProcessStatus(edit_id) for edit_id in edit_ids }
+        pending = list(statuses.keys())
+        deadline = time.monotonic() + timeout
+        delay = min_delay
+        first_poll = True
+
+        while pending:
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            logs_by_id = {}
+            for logs in await asyncio.gather(*[self.__get_process_logs(batch) for batch in batches]):
+                for log in logs:
+                    logs_by_id.setdefault(log.get('id'), log)
+            for edit_id in pending:
+                log = logs_by_id.get(edit_id)
+                if log is None:
+                    if first_poll:
+                        statuses[edit_id].status = 'none' ## no process function found
+                    continue
+                statuses[edit_id].status = log['status']
+                statuses[edit_id].log = log.get('log')
+            pending = [edit_id for edit_id in pending if not statuses[edit_id].done()]
+            first_poll = False
+
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for edit_id in pending:
+                    statuses[edit_id].status = 'timeout'
+                break
+            ## the last poll happens at the deadline
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+        return statuses
+
+    async def __get_process_logs(self, batch):
+        ## several edits are queried with comma separated ids, fall back to one request per edit if no log comes back
+        logs = []
+        if self.__batch_process_logs or len(batch) == 1:
+            try:
+                logs = await self.get_process_logs(id=','.join(batch))
+            except OpenReviewException:
+                if len(batch) == 1:
+                    raise
+        if len(batch) > 1 and not logs:
+            logs = [log for edit_logs in await asyncio.gather(*[self.get_process_logs(id=edit_id) for edit_id in batch]) for log in edit_logs]
+            self.__batch_process_logs = not logs
+        return logs
@@ -9,7 +9,6 @@ else:
 
 from .. import tools
 import requests
-from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import pprint
 import os
@@ -17,6 +16,9 @@ import re
 import time
 import jwt
 import json
+import array
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from ..openreview import Profile
 from ..openreview import OpenReviewException
 from .. import tools
@@ -54,8 +56,14 @@ class OpenReviewClient(object):
     :type token: str, optional
     :param expiresIn: Time in seconds before the token expires. If none is set the value will be set automatically to one hour. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param pool_maxsize: Maximum number of connections kept alive per host. If none is set, it is the number of requests that tools.concurrent_requests sends in parallel.
+    :type pool_maxsize: int, optional
+    :param pool_block: If True, the requests wait for a free connection when the pool is full instead of opening a connection that is closed after the response.
+    :type pool_block: bool, optional
+    :param keep_alive: If False, the connections are closed after every request.
+    :type keep_alive: bool, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, pool_maxsize=None, pool_block=False, keep_alive=True):
         self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_BASEURL', 'http://localhost:3001')
         if 'https://api.openreview.net' in self.baseurl or 'https://devapi.openreview.net' in self.baseurl:
             correct_baseurl = self.baseurl.replace('api', 'api2')
@@ -94,6 +102,7 @@ class OpenReviewClient(object):
         self.venues_url = self.baseurl + '/venues'
         self.note_edits_url = self.baseurl + '/notes/edits'
         self.invitation_edits_url = self.baseurl + '/invitations/edits'
+        self.bulk_invitation_edits_url = self.baseurl + '/invitations/edits/bulk'
         self.group_edits_url = self.baseurl + '/groups/edits'
         self.activatelink_url = self.baseurl + '/activatelink'
         self.domains_rename = self.baseurl + '/domains/rename'
@@ -103,6 +112,8 @@ class OpenReviewClient(object):
         
 
         self.limit = 1000
+        self.__batch_process_logs = True
+        self.__bulk_invitation_edits = True
         self.token = token.replace('Bearer ', '') if token else None
         self.profile = None
         self.headers = {
@@ -111,10 +122,10 @@ class OpenReviewClient(object):
         }
 
         retry_strategy = LogRetry(total=3, backoff_factor=1, status_forcelist=[ 500, 502, 503, 504 ], respect_retry_after_header=True)
-        self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount('https://', adapter)
-        self.session.mount('http://', adapter)
+        self.session = tools.InstrumentedSession()
+        self.adapter = tools.PooledHTTPAdapter(pool_maxsize=pool_maxsize, pool_block=pool_block, keep_alive=keep_alive, max_retries=retry_strategy)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
 
         if self.token:
             self.headers['Authorization'] = 'Bearer ' + self.token
@@ -161,26 +172,27 @@ class OpenReviewClient(object):
                     'name': 'Error',
                     'message': response.reason
                 }
-            raise OpenReviewException(error)
+            exception = OpenReviewException(error)
+            ## Used by tools.RequestScheduler to detect rate limited requests
+            exception.status = response.status_code
+            exception.retry_after = response.headers.get('Retry-After')
+            raise exception
         
     def __await_process(self, edit_id):
-    
-        process_logs = self.get_process_logs(id=edit_id)
-        if not process_logs:
-            return ## no process function found
-        
-        for i in range(100):
-
-            print('Check logs for process function', process_logs[0])
-            if process_logs[0]['status'] == 'ok':
-                return
-            elif process_logs[0]['status'] == 'error':
-                raise OpenReviewException(process_logs[0].get('log', 'No log available'))
 
-            time.sleep(0.5)
-            process_logs = self.get_process_logs(id=edit_id)
+        ## a single edit is polled every 0.5 seconds
+        status = self.await_processes([edit_id], min_delay=0.5, max_delay=0.5)[edit_id]
+        if status.status == 'error':
+            raise OpenReviewException(status.log or 'No log available')
+        if status.status == 'timeout':
+            raise OpenReviewException("Process timed out")
 
-        raise OpenReviewException("Process timed out")    
+    def __decode_stream(self, response, key, from_json=None):
+        try:
+            for item in tools.JSONArrayDecoder(response.iter_content(chunk_size=65536), key):
+                yield from_json(item) if from_json else item
+        finally:
+            response.close()
 
     def get_invitation_date_process_job(self, job_id):
         response = self.session.get(self.baseurl + '/jobs/queues/pyDateProcessQueueMQ/' + job_id.replace('/', '%2F'), params = {}, headers = self.headers)
@@ -193,6 +205,34 @@ class OpenReviewClient(object):
         return response.json()
     
     ## PUBLIC FUNCTIONS
+    def get_pool_stats(self):
+        """
+        Returns the usage of the connection pool: requests sent, connections opened and reused, reuse ratio, requests in flight,
+        the peak of requests in flight and the number of requests sent while the pool was full
+
+        :return: Dictionary with the stats of the connection pool
+        :rtype: dict
+        """
+        return self.adapter.get_stats()
+
+    def add_request_hook(self, hook):
+        """
+        Adds a function that is called with a tools.RequestRecord after every HTTP request, e.g. tools.RequestMetrics or tools.OTLPFileExporter
+
+        :param hook: function that receives the RequestRecord
+        :type hook: callable
+        """
+        self.session.request_hooks.append(hook)
+
+    def remove_request_hook(self, hook):
+        """
+        Removes a function added with add_request_hook
+
+        :param hook: function that receives the RequestRecord
+        :type hook: callable
+        """
+        self.session.request_hooks.remove(hook)
+
     def impersonate(self, group_id):
         response = self.session.post(self.baseurl + '/impersonate', json={ 'groupId': group_id }, headers=self.headers)
         response = self.__handle_response(response)
@@ -563,12 +603,20 @@ class OpenReviewClient(object):
             response = self.__handle_response(response)
             return [Profile.from_json(p) for p in response.json()['profiles']]
 
-        if emails:
-            full_response = []
-            for email_batch in batches(emails):
-                response = self.session.post(self.profiles_search_url, json = {'emails': email_batch}, headers = self.headers)
+        def search_batches(key, items):
+            ## The batches are searched concurrently and the profiles are returned in the order of the batches
+            def search_batch(batch):
+                response = self.session.post(self.profiles_search_url, json = {key: batch}, headers = self.headers)
                 response = self.__handle_response(response)
-                full_response.extend(response.json()['profiles'])
+                return response.json()['profiles']
+
+            items = list(items)
+            if len(items) <= 1000:
+                return search_batch(items)
+            return [p for profiles in tools.concurrent_requests(search_batch, list(batches(items)), desc='search_profiles') for p in profiles]
+
+        if emails:
+            full_response = search_batches('emails', emails)
 
             profiles_by_email = {}
             for p in full_response:
@@ -578,11 +626,7 @@ class OpenReviewClient(object):
             return profiles_by_email
 
         if confirmedEmails:
-            full_response = []
-            for email_batch in batches(confirmedEmails):
-                response = self.session.post(self.profiles_search_url, json = {'confirmedEmails': email_batch}, headers = self.headers)
-                response = self.__handle_response(response)
-                full_response.extend(response.json()['profiles'])
+            full_response = search_batches('confirmedEmails', confirmedEmails)
 
             profiles_by_email = {}
             for p in full_response:
@@ -592,11 +636,7 @@ class OpenReviewClient(object):
             return profiles_by_email
 
         if ids:
-            full_response = []
-            for id_batch in batches(ids):
-                response = self.session.post(self.profiles_search_url, json = {'ids': id_batch}, headers = self.headers)
-                response = self.__handle_response(response)
-                full_response.extend(response.json()['profiles'])
+            full_response = search_batches('ids', ids)
 
             return [Profile.from_json(p) for p in full_response]
 
@@ -897,7 +937,7 @@ class OpenReviewClient(object):
         return response.json()
 
 
-    def get_groups(self, id=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=None):
+    def get_groups(self, id=None, prefix=None, member=None, members=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=None, select=None):
         """
         Gets list of Group objects based on the filters provided. The Groups that will be returned match all the criteria passed in the parameters.
 
@@ -917,6 +957,8 @@ class OpenReviewClient(object):
         :type limit: int, optional
         :param offset: Indicates the position to start retrieving Groups. For example, if there are 10 Groups and you want to obtain the last 3, then the offset would need to be 7.
         :type offset: int, optional
+        :param select: Comma separated fields to return, e.g. 'id,members'. If provided, lightweight records with only those fields are returned instead of Groups
+        :type select: str, optional
 
         :return: List of Groups
         :rtype: list[Group]
@@ -946,17 +988,21 @@ class OpenReviewClient(object):
             params['stream'] = stream
         if with_count is not None:
             params['count'] = with_count
+        if select:
+            params['select'] = select
+
+        from_json = Record.get_class('GroupRecord', select).from_json if select else Group.from_json
 
         response = self.session.get(self.groups_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
-        groups = [Group.from_json(g) for g in response.json()['groups']]
+        groups = [from_json(g) for g in response.json()['groups']]
 
         if with_count and params.get('offset') is None:
             return groups, response.json()['count']
 
         return groups
 
-    def get_all_groups(self, id=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None, with_count=None):
+    def get_all_groups(self, id=None, parent=None, prefix=None, member=None, members=None, domain=None, signatory=None, web=None, sort=None, with_count=None, select=None):
         """
         Gets list of Group objects based on the filters provided. The Groups that will be returned match all the criteria passed in the parameters.
 
@@ -980,6 +1026,8 @@ class OpenReviewClient(object):
         :type offset: int, optional
         :param after: Group id to start getting the list of groups from.
         :type after: str, optional
+        :param select: Comma separated fields to return, e.g. 'id,members'. If provided, lightweight records with only those fields are returned instead of Groups
+        :type select: str, optional
 
         :return: List of Groups
         :rtype: list[Group]
@@ -1007,6 +1055,8 @@ class OpenReviewClient(object):
             params['sort'] = sort
         if with_count is not None:
             params['with_count'] = with_count
+        if select:
+            params['select'] = select
 
         return self.get_groups(**params)
 
@@ -1240,7 +1290,7 @@ class OpenReviewClient(object):
         if trash is not None:
             params['trash'] = trash
 
-        return list(tools.efficient_iterget(self.get_invitations, desc='Getting V2 Invitations', **params))
+        return list(tools.prefetch_iterget(self.get_invitations, desc='Getting V2 Invitations', **params))
 
     def get_invitation_edit(self, id):
         """
@@ -1306,7 +1356,9 @@ class OpenReviewClient(object):
             details = None,
             sort = None,
             with_count=None,
-            stream=None
+            stream=None,
+            decode_stream=None,
+            select=None
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1354,6 +1406,10 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param decode_stream: If True and with_count is not set, returns a generator that decodes the Notes while the response is downloaded instead of loading the whole response in memory.
+        :type decode_stream: bool, optional
+        :param select: Comma separated fields to return, e.g. 'id,number,content.title'. If provided, lightweight records with only those fields are returned instead of Notes.
+        :type select: str, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1406,14 +1462,24 @@ class OpenReviewClient(object):
             params['count'] = with_count
         if stream is not None:
             params['stream'] = stream
+        if select:
+            params['select'] = select
+
+        from_json = Record.get_class('NoteRecord', select).from_json if select else Note.from_json
+
+        if decode_stream and not with_count:
+            response = self.session.get(self.notes_url, params=tools.format_params(params), headers = self.headers, stream=True)
+            response = self.__handle_response(response)
+            return self.__decode_stream(response, 'notes', from_json)
 
         response = self.session.get(self.notes_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
+        json_response = response.json()
 
-        notes = [Note.from_json(n) for n in response.json()['notes']]
+        notes = [from_json(n) for n in json_response['notes']]
 
         if with_count and params.get('offset') is None:
-            return notes, response.json()['count']
+            return notes, json_response['count']
 
         return notes
 
@@ -1433,7 +1499,8 @@ class OpenReviewClient(object):
             details = None,
             select = None,
             sort = None,
-            with_count=None
+            with_count=None,
+            decode_stream=None
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1474,6 +1541,11 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param decode_stream: If True, the Notes are decoded while the responses are downloaded, so the raw response and its parsed JSON are
+            never in memory at the same time. All the Notes are still returned in a list, iterate :meth:`get_notes` with decode_stream to keep only one Note in memory.
+        :type decode_stream: bool, optional
+        :param select: Comma separated fields to return, e.g. 'id,number,content.title'. If provided, lightweight records with only those fields are returned instead of Notes.
+        :type select: str, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1514,6 +1586,8 @@ class OpenReviewClient(object):
             params['sort'] = sort
         if with_count is not None:
             params['with_count'] = with_count
+        if decode_stream:
+            params['decode_stream'] = decode_stream
 
         if 'details' not in params:
             params['stream'] = True
@@ -1533,17 +1607,19 @@ class OpenReviewClient(object):
                     field, direction = sort.split(':', 1)
                 else:
                     field, direction = sort, 'desc'
-                if field in valid_fields:
+                if field in valid_fields and (not select or field in Record.parse_select(select)):
                     sort_key = valid_fields[field]
                     reverse = direction == 'desc'
                     params['sort'] = None  # Remove for API call, sort locally            
             
             results = self.get_notes(**params)
+            if decode_stream and not with_count:
+                results = list(results)
             if sort_key:
                 return sorted(results, key=sort_key, reverse=reverse)
             return results
         
-        return list(tools.efficient_iterget(self.get_notes, desc='Getting V2 Notes', **params))
+        return list(tools.prefetch_iterget(self.get_notes, desc='Getting V2 Notes', **params))
 
     def get_note_edit(self, id, trash=None):
         """
@@ -1720,9 +1796,10 @@ class OpenReviewClient(object):
         response = self.session.get(self.tags_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
 
-        tags = [Tag.from_json(t) for t in response.json()['tags']]
+        json_response = response.json()
+        tags = [Tag.from_json(t) for t in json_response['tags']]
         if with_count and params.get('offset') is None:
-            return tags, response.json()['count']
+            return tags, json_response['count']
 
         return tags
 
@@ -1755,7 +1832,7 @@ class OpenReviewClient(object):
 
         return tools.concurrent_get(self, self.get_tags, **params)
 
-    def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None):
+    def get_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None, decode_stream=None, select=None):
         """
         Returns a list of Edge objects based on the filters provided.
 
@@ -1764,6 +1841,8 @@ class OpenReviewClient(object):
         :arg head: Profile ID of the Profile that is connected to the Note ID in tail
         :arg tail: Note ID of the Note that is connected to the Profile ID in head
         :arg label: Label ID of the match
+        :arg decode_stream: If True and with_count is not set, returns a generator that decodes the Edges while the response is downloaded
+        :arg select: Comma separated fields to return, e.g. 'head,tail,weight'. If provided, lightweight records with only those fields are returned instead of Edges
         """
         params = {}
 
@@ -1777,18 +1856,28 @@ class OpenReviewClient(object):
         params['trash'] = trash
         if with_count is not None:
             params['count'] = with_count
+        if select:
+            params['select'] = select
+
+        from_json = Record.get_class('EdgeRecord', select).from_json if select else Edge.from_json
+
+        if decode_stream and not with_count:
+            response = self.session.get(self.edges_url, params=tools.format_params(params), headers = self.headers, stream=True)
+            response = self.__handle_response(response)
+            return self.__decode_stream(response, 'edges', from_json)
 
         response = self.session.get(self.edges_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
+        json_response = response.json()
 
-        edges = [Edge.from_json(e) for e in response.json()['edges']]
+        edges = [from_json(e) for e in json_response['edges']]
 
         if with_count and params.get('offset') is None:
-            return edges, response.json()['count']
+            return edges, json_response['count']
 
         return edges
 
-    def get_all_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None):
+    def get_all_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=None, trash=None, decode_stream=None, select=None):
         """
         Returns a list of Edge objects based on the filters provided.
 
@@ -1797,6 +1886,9 @@ class OpenReviewClient(object):
         :arg head: Profile ID of the Profile that is connected to the Note ID in tail
         :arg tail: Note ID of the Note that is connected to the Profile ID in head
         :arg label: Label ID of the match
+        :arg decode_stream: If True, the Edges are decoded while the responses are downloaded, so the raw response and its parsed JSON are never
+            in memory at the same time. All the Edges are still returned in a list, iterate :meth:`get_edges` with decode_stream to keep only one Edge in memory
+        :arg select: Comma separated fields to return, e.g. 'head,tail,weight'. If provided, lightweight records with only those fields are returned instead of Edges
         """
         params = {
             'id': id,
@@ -1809,6 +1901,10 @@ class OpenReviewClient(object):
             'with_count': with_count,
             'trash': trash
         }
+        if decode_stream:
+            params['decode_stream'] = decode_stream
+        if select:
+            params['select'] = select
 
         return tools.concurrent_get(self, self.get_edges, **params)
 
@@ -1835,7 +1931,7 @@ class OpenReviewClient(object):
 
         return response.json()['count']
 
-    def get_grouped_edges(self, invitation=None, head=None, tail=None, label=None, groupby='head', select=None, limit=None, offset=None, trash=None):
+    def get_grouped_edges(self, invitation=None, head=None, tail=None, label=None, groupby='head', select=None, limit=None, offset=None, trash=None, decode_stream=None):
         '''
         Returns a list of JSON objects where each one represents a group of edges.  For example calling this
         method with default arguments will give back a list of groups where each group is of the form:
@@ -1847,6 +1943,7 @@ class OpenReviewClient(object):
         :param select:
         :param limit:
         :param offset:
+        :param decode_stream: If True, returns a generator that decodes the groups while the response is downloaded
         :return:
         '''
         params = {}
@@ -1860,6 +1957,12 @@ class OpenReviewClient(object):
         params['limit'] = limit
         params['offset'] = offset
         params['trash'] = trash
+
+        if decode_stream:
+            response = self.session.get(self.edges_url, params=tools.format_params(params), headers = self.headers, stream=True)
+            response = self.__handle_response(response)
+            return self.__decode_stream(response, 'groupedEdges')
+
         response = self.session.get(self.edges_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
         json = response.json()
@@ -1893,9 +1996,9 @@ class OpenReviewClient(object):
 
     def post_edges (self, edges):
         '''
-        Posts the list of Edges.   Returns a list Edge objects updated with their ids.
+        Posts the list of Edges or an EdgeBatch.   Returns a list Edge objects updated with their ids.
         '''
-        send_json = [edge.to_json() for edge in edges]
+        send_json = edges.to_json() if isinstance(edges, EdgeBatch) else [edge.to_json() for edge in edges]
         response = self.session.post(self.bulk_edges_url, json = send_json, headers = self.headers)
         response = self.__handle_response(response)
         received_json_array = response.json()
@@ -2276,6 +2379,71 @@ class OpenReviewClient(object):
         if member_type == list:
             return remove_member(group, members)
 
+    def update_groups_members(self, changes, groups=None, read_back=False):
+        """
+        Adds and removes members of many groups with one edit per group. The edits are sent concurrently and a group that fails does not stop
+        the others, the result of each group is returned instead.
+
+        Each group is read once to get its domain and signatures, unless it is passed in `groups` and no members are removed from it. The groups
+        with members to remove are always read again, so the members are mapped to the current anonymous ids. The members to remove are applied
+        before the members to add, so a member in both lists ends up in the group.
+
+        Example:
+
+        >>> client.update_groups_members({ 'Venue/Submission1/Reviewers': { 'add': ['~Reviewer_One1'], 'remove': ['~Reviewer_Two1'] } })
+
+        :param changes: Dictionary of group ids to a dictionary with the members to 'add' and/or 'remove'
+        :type changes: dict
+        :param groups: Dictionary of group ids to Groups that were already retrieved, used for the groups that only have members to add
+        :type groups: dict, optional
+        :param read_back: If True, each group is retrieved again after the edits and returned in the result
+        :type read_back: bool, optional
+
+        :return: Dictionary of group ids to a dictionary with 'success', 'group' (only if read_back is True) and 'error'
+        :rtype: dict
+        """
+        groups = groups or {}
+
+        def update_members(group_id):
+            members_to_add = list(dict.fromkeys(changes[group_id].get('add') or []))
+            members_to_remove = [member for member in dict.fromkeys(changes[group_id].get('remove') or []) if member not in members_to_add]
+            try:
+                group = groups.get(group_id)
+                ## the anonymous ids of the members to remove are taken from the current group, never from a passed copy
+                if group is None or not group.domain or not group.signatures or members_to_remove:
+                    group = self.get_group(group_id)
+                if members_to_remove:
+                    self.post_group_edit(invitation = f'{group.domain}/-/Edit',
+                        signatures = group.signatures,
+                        group = Group(
+                            id = group.id,
+                            members = {
+                                'remove': group.transform_to_anon_ids(members_to_remove)
+                            }
+                        ),
+                        readers=group.signatures,
+                        writers=group.signatures
+                    )
+                if members_to_add:
+                    self.post_group_edit(invitation = f'{group.domain}/-/Edit',
+                        signatures = group.signatures,
+                        group = Group(
+                            id = group.id,
+                            members = {
+                                'add': members_to_add
+                            }
+                        ),
+                        readers=group.signatures,
+                        writers=group.signatures
+                    )
+                return { 'success': True, 'group': self.get_group(group.id) if read_back else None, 'error': None }
+            except Exception as error:
+                return { 'success': False, 'group': None, 'error': error }
+
+        group_ids = [group_id for group_id in changes if changes[group_id].get('add') or changes[group_id].get('remove')]
+        results = tools.concurrent_requests(update_members, group_ids, desc='update_groups_members')
+        return dict(zip(group_ids, results))
+
     def search_notes(self, term, content = 'all', group = 'all', source='all', limit = None, offset = None):
         """
         Searches notes based on term, content, group and source as the criteria. Unlike :meth:`~openreview.Client.get_notes`, this method uses Elasticsearch to retrieve the Notes
@@ -2368,6 +2536,103 @@ class OpenReviewClient(object):
         response = self.__handle_response(response)
         return response.json()['logs']
 
+    def await_processes(self, edit_ids, timeout=50, batch_size=50, min_delay=0.5, max_delay=5):
+        """
+        Waits for the process functions of several edits to finish. All the pending edits are checked in the same poll, sending up
+        to batch_size edit ids in each request to the process logs, and the delay between polls grows exponentially from min_delay to max_delay.
+        The edits that are still pending after a last poll at the deadline get the 'timeout' status.
+
+        Edits posted with await_process=False can be collected and awaited together, e.g.
+
+        ``edit_ids = [client.post_note_edit(...)['id'] for note in notes]``
+        ``statuses = client.await_processes(edit_ids)``
+
+        :param edit_ids: ids of the edits
+        :type edit_ids: list[str]
+        :param timeout: Maximum number of seconds to wait for all the processes
+        :type timeout: float, optional
+        :param batch_size: Maximum number of edit ids per request
+        :type batch_size: int, optional
+        :param min_delay: Seconds to wait before the second poll
+        :type min_delay: float, optional
+        :param max_delay: Maximum seconds to wait between polls
+        :type max_delay: float, optional
+
+        :return: Dictionary of edit id to ProcessStatus, in the same order as edit_ids
+        :rtype: dict
+        """
+        statuses = { edit_id: ProcessStatus(edit_id) for edit_id in edit_ids }
+        pending = list(statuses.keys())
+        deadline = time.monotonic() + timeout
+        delay = min_delay
+        first_poll = True
+
+        while pending:
+            logs_by_id = self.__get_process_logs_by_id(pending, batch_size)
+            for edit_id in pending:
+                log = logs_by_id.get(edit_id)
+                if log is None:
+                    if first_poll:
+                        statuses[edit_id].status = 'none' ## no process function found
+                    continue
+                statuses[edit_id].status = log['status']
+                statuses[edit_id].log = log.get('log')
+            pending = [edit_id for edit_id in pending if not statuses[edit_id].done()]
+            first_poll = False
+
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                for edit_id in pending:
+                    statuses[edit_id].status = 'timeout'
+                break
+            print(f'Waiting for {len(pending)} process functions')
+            ## the last poll happens at the deadline
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+        return statuses
+
+    def watch_processes(self, edit_ids, **kwargs):
+        """
+        Same as await_processes but does not block the calling thread. The returned future can be awaited with asyncio.wrap_future.
+
+        :param edit_ids: ids of the edits
+        :type edit_ids: list[str]
+
+        :return: Future with the dictionary of edit id to ProcessStatus
+        :rtype: concurrent.futures.Future
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.await_processes, list(edit_ids), **kwargs)
+        executor.shutdown(wait=False)
+        return future
+
+    def __get_process_logs_by_id(self, edit_ids, batch_size):
+
+        def get_logs(batch):
+            ## several edits are queried with comma separated ids, fall back to one request per edit if no log comes back
+            logs = []
+            if self.__batch_process_logs or len(batch) == 1:
+                try:
+                    logs = self.get_process_logs(id=','.join(batch))
+                except OpenReviewException:
+                    if len(batch) == 1:
+                        raise
+            if len(batch) > 1 and not logs:
+                logs = [log for edit_id in batch for log in self.get_process_logs(id=edit_id)]
+                self.__batch_process_logs = not logs
+            return logs
+
+        batches = [edit_ids[i:i + batch_size] for i in range(0, len(edit_ids), batch_size)]
+        logs_by_id = {}
+        for logs in tools.concurrent_requests(get_logs, batches, desc='get_process_logs') if len(batches) > 1 else [get_logs(batches[0])]:
+            for log in logs:
+                ## logs are sorted by most recent first
+                logs_by_id.setdefault(log.get('id'), log)
+        return logs_by_id
+
     def post_institution(self, institution):
         """
         Requires Super User permission.
@@ -2384,9 +2649,7 @@ class OpenReviewClient(object):
         response = self.__handle_response(response)
         return response.json()
 
-    def post_invitation_edit(self, invitations, readers=None, writers=None, signatures=None, invitation=None, content=None, replacement=None, domain=None, await_process=False):
-        """
-        """
+    def __get_invitation_edit_json(self, invitations=None, readers=None, writers=None, signatures=None, invitation=None, content=None, replacement=None, domain=None):
         edit_json = {}
         
         if invitations is not None:
@@ -2413,6 +2676,13 @@ class OpenReviewClient(object):
         if domain is not None:
             edit_json['domain'] = domain
 
+        return edit_json
+
+    def post_invitation_edit(self, invitations, readers=None, writers=None, signatures=None, invitation=None, content=None, replacement=None, domain=None, await_process=False):
+        """
+        """
+        edit_json = self.__get_invitation_edit_json(invitations, readers, writers, signatures, invitation, content, replacement, domain)
+
         response = self.session.post(self.invitation_edits_url, json = edit_json, headers = self.headers)
         response = self.__handle_response(response)
 
@@ -2421,6 +2691,63 @@ class OpenReviewClient(object):
 
         return response.json()
 
+    def post_invitation_edits(self, edits, batch_size=100, await_process=False):
+        """
+        Posts many invitation edits, batch_size edits per request to the bulk endpoint. If the server does not support bulk invitation
+        edits, the edits are posted one by one with concurrent requests.
+
+        Example:
+
+        >>> client.post_invitation_edits([{ 'invitations': 'Venue/-/Official_Review', 'content': { 'noteId': { 'value': note.id }, 'noteNumber': { 'value': note.number } }, 'invitation': Invitation() } for note in notes])
+
+        :param edits: parameters of :meth:`post_invitation_edit` for each edit
+        :type edits: list[dict]
+        :param batch_size: number of edits sent per request
+        :type batch_size: int, optional
+        :param await_process: If True, waits for the process functions of all the edits
+        :type await_process: bool, optional
+
+        :return: The posted edits in the same order
+        :rtype: list[dict]
+        """
+        edits_json = [self.__get_invitation_edit_json(**edit) for edit in edits]
+
+        def post_single(edit_json):
+            response = self.session.post(self.invitation_edits_url, json = edit_json, headers = self.headers)
+            return self.__handle_response(response).json()
+
+        def post_batch(batch):
+            if self.__bulk_invitation_edits:
+                try:
+                    response = self.session.post(self.bulk_invitation_edits_url, json = batch, headers = self.headers)
+                    return self.__handle_response(response).json()
+                except OpenReviewException as error:
+                    ## servers without the bulk endpoint answer 404 or 405
+                    if getattr(error, 'status', None) not in (404, 405):
+                        raise
+                    self.__bulk_invitation_edits = False
+            return [post_single(edit_json) for edit_json in batch] if len(batch) == 1 else tools.concurrent_requests(post_single, batch, desc='post_invitation_edits')
+
+        batches = [edits_json[i:i + batch_size] for i in range(0, len(edits_json), batch_size)]
+        if not batches:
+            return []
+        ## the first batch finds out if the server supports bulk edits before sending the others
+        posted_edits = post_batch(batches[0])
+        if len(batches) > 1:
+            if self.__bulk_invitation_edits:
+                posted_edits += [edit for posted in tools.concurrent_requests(post_batch, batches[1:], desc='post_invitation_edits') for edit in posted]
+            else:
+                posted_edits += tools.concurrent_requests(post_single, [edit_json for batch in batches[1:] for edit_json in batch], desc='post_invitation_edits')
+
+        if await_process:
+            for status in self.await_processes([edit['id'] for edit in posted_edits]).values():
+                if status.status == 'error':
+                    raise OpenReviewException(status.log or 'No log available')
+                if status.status == 'timeout':
+                    raise OpenReviewException('Process timed out')
+
+        return posted_edits
+
     def post_note_edit(self, invitation, signatures, note=None, readers=None, writers=None, nonreaders=None, content=None, await_process=False):
         """
         """
@@ -3232,6 +3559,93 @@ class Invitation(object):
             invitation.message = i['message']
             invitation.type = 'Message'
         return invitation
+
+
+class ProcessStatus(object):
+    """
+    Status of the process function of an edit, returned by OpenReviewClient.await_processes
+
+    :param edit_id: id of the edit
+    :type edit_id: str
+    :param status: 'ok', 'error', 'timeout', 'none' if the edit has no process function, or the status of the log while it is running
+    :type status: str, optional
+    :param log: Log of the process function
+    :type log: list, optional
+    """
+    __slots__ = ('edit_id', 'status', 'log')
+
+    def __init__(self, edit_id, status=None, log=None):
+        self.edit_id = edit_id
+        self.status = status
+        self.log = log
+
+    def done(self):
+        return self.status in ('ok', 'error', 'timeout', 'none')
+
+    def succeeded(self):
+        return self.status in ('ok', 'none')
+
+    def __repr__(self):
+        return f'ProcessStatus(edit_id={self.edit_id!r}, status={self.status!r})'
+
+
+class Record(object):
+    """
+    Lightweight projection of a Note, Edge or Group with only the fields passed in `select`, e.g. `select='id,number,content.title'`.
+    The records are returned instead of the full objects when `select` is passed to get_notes, get_edges, get_groups and their get_all
+    versions. The record classes use __slots__ and are created once for each entity and select value.
+
+    The fields missing in the response are None, and the nested fields like content only keep the selected keys.
+    """
+    __slots__ = ()
+    selected_fields = {}
+    __classes = {}
+
+    @staticmethod
+    def parse_select(select):
+        """
+        Returns a dictionary of the top level fields to the set of selected keys, or None if the whole field is selected
+        """
+        fields = {}
+        for path in select.split(','):
+            path = path.strip()
+            if not path:
+                continue
+            name, _, subfield = path.partition('.')
+            if not subfield:
+                fields[name] = None
+            elif fields.get(name, set()) is not None:
+                fields.setdefault(name, set()).add(subfield.split('.')[0])
+        return fields
+
+    @staticmethod
+    def get_class(name, select):
+        """
+        Returns the record class of the entity name, e.g. 'NoteRecord', for the select value
+        """
+        record_class = Record.__classes.get((name, select))
+        if record_class is None:
+            fields = Record.parse_select(select)
+            record_class = type(name, (Record,), { '__slots__': tuple(fields), 'selected_fields': fields })
+            Record.__classes[(name, select)] = record_class
+        return record_class
+
+    @classmethod
+    def from_json(cls, record_json):
+        record = cls.__new__(cls)
+        for name, keys in cls.selected_fields.items():
+            value = record_json.get(name)
+            if keys and isinstance(value, dict):
+                value = { key: value[key] for key in keys if key in value }
+            setattr(record, name, value)
+        return record
+
+    def to_json(self):
+        return { name: getattr(self, name) for name in self.selected_fields }
+
+    def __repr__(self):
+        return self.__class__.__name__ + '(' + ', '.join(f'{name}={getattr(self, name)!r}' for name in self.selected_fields) + ')'
+
 class Edge(object):
     def __init__(self, head, tail, invitation, domain=None, readers=None, writers=None, signatures=None, id=None, weight=None, label=None, cdate=None, ddate=None, nonreaders=None, tcdate=None, tmdate=None, tddate=None, tauthor=None):
         self.id = id
@@ -3318,6 +3732,159 @@ class Edge(object):
         pp = pprint.PrettyPrinter()
         return pp.pformat(vars(self))
 
+class EdgeBatch(object):
+    """
+    Compact collection of Edges that share the same invitation, label and permissions, like the affinity score or conflict Edges of a
+    committee. Instead of one Edge object per row, the heads and tails are stored as indexes to tables of unique ids and the weights in a
+    float32 array. The permissions are templates shared by all the Edges where the values EdgeBatch.HEAD and EdgeBatch.TAIL are replaced by
+    the head and tail of each Edge.
+
+    The batch can be posted with :meth:`OpenReviewClient.post_edges` or :func:`tools.post_bulk_edges`.
+
+    Example:
+
+    >>> batch = EdgeBatch(invitation='Venue/Reviewers/-/Affinity_Score', readers=['Venue', EdgeBatch.TAIL], writers=['Venue'], signatures=['Venue'])
+    >>> batch.add('paper_id', '~Reviewer_One1', 0.5)
+
+    :param invitation: Invitation id of the Edges
+    :type invitation: str
+    :param readers: readers template of the Edges
+    :type readers: list[str], optional
+    :param writers: writers template of the Edges
+    :type writers: list[str], optional
+    :param signatures: signatures template of the Edges
+    :type signatures: list[str], optional
+    :param nonreaders: nonreaders template of the Edges
+    :type nonreaders: list[str], optional
+    :param label: label of the Edges
+    :type label: str, optional
+    """
+    HEAD = '${head}'
+    TAIL = '${tail}'
+
+    def __init__(self, invitation, readers=None, writers=None, signatures=None, nonreaders=None, label=None):
+        self.invitation = invitation
+        self.readers = readers
+        self.writers = writers
+        self.signatures = signatures
+        self.nonreaders = nonreaders
+        self.label = label
+        self.ids = []
+        self.id_index = {}
+        self.heads = array.array('I')
+        self.tails = array.array('I')
+        self.weights = array.array('f')
+
+    def __len__(self):
+        return len(self.heads)
+
+    @classmethod
+    def from_arrays(cls, invitation, ids, heads, tails, weights, readers=None, writers=None, signatures=None, nonreaders=None, label=None):
+        """
+        Creates a batch from columns that are already interned, e.g. the columns of :class:`tools.BinaryScores`. The ids table is shared, not copied.
+
+        :param ids: table of the head and tail ids
+        :type ids: list[str]
+        :param heads: index in the ids table of the head of each Edge
+        :type heads: numpy.ndarray
+        :param tails: index in the ids table of the tail of each Edge
+        :type tails: numpy.ndarray
+        :param weights: weight of each Edge
+        :type weights: numpy.ndarray
+
+        :return: The batch of Edges
+        :rtype: EdgeBatch
+        """
+        batch = cls(invitation, readers, writers, signatures, nonreaders, label)
+        batch.ids = ids
+        batch.id_index = None
+        batch.heads.frombytes(np.ascontiguousarray(heads, dtype=np.uint32).tobytes())
+        batch.tails.frombytes(np.ascontiguousarray(tails, dtype=np.uint32).tobytes())
+        batch.weights.frombytes(np.ascontiguousarray(weights, dtype=np.float32).tobytes())
+        return batch
+
+    def __intern(self, value):
+        if self.id_index is None:
+            self.id_index = { value: index for index, value in enumerate(self.ids) }
+        index = self.id_index.get(value)
+        if index is None:
+            index = len(self.ids)
+            self.id_index[value] = index
+            self.ids.append(value)
+        return index
+
+    def add(self, head, tail, weight):
+        """
+        Adds an Edge to the batch
+
+        :param head: head of the Edge
+        :type head: str
+        :param tail: tail of the Edge
+        :type tail: str
+        :param weight: weight of the Edge, stored as a float32
+        :type weight: float
+        """
+        self.heads.append(self.__intern(head))
+        self.tails.append(self.__intern(tail))
+        self.weights.append(weight)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            batch = EdgeBatch(self.invitation, self.readers, self.writers, self.signatures, self.nonreaders, self.label)
+            batch.ids = self.ids
+            batch.id_index = self.id_index
+            batch.heads = self.heads[key]
+            batch.tails = self.tails[key]
+            batch.weights = self.weights[key]
+            return batch
+        head = self.ids[self.heads[key]]
+        tail = self.ids[self.tails[key]]
+        return Edge(
+            invitation=self.invitation,
+            head=head,
+            tail=tail,
+            weight=float(str(np.float32(self.weights[key]))),
+            label=self.label,
+            readers=EdgeBatch.__fill(self.readers, head, tail),
+            nonreaders=EdgeBatch.__fill(self.nonreaders, head, tail),
+            writers=EdgeBatch.__fill(self.writers, head, tail),
+            signatures=EdgeBatch.__fill(self.signatures, head, tail)
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @staticmethod
+    def __fill(template, head, tail):
+        if template is None:
+            return None
+        return [head if value == EdgeBatch.HEAD else tail if value == EdgeBatch.TAIL else value for value in template]
+
+    def to_json(self):
+        '''
+        Returns the list of serialized Edges expected by the bulk edges endpoint, the same list that would be obtained calling to_json on each Edge
+        '''
+        ## shortest representation of the float32 weights, e.g. 0.1234 instead of 0.12340000271797180
+        weights = [float(weight) for weight in np.frombuffer(self.weights, dtype=np.float32).astype(str)]
+        templates = [(name, template, EdgeBatch.HEAD in template or EdgeBatch.TAIL in template) for name, template in [('readers', self.readers), ('writers', self.writers), ('nonreaders', self.nonreaders), ('signatures', self.signatures)] if template is not None]
+        body = []
+        for head_index, tail_index, weight in zip(self.heads, self.tails, weights):
+            head = self.ids[head_index]
+            tail = self.ids[tail_index]
+            edge = {
+                'invitation': self.invitation,
+                'head': head,
+                'tail': tail
+            }
+            for name, template, with_placeholders in templates:
+                edge[name] = EdgeBatch.__fill(template, head, tail) if with_placeholders else template
+            edge['weight'] = weight
+            if self.label is not None:
+                edge['label'] = self.label
+            body.append(edge)
+        return body
+
 class Group(object):
     """
     When a user is created, it is automatically assigned to certain groups that give him different privileges. A username is also a group, therefore, groups can be members of other groups.
@@ -88,13 +88,20 @@ def process(client, invitation):
     author_names = invitation.content.get('authors', {}).get('value', [])
     author_forms = [a for a in author_forms if name_to_id[a.signatures[0]] in author_names]
 
+    # Add the authors to the reviewers group with a single edit
+    authors_to_add = []
     for author_form in author_forms:
         author_id = name_to_id[author_form.signatures[0]]
-        print(f"Processing author {author_id}...")
-        # Add author to reviewers group
-        if author_id not in reviewers_group.members:
+        if author_id not in reviewers_group.members and author_id not in authors_to_add:
             print(f"Adding author {author_id} to reviewers group")
-            client.add_members_to_group(reviewers_group, author_id)
+            authors_to_add.append(author_id)
+    result = client.update_groups_members({ reviewers_group.id: { 'add': authors_to_add } }, groups={ reviewers_group.id: reviewers_group }).get(reviewers_group.id)
+    if result and not result['success']:
+        raise result['error']
+
+    for author_form in author_forms:
+        author_id = name_to_id[author_form.signatures[0]]
+        print(f"Processing author {author_id}...")
 
         # Copy to registration
         if author_id not in submitted_reviewer_ids and \
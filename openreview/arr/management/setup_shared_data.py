@@ -26,6 +26,11 @@ def process(client, invitation):
                 return note
         return None
 
+    def _check_members_changes(results):
+        failed = { group_id: str(result['error']) for group_id, result in results.items() if not result['success'] }
+        if failed:
+            raise openreview.OpenReviewException(f'Failed to update the members of {len(failed)} groups: {failed}')
+
     def _is_not_available(month: str, year, current_date: datetime.datetime, posted_date: datetime.datetime) -> bool:
         """
         Check if a user is available based on their next available month and year
@@ -109,12 +114,16 @@ def process(client, invitation):
         ]
     ]
 
+    destination_groups = {}
+    members_changes = {}
     for group in groups:
         role = group.id.split('/')[-1]
         destination_group = client.get_group(f"{next_cycle_id}/{role}")
         missing_members = set(group.members).difference(set(destination_group.members))
         if len(missing_members) > 0:
-            client.add_members_to_group(destination_group, list(missing_members))
+            destination_groups[destination_group.id] = destination_group
+            members_changes[destination_group.id] = { 'add': list(missing_members) }
+    _check_members_changes(client.update_groups_members(members_changes, groups=destination_groups))
 
     all_profile_ids = client.get_group(domain.content['reviewers_id']['value']).members
     all_profile_ids.extend(client.get_group(domain.content['area_chairs_id']['value']).members)
@@ -136,12 +145,11 @@ def process(client, invitation):
     ae_reviewers = set(aes.members).intersection(set(reviewers.members))
     sae_aes = set(saes.members).intersection(set(aes.members))
 
-    if len(sae_reviewers) > 0:
-        client.remove_members_from_group(reviewers, list(sae_reviewers))
-    if len(ae_reviewers) > 0:
-        client.remove_members_from_group(reviewers, list(ae_reviewers))
-    if len(sae_aes) > 0:
-        client.remove_members_from_group(aes, list(sae_aes))
+    members_changes = {
+        reviewers.id: { 'remove': list(sae_reviewers.union(ae_reviewers)) },
+        aes.id: { 'remove': list(sae_aes) }
+    }
+    _check_members_changes(client.update_groups_members(members_changes, groups={ reviewers.id: reviewers, aes.id: aes }))
 
     # Notes (Registraton Notes)
     roles = [
@@ -14,6 +14,7 @@ class Assignment(object):
         self.client = journal.client
         self.journal = journal
         self.show_conflict_details = journal.should_show_conflict_details()
+        self.profile_cache = journal.profile_cache
 
     def post_submission_edges(self, edges):
         if edges:
@@ -33,10 +34,11 @@ class Assignment(object):
         authors_id=self.journal.get_authors_id(number=note.number)
 
         action_editors = self.journal.get_action_editors()
-        action_editor_profiles = tools.get_profiles(self.client, action_editors, with_publications=True, with_relations=True)
+        ## Relations shared by the committee and the authors are retrieved once
+        action_editor_profiles = tools.get_profiles(self.client, action_editors, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
 
         authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
 
         ## Create affinity scores
         affinity_score_edges = []
@@ -86,10 +88,11 @@ class Assignment(object):
         authors_id = self.journal.get_authors_id(number=note.number)
 
         reviewers = self.journal.get_reviewers()
-        reviewer_profiles = tools.get_profiles(self.client, reviewers, with_publications=True, with_relations=True)
+        ## Relations shared by the committee and the authors are retrieved once
+        reviewer_profiles = tools.get_profiles(self.client, reviewers, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
 
         authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
 
         ## Create affinity scores
         affinity_score_edges = []
@@ -134,10 +137,11 @@ class Assignment(object):
 
     def compute_conflicts(self, note, reviewer):
 
-        reviewer_profiles = tools.get_profiles(self.client, [reviewer], with_publications=True, with_relations=True)
+        ## Relations shared by the committee and the authors are retrieved once
+        reviewer_profiles = tools.get_profiles(self.client, [reviewer], with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
 
         authors = self.journal.get_authors(number=note.number)
-        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
+        author_profiles = tools.get_profiles(self.client, authors, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
 
         return tools.get_conflicts(author_profiles, reviewer_profiles[0], policy='NeurIPS', n_years=3)
 
@@ -1,4 +1,5 @@
 from .. import openreview
+from .. import tools
 from . import group
 from .invitation import InvitationBuilder
 from .recruitment import Recruitment
@@ -55,6 +56,8 @@ class Journal(object):
             "deadline": "",
             "contact": self.contact_info
         }
+        ## Profiles retrieved by the conflict and affinity computations of the journal
+        self.profile_cache = tools.ProfileCache()
         self.assignment = Assignment(self)
         self.recruitment = Recruitment(self)
         self.unavailable_reminder_period = 4  # weeks
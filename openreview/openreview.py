@@ -8,7 +8,6 @@ else:
 
 from . import tools
 import requests
-from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import pprint
 import os
@@ -43,8 +42,14 @@ class Client(object):
     :type token: str, optional
     :param tokenExpiresIn: Time in seconds before the token expires. This parameter only works when providing a username and a password. If none is set, the value will be set automatically to one day. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param pool_maxsize: Maximum number of connections kept alive per host. If none is set, it is the number of requests that tools.concurrent_requests sends in parallel.
+    :type pool_maxsize: int, optional
+    :param pool_block: If True, the requests wait for a free connection when the pool is full instead of opening a connection that is closed after the response.
+    :type pool_block: bool, optional
+    :param keep_alive: If False, the connections are closed after every request.
+    :type keep_alive: bool, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, pool_maxsize=None, pool_block=False, keep_alive=True):
         self.baseurl = baseurl if baseurl is not None else os.environ.get('OPENREVIEW_BASEURL', 'http://localhost:3000')
         if 'https://api2.openreview.net' in self.baseurl or 'https://devapi2.openreview.net' in self.baseurl:
             correct_baseurl = self.baseurl.replace('api2', 'api')
@@ -91,10 +96,10 @@ class Client(object):
         }
 
         retry_strategy = LogRetry(total=3, backoff_factor=0.1, status_forcelist=[ 500, 502, 503, 504 ], respect_retry_after_header=True)
-        self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount('https://', adapter)
-        self.session.mount('http://', adapter)
+        self.session = tools.InstrumentedSession()
+        self.adapter = tools.PooledHTTPAdapter(pool_maxsize=pool_maxsize, pool_block=pool_block, keep_alive=keep_alive, max_retries=retry_strategy)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
 
         if self.token:
             self.headers['Authorization'] = 'Bearer ' + self.token
@@ -141,9 +146,41 @@ class Client(object):
                     'name': 'Error',
                     'message': response.reason
                 }
-            raise OpenReviewException(error)
+            exception = OpenReviewException(error)
+            ## Used by tools.RequestScheduler to detect rate limited requests
+            exception.status = response.status_code
+            exception.retry_after = response.headers.get('Retry-After')
+            raise exception
 
     ## PUBLIC FUNCTIONS
+    def get_pool_stats(self):
+        """
+        Returns the usage of the connection pool: requests sent, connections opened and reused, reuse ratio, requests in flight,
+        the peak of requests in flight and the number of requests sent while the pool was full
+
+        :return: Dictionary with the stats of the connection pool
+        :rtype: dict
+        """
+        return self.adapter.get_stats()
+
+    def add_request_hook(self, hook):
+        """
+        Adds a function that is called with a tools.RequestRecord after every HTTP request, e.g. tools.RequestMetrics or tools.OTLPFileExporter
+
+        :param hook: function that receives the RequestRecord
+        :type hook: callable
+        """
+        self.session.request_hooks.append(hook)
+
+    def remove_request_hook(self, hook):
+        """
+        Removes a function added with add_request_hook
+
+        :param hook: function that receives the RequestRecord
+        :type hook: callable
+        """
+        self.session.request_hooks.remove(hook)
+
     def impersonate(self, group_id):
         response = self.session.post(self.baseurl + '/impersonate', json={ 'groupId': group_id }, headers=self.headers)
         response = self.__handle_response(response)
@@ -18,9 +18,25 @@ from tqdm import tqdm
 import tld
 import urllib.parse as urlparse
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as futures_wait, FIRST_COMPLETED
 import random
 import string
+import threading
+import functools
+import codecs
+import queue
+import time
+import tempfile
+import hashlib
+import array
+import io
+import zipfile
+import numpy as np
+from email.utils import parsedate_to_datetime
+import requests
+import urllib3
+from collections import OrderedDict
+import copy
 
 def decision_to_venue(venue_id, decision_option, accept_options=None):
     """
@@ -87,7 +103,536 @@ def format_params(params):
 
     return params
 
-def concurrent_requests(request_func, params, desc='Gathering Responses'):
+class TokenBucket:
+    """
+    Token bucket that limits the rate of requests sent to an endpoint
+
+    :param rate: number of requests per second
+    :type rate: float
+    :param burst: maximum number of requests that can be sent at once, by default the rate
+    :type burst: int, optional
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1)
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+                self.timestamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class RequestScheduler:
+    """
+    Schedules the concurrent requests sent by :func:`tools.concurrent_requests` and :func:`tools.concurrent_get`.
+
+    The number of requests in flight follows an AIMD policy: it grows by one every time a full window of requests completes, and it is
+    halved when the latency of an endpoint goes over `latency_factor` times its average or when the server answers 429 or 503. The
+    requests that were rate limited are retried after the time in the Retry-After header. The concurrency never goes over `max_in_flight`,
+    and each endpoint can also be limited to a number of requests per second.
+
+    Functions that are executed by the scheduler and call it again run the nested requests in the slot of the caller, one after the other,
+    and the nested requests are also paused and retried when they are rate limited.
+
+    :param max_in_flight: maximum number of requests in flight across all the endpoints
+    :type max_in_flight: int, optional
+    :param initial_limit: number of requests in flight allowed before any response is received
+    :type initial_limit: int, optional
+    :param min_limit: minimum number of requests in flight
+    :type min_limit: int, optional
+    :param rates: dictionary of endpoint names, e.g. 'get_notes', to the maximum number of requests per second
+    :type rates: dict, optional
+    :param latency_factor: a request slower than this factor times the average latency of the endpoint reduces the concurrency
+    :type latency_factor: float, optional
+    :param max_retries: maximum number of times a rate limited request is retried
+    :type max_retries: int, optional
+    """
+    def __init__(self, max_in_flight=32, initial_limit=6, min_limit=1, rates=None, latency_factor=3.0, max_retries=5):
+        self.max_in_flight = max_in_flight
+        self.min_limit = min_limit
+        self.limit = float(max(min(initial_limit, max_in_flight), min_limit))
+        self.rates = rates or {}
+        self.latency_factor = latency_factor
+        self.max_retries = max_retries
+        self.in_flight = 0
+        self.paused_until = 0
+        self.last_decrease = 0
+        self.latency_by_endpoint = {}
+        self.buckets = {}
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'retries': 0
+        }
+        self.condition = threading.Condition()
+        self.local = threading.local()
+
+    @staticmethod
+    def get_retry_after(error, attempt):
+        """
+        Returns the number of seconds to wait before retrying a request that failed with the passed error, or None if the request was not rate limited.
+        Only the OpenReviewExceptions of the responses with status 429 or 503 are considered rate limited.
+        """
+        if not isinstance(error, openreview.OpenReviewException) or getattr(error, 'status', None) not in [429, 503]:
+            return None
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after:
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                try:
+                    retry_date = parsedate_to_datetime(retry_after)
+                    return max((retry_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0)
+                except (TypeError, ValueError):
+                    pass
+        return min(2 ** attempt, 60)
+
+    def __acquire(self, endpoint):
+        with self.condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self.condition.wait(timeout=wait if wait > 0 else None)
+            self.in_flight += 1
+            self.stats['requests'] += 1
+            bucket = None
+            if endpoint in self.rates:
+                bucket = self.buckets.setdefault(endpoint, TokenBucket(self.rates[endpoint]))
+        if bucket:
+            bucket.take()
+
+    def __release(self):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def __decrease(self, window):
+        ## Called with the condition acquired, the concurrency is reduced at most once per window
+        now = time.monotonic()
+        if now - self.last_decrease >= window:
+            self.limit = max(self.min_limit, self.limit / 2)
+            self.last_decrease = now
+
+    def __on_success(self, endpoint, latency):
+        with self.condition:
+            average = self.latency_by_endpoint.get(endpoint)
+            self.latency_by_endpoint[endpoint] = latency if average is None else 0.8 * average + 0.2 * latency
+            if average is not None and latency > average * self.latency_factor:
+                self.__decrease(average)
+            else:
+                self.limit = min(self.max_in_flight, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+    def __wait_for_pause(self):
+        with self.condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0:
+                    return
+                self.condition.wait(timeout=wait)
+
+    def __on_retry(self, endpoint, wait, throttled):
+        with self.condition:
+            self.stats['retries'] += 1
+            if throttled:
+                self.stats['throttled'] += 1
+                now = time.monotonic()
+                ## Log once per throttle window, the requests rate limited during the pause only extend it
+                if now >= self.paused_until:
+                    print(f'Requests to {endpoint} were rate limited, pausing for {wait} seconds')
+                self.__decrease(self.latency_by_endpoint.get(endpoint, 1))
+                self.paused_until = max(self.paused_until, now + wait)
+            self.condition.notify_all()
+
+    def run(self, func, *args, endpoint=None, retry_error=None, max_retries=None, **kwargs):
+        """
+        Executes the function when there is a slot available and retries it if it is rate limited.
+
+        A function called from another function executed by the scheduler runs in the slot of its caller, it waits for the pauses
+        and is retried in the same way.
+
+        :param func: function that sends the request
+        :type func: function
+        :param endpoint: name used to group the requests, by default the name of the function
+        :type endpoint: str, optional
+        :param retry_error: function that returns True if the request that failed with the passed error can be sent again, by default only
+            the rate limited requests are retried
+        :type retry_error: function, optional
+        :param max_retries: maximum number of retries, by default the `max_retries` of the scheduler
+        :type max_retries: int, optional
+
+        :return: The result of the function
+        """
+        nested = getattr(self.local, 'active', False)
+        endpoint = endpoint or getattr(func, '__name__', 'request')
+        max_retries = self.max_retries if max_retries is None else max_retries
+        attempt = 0
+        while True:
+            if nested:
+                self.__wait_for_pause()
+            else:
+                self.__acquire(endpoint)
+                self.local.active = True
+            retry_after = None
+            try:
+                start = time.monotonic()
+                result = func(*args, **kwargs)
+            except Exception as error:
+                retry_after = RequestScheduler.get_retry_after(error, attempt)
+                retry = retry_error(error) if retry_error else retry_after is not None
+                if not retry or attempt >= max_retries:
+                    raise
+                wait = retry_after if retry_after is not None else min(2 ** attempt, 60)
+                self.__on_retry(endpoint, wait, retry_after is not None)
+                attempt += 1
+            else:
+                if not nested:
+                    self.__on_success(endpoint, time.monotonic() - start)
+                return result
+            finally:
+                if not nested:
+                    self.local.active = False
+                    self.__release()
+            ## The rate limited requests wait for the pause, the others back off without holding a slot
+            if retry_after is None:
+                time.sleep(wait)
+
+    def map(self, func, params, desc='Gathering Responses', endpoint=None):
+        """
+        Executes the function for each param and returns the results in the same order. It shows a progress bar to know the progress of the task.
+
+        :param func: function that takes a single parameter
+        :type func: function
+        :param params: list of values to be executed by func
+        :type params: list
+        :param desc: description of the progress bar
+        :type desc: str, optional
+        :param endpoint: name used to group the requests, by default the name of the function
+        :type endpoint: str, optional
+
+        :return: A list of results given for each func value execution
+        :rtype: list
+        """
+        gathering_responses = tqdm(total=len(params), desc=desc)
+        results = []
+
+        if getattr(self.local, 'active', False):
+            for param in params:
+                results.append(self.run(func, param, endpoint=endpoint))
+                gathering_responses.update(1)
+            gathering_responses.close()
+            return results
+
+        with ThreadPoolExecutor(max_workers=max(min(self.max_in_flight, len(params)), 1)) as executor:
+            futures = [executor.submit(self.run, func, param, endpoint=endpoint) for param in params]
+
+            for future in futures:
+                results.append(future.result())
+                gathering_responses.update(1)
+
+            gathering_responses.close()
+
+            return results
+
+request_scheduler = RequestScheduler()
+
+class PooledHTTPAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTPAdapter used by the clients that keeps a pool of reusable connections per host and counts how the pool is used.
+
+    By default the pool has as many connections as requests the :data:`tools.request_scheduler` sends in parallel, so the threads of
+    :func:`tools.concurrent_requests` don't discard connections with "Connection pool is full" and open new ones for every request.
+
+    :param pool_maxsize: maximum number of connections kept alive per host, defaults to the `max_in_flight` of the request scheduler
+    :type pool_maxsize: int, optional
+    :param pool_connections: number of hosts to keep pools for
+    :type pool_connections: int, optional
+    :param pool_block: if True, the requests wait for a free connection instead of opening a connection that is discarded after the response
+    :type pool_block: bool, optional
+    :param keep_alive: if False, every connection is closed after its response
+    :type keep_alive: bool, optional
+    :param max_retries: retry strategy passed to HTTPAdapter
+    :type max_retries: Retry or int, optional
+    """
+    def __init__(self, pool_maxsize=None, pool_connections=10, pool_block=False, keep_alive=True, max_retries=0):
+        self.keep_alive = keep_alive
+        self.in_flight = 0
+        self.stats = {
+            'requests': 0,
+            'connections': 0,
+            'peak_in_flight': 0,
+            'saturated': 0
+        }
+        self.lock = threading.Lock()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize or request_scheduler.max_in_flight, max_retries=max_retries, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        ## count the sockets that are opened, a pooled connection opens a new socket when the server closed the previous one
+        adapter = self
+
+        def count_connect(connection_class):
+            def connect(connection):
+                with adapter.lock:
+                    adapter.stats['connections'] += 1
+                return connection_class.connect(connection)
+            return type(connection_class.__name__, (connection_class,), { 'connect': connect })
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(pool_class.__name__, (pool_class,), { 'ConnectionCls': count_connect(pool_class.ConnectionCls) })
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, request, **kwargs):
+        if not self.keep_alive:
+            request.headers['Connection'] = 'close'
+        with self.lock:
+            self.in_flight += 1
+            self.stats['requests'] += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.in_flight)
+            if self.in_flight > self._pool_maxsize:
+                ## the connection of this request doesn't fit in the pool, it is closed when the response is read
+                self.stats['saturated'] += 1
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def get_stats(self):
+        """
+        Returns the number of requests sent, the connections opened and reused, the maximum number of requests in flight, and the number
+        of requests sent while the pool was full
+        """
+        with self.lock:
+            stats = dict(self.stats)
+            stats['in_flight'] = self.in_flight
+        stats['pool_maxsize'] = self._pool_maxsize
+        stats['reused'] = max(stats['requests'] - stats['connections'], 0)
+        stats['reuse_ratio'] = stats['reused'] / stats['requests'] if stats['requests'] else 0.0
+        return stats
+
+class RequestRecord:
+    """
+    Measurements of one HTTP request sent by a client, passed to the request hooks
+
+    :param method: HTTP method
+    :param endpoint: path of the URL, e.g. '/notes'
+    :param params: comma separated names of the query parameters, without their values
+    :param status: status code of the response, None if no response was received
+    :param latency: seconds from sending the request until the body of the response was read
+    :param bytes_out: size of the request body
+    :param bytes_in: size of the response body, None for streamed responses without Content-Length
+    :param retries: number of times the request was retried by the retry strategy of the client
+    :param start_time: epoch time in seconds when the request was sent
+    :param error: name of the exception raised by the transport, if any
+    """
+    __slots__ = ('method', 'endpoint', 'params', 'status', 'latency', 'bytes_out', 'bytes_in', 'retries', 'start_time', 'error')
+
+    def __init__(self, method, endpoint, params='', status=None, latency=0.0, bytes_out=0, bytes_in=0, retries=0, start_time=None, error=None):
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params
+        self.status = status
+        self.latency = latency
+        self.bytes_out = bytes_out
+        self.bytes_in = bytes_in
+        self.retries = retries
+        self.start_time = start_time if start_time is not None else time.time()
+        self.error = error
+
+    def __repr__(self):
+        return f'RequestRecord({self.method} {self.endpoint}?{self.params} status={self.status} latency={self.latency:.3f}s)'
+
+class InstrumentedSession(requests.Session):
+    """
+    requests.Session that measures every request and passes a :class:`RequestRecord` to each function in `request_hooks`.
+    The clients use it as their session, see OpenReviewClient.add_request_hook.
+    """
+    def __init__(self):
+        super().__init__()
+        self.request_hooks = []
+
+    def send(self, request, **kwargs):
+        if not self.request_hooks:
+            return super().send(request, **kwargs)
+
+        url = urlparse.urlsplit(request.url)
+        body = request.body
+        record = RequestRecord(request.method, url.path, params=','.join(sorted(set(key for key, value in urlparse.parse_qsl(url.query, keep_blank_values=True)))),
+            bytes_out=len(body) if body else 0)
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            record.latency = time.perf_counter() - start
+            record.error = type(e).__name__
+            self.__call_hooks(record)
+            raise
+
+        record.latency = time.perf_counter() - start
+        record.status = response.status_code
+        if kwargs.get('stream'):
+            content_length = response.headers.get('Content-Length')
+            record.bytes_in = int(content_length) if content_length else None
+        else:
+            record.bytes_in = len(response.content)
+        retries = getattr(response.raw, 'retries', None)
+        record.retries = len(retries.history) if retries is not None and retries.history else 0
+        self.__call_hooks(record)
+        return response
+
+    def __call_hooks(self, record):
+        for hook in self.request_hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                print('Request hook failed', hook, e)
+
+class RequestMetrics:
+    """
+    Request hook that aggregates the requests in memory by method and endpoint, e.g.
+
+    ``metrics = openreview.tools.RequestMetrics()``
+    ``client.add_request_hook(metrics)``
+    ``matching.setup(...)``
+    ``metrics.print_summary()``
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.totals = {}
+
+    def __call__(self, record):
+        key = (record.method, record.endpoint)
+        with self.lock:
+            self.latencies.setdefault(key, array.array('d')).append(record.latency)
+            totals = self.totals.setdefault(key, { 'errors': 0, 'retries': 0, 'bytes_in': 0, 'bytes_out': 0, 'params': {} })
+            if record.status is None or record.status >= 400:
+                totals['errors'] += 1
+            totals['retries'] += record.retries
+            totals['bytes_in'] += record.bytes_in or 0
+            totals['bytes_out'] += record.bytes_out
+            totals['params'][record.params] = totals['params'].get(record.params, 0) + 1
+
+    def summary(self):
+        """
+        Returns a dictionary of 'METHOD /endpoint' to the count, total time, p50, p95 and p99 latencies in seconds, errors, retries,
+        bytes in and out, and the number of requests by params shape, sorted by total time
+        """
+        with self.lock:
+            items = [(key, np.frombuffer(latencies, dtype=np.float64).copy(), copy.deepcopy(self.totals[key])) for key, latencies in self.latencies.items()]
+        summary = {}
+        for (method, endpoint), latencies, totals in sorted(items, key=lambda item: -item[1].sum()):
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            summary[f'{method} {endpoint}'] = dict({
+                'count': len(latencies),
+                'total': float(latencies.sum()),
+                'p50': float(p50),
+                'p95': float(p95),
+                'p99': float(p99)
+            }, **totals)
+        return summary
+
+    def print_summary(self, top=20):
+        """
+        Prints the endpoints that took the most time
+        """
+        print(f'{"endpoint":50} {"count":>8} {"total s":>10} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"MB in":>9} {"MB out":>9} {"errors":>7} {"retries":>7}')
+        for name, stats in list(self.summary().items())[:top]:
+            print(f'{name[:50]:50} {stats["count"]:8d} {stats["total"]:10.2f} {stats["p50"] * 1000:9.1f} {stats["p95"] * 1000:9.1f} {stats["p99"] * 1000:9.1f} '
+                f'{stats["bytes_in"] / 1e6:9.2f} {stats["bytes_out"] / 1e6:9.2f} {stats["errors"]:7d} {stats["retries"]:7d}')
+
+    def reset(self):
+        with self.lock:
+            self.latencies = {}
+            self.totals = {}
+
+class OTLPFileExporter:
+    """
+    Request hook that writes every request as an OpenTelemetry span to a file, one OTLP/JSON ExportTraceServiceRequest per line as
+    the file exporter of the OpenTelemetry Collector does. The file can be loaded later in any tool that reads OTLP traces, no
+    collector needs to be running.
+
+    :param path: path of the file, the spans are appended to it
+    :type path: str
+    :param service_name: value of the service.name resource attribute
+    :type service_name: str, optional
+    :param batch_size: number of spans written in each line
+    :type batch_size: int, optional
+    """
+    def __init__(self, path, service_name='openreview-py', batch_size=512):
+        self.path = path
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def __call__(self, record):
+        start = int(record.start_time * 1e9)
+        attributes = [
+            { 'key': 'http.request.method', 'value': { 'stringValue': record.method } },
+            { 'key': 'url.path', 'value': { 'stringValue': record.endpoint } },
+            { 'key': 'openreview.params', 'value': { 'stringValue': record.params } },
+            { 'key': 'http.request.body.size', 'value': { 'intValue': str(record.bytes_out) } },
+            { 'key': 'http.request.resend_count', 'value': { 'intValue': str(record.retries) } }
+        ]
+        if record.status is not None:
+            attributes.append({ 'key': 'http.response.status_code', 'value': { 'intValue': str(record.status) } })
+        if record.bytes_in is not None:
+            attributes.append({ 'key': 'http.response.body.size', 'value': { 'intValue': str(record.bytes_in) } })
+        if record.error:
+            attributes.append({ 'key': 'error.type', 'value': { 'stringValue': record.error } })
+        span = {
+            'traceId': self.trace_id,
+            'spanId': os.urandom(8).hex(),
+            'name': f'{record.method} {record.endpoint}',
+            'kind': 3,
+            'startTimeUnixNano': str(start),
+            'endTimeUnixNano': str(start + int(record.latency * 1e9)),
+            'attributes': attributes,
+            'status': { 'code': 2 } if record.error or (record.status or 0) >= 500 else {}
+        }
+        with self.lock:
+            self.spans.append(span)
+            if len(self.spans) >= self.batch_size:
+                self.__write()
+
+    def __write(self):
+        if not self.spans:
+            return
+        line = {
+            'resourceSpans': [{
+                'resource': { 'attributes': [{ 'key': 'service.name', 'value': { 'stringValue': self.service_name } }] },
+                'scopeSpans': [{ 'scope': { 'name': 'openreview.tools' }, 'spans': self.spans }]
+            }]
+        }
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(line) + '\n')
+        self.spans = []
+
+    def flush(self):
+        """
+        Writes the spans that are still in memory
+        """
+        with self.lock:
+            self.__write()
+
+    def close(self):
+        self.flush()
+
+def concurrent_requests(request_func, params, desc='Gathering Responses', scheduler=None):
     """
     Returns a list of results given for each request_func param execution. It shows a progress bar to know the progress of the task.
 
@@ -95,27 +640,109 @@ def concurrent_requests(request_func, params, desc='Gathering Responses'):
     :type request_func: function
     :param params: a list of values to be executed by request_func.
     :type params: list
-    :param max_workers: number of workers to use in the multiprocessing tool, default value is 6.
-    :type max_workers: int
+    :param scheduler: scheduler that limits the number of concurrent requests, by default the scheduler shared by the whole process.
+    :type scheduler: RequestScheduler, optional
 
     :return: A list of results given for each func value execution
     :rtype: list
     """
-    max_workers = cpu_count() - 1
-    futures = []
-    gathering_responses = tqdm(total=len(params), desc=desc)
-    results = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for param in params:
-            futures.append(executor.submit(request_func, param))
+    scheduler = scheduler or request_scheduler
+    return scheduler.map(request_func, params, desc=desc)
 
-        for future in futures:
-            gathering_responses.update(1)
-            results.append(future.result())
+class DeploymentPlan:
+    """
+    Runs the steps of a deployment, e.g. saving the invitations and groups of the stages of a venue, as soon as the steps they depend on
+    are done. Independent steps run concurrently, so the deployment takes about as long as its slowest chain of steps.
 
-        gathering_responses.close()
+    Example:
 
+    >>> plan = DeploymentPlan()
+    >>> plan.add('submission', venue.invitation_builder.set_submission_invitation)
+    >>> plan.add('withdrawal', venue.invitation_builder.set_withdrawal_invitation, depends_on=['submission'])
+    >>> results = plan.run()
+
+    :param max_workers: maximum number of steps that run at the same time
+    :type max_workers: int, optional
+    """
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self.steps = OrderedDict()
+
+    def __len__(self):
+        return len(self.steps)
+
+    def add(self, name, func, *args, depends_on=None, **kwargs):
+        """
+        Adds a step that calls func with the args and kwargs after all the steps in depends_on are done
+
+        :param name: name of the step, e.g. the id of the invitation it saves
+        :type name: str
+        :param func: function that runs the step
+        :type func: function
+        :param depends_on: names of the steps that must be done first
+        :type depends_on: list[str], optional
+        """
+        if name in self.steps:
+            raise openreview.OpenReviewException(f'Step {name} was already added to the deployment')
+        self.steps[name] = (func, args, kwargs, list(depends_on or []))
+        return name
+
+    def get_order(self):
+        """
+        Returns the names of the steps grouped in waves, every step only depends on steps of the previous waves
+
+        :return: List of waves of step names
+        :rtype: list[list[str]]
+        """
+        for name, (_, _, _, depends_on) in self.steps.items():
+            for dependency in depends_on:
+                if dependency not in self.steps:
+                    raise openreview.OpenReviewException(f'Step {name} depends on unknown step {dependency}')
+        waves = []
+        done = set()
+        pending = list(self.steps.keys())
+        while pending:
+            wave = [name for name in pending if all(dependency in done for dependency in self.steps[name][3])]
+            if not wave:
+                raise openreview.OpenReviewException(f'Circular dependency between the steps {pending}')
+            waves.append(wave)
+            done.update(wave)
+            pending = [name for name in pending if name not in done]
+        return waves
+
+    def run(self):
+        """
+        Runs all the steps. If a step fails, the steps that were already started are finished, no other step is started and the error
+        of the failed step is raised.
+
+        :return: Result of each step by name
+        :rtype: dict
+        """
+        self.get_order()
+        results = {}
+        running = {}
+        pending = list(self.steps.keys())
+        error = None
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1)) as executor:
+            while pending or running:
+                if error is None:
+                    ready = [name for name in pending if all(dependency in results for dependency in self.steps[name][3])]
+                    for name in ready:
+                        func, args, kwargs, _ = self.steps[name]
+                        running[executor.submit(func, *args, **kwargs)] = name
+                        pending.remove(name)
+                if not running:
+                    break
+                done, _ = futures_wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        print(f'Step {name} failed: {e}')
+                        error = error or e
+        if error is not None:
+            raise error
         return results
 
 def get_profile(client, value, with_publications=False):
@@ -156,13 +783,177 @@ def get_profile(client, value, with_publications=False):
     return profile
 
 
-def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, with_preferred_emails=None, as_dict=False):
+class ProfileCache:
+    """
+    Thread safe LRU cache of the Profiles retrieved by :func:`tools.get_profiles`, so the profiles of a committee loaded in different
+    steps of a venue run are only retrieved once. A cache should be created for each run and passed to all its calls, Profiles updated
+    during the run are only seen after they expire.
+
+    Each Profile is stored under all its usernames and confirmed emails. Entries expire after `ttl` seconds, and a Profile with an
+    older modification date never replaces a newer one. The entries are separated by the server and token of the client, and copies are
+    returned so the callers can add publications or relations to them.
+
+    :param ttl: number of seconds a Profile is kept, if None the Profiles never expire
+    :type ttl: float, optional
+    :param maxsize: maximum number of entries to keep, the least recently used entries are evicted first
+    :type maxsize: int, optional
+    """
+    def __init__(self, ttl=3600, maxsize=200000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def get_namespace(client):
+        return (getattr(client, 'baseurl', None), getattr(client, 'token', None))
+
+    @staticmethod
+    def __copy_profile(profile):
+        profile = copy.copy(profile)
+        profile.content = dict(profile.content or {})
+        if 'relations' in profile.content:
+            profile.content['relations'] = [dict(relation) for relation in profile.content['relations']]
+        return profile
+
+    def get(self, client, id_or_email):
+        """
+        Returns a copy of the cached Profile of the id or confirmed email, or None if it is not cached or it expired
+        """
+        key = (ProfileCache.get_namespace(client), id_or_email)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[1] > self.ttl:
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__entries.move_to_end(key)
+        return ProfileCache.__copy_profile(entry[0])
+
+    def put(self, client, profile, keys=None):
+        """
+        Stores a copy of the Profile under its usernames, confirmed emails and the passed keys
+        """
+        content = profile.content or {}
+        keys = set(keys or [])
+        keys.add(profile.id)
+        keys.update(name['username'] for name in content.get('names', []) if name.get('username'))
+        keys.update(content.get('emailsConfirmed', []))
+        namespace = ProfileCache.get_namespace(client)
+        profile = ProfileCache.__copy_profile(profile)
+        now = time.monotonic()
+        with self.__lock:
+            for key in keys:
+                current = self.__entries.get((namespace, key))
+                if current is not None and (current[0].tmdate or 0) > (profile.tmdate or 0):
+                    continue
+                self.__entries[(namespace, key)] = (profile, now)
+                self.__entries.move_to_end((namespace, key))
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, client, ids_or_emails):
+        """
+        Removes the cached Profiles of the ids or confirmed emails
+        """
+        namespace = ProfileCache.get_namespace(client)
+        with self.__lock:
+            for id_or_email in ids_or_emails:
+                self.__entries.pop((namespace, id_or_email), None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns the cache counters
+
+        :return: Dictionary with the number of hits, misses and entries of the cache
+        :rtype: dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.__entries),
+            'maxsize': self.maxsize
+        }
+
+class PublicationRecord:
+    """
+    Compact projection of a publication Note with the fields used by the conflict policies: id, pdate, cdate, tcdate and the year and
+    venueid of the content.
+    """
+    __slots__ = ['id', 'pdate', 'cdate', 'tcdate', 'content']
+    CONTENT_FIELDS = ['year', 'venueid']
+
+    def __init__(self, id, pdate=None, cdate=None, tcdate=None, content=None):
+        self.id = id
+        self.pdate = pdate
+        self.cdate = cdate
+        self.tcdate = tcdate
+        self.content = content or {}
+
+    def __repr__(self):
+        return f'PublicationRecord(id={self.id!r}, pdate={self.pdate!r}, cdate={self.cdate!r}, tcdate={self.tcdate!r}, content={self.content!r})'
+
+    @classmethod
+    def from_note(cls, note):
+        content = note.content or {}
+        return cls(note.id, getattr(note, 'pdate', None), note.cdate, note.tcdate, { field: content[field] for field in PublicationRecord.CONTENT_FIELDS if field in content })
+
+def load_publications(clients, profile_ids, compact=False, scheduler=None):
+    """
+    Gets the publications of the profiles from all the clients, e.g. the clients of API 1 and API 2. One query per profile and client is
+    scheduled in the shared request scheduler, the pages of each query are retrieved in the same slot.
+
+    :param clients: clients from where the publications are retrieved, the publications of each client are returned in this order
+    :type clients: list
+    :param profile_ids: ids of the profiles
+    :type profile_ids: list[str]
+    :param compact: If True, the publications are returned as :class:`PublicationRecord`
+    :type compact: bool, optional
+    :param scheduler: scheduler that limits the number of concurrent requests, by default the scheduler shared by the whole process.
+    :type scheduler: RequestScheduler, optional
+
+    :return: Dictionary of profile ids to the list of their publications
+    :rtype: dict
+    """
+    scheduler = scheduler or request_scheduler
+    ## The API filters notes by a single author id, so there is no multi-author query
+    queries = [(profile_id, client) for profile_id in dict.fromkeys(profile_ids) for client in clients]
+
+    def get_publications(query):
+        profile_id, client = query
+        notes = client.get_all_notes(content={'authorids': profile_id})
+        return [PublicationRecord.from_note(note) for note in notes] if compact else notes
+
+    publications_by_id = { profile_id: [] for profile_id in profile_ids }
+    for (profile_id, client), publications in zip(queries, scheduler.map(get_publications, queries, desc='Loading publications', endpoint='get_publications')):
+        publications_by_id[profile_id] += publications
+    return publications_by_id
+
+def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, with_preferred_emails=None, as_dict=False, cache=None, compact_publications=False):
     '''
     Helper function that repeatedly queries for profiles, given IDs and emails.
     Useful for getting more Profiles than the server will return by default (1000)
 
     :param with_preferred_emails: invitation id to get the edges where the preferred emails are stored
     :type with_preferred_emails: str
+    :param compact_publications: If True, the publications are loaded as :class:`PublicationRecord` with only the fields used by the conflict policies
+    :type compact_publications: bool, optional
+    :param cache: cache shared by the calls of the same run, e.g. a venue setup, so each Profile is retrieved only once. If None, all the Profiles are retrieved.
+    :type cache: ProfileCache, optional
     '''
     ids = []
     emails = []
@@ -183,20 +974,31 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
         if email:
             profile_by_id_or_email[email] = profile        
 
-    batch_size = 1000
+    ## Use the cached profiles and search only the missing ones
+    def process_cached_profile(id_or_email, email=None):
+        profile = cache.get(client, id_or_email) if cache is not None else None
+        if profile is None:
+            return False
+        ## A profile cached under several keys is used only once
+        process_profile(profile_by_id.get(profile.id, profile), email)
+        return True
+
+    missing_ids = [id for id in dict.fromkeys(ids) if not process_cached_profile(id)]
+    missing_emails = [email for email in dict.fromkeys(emails) if not process_cached_profile(email, email)]
+
     ## Get profiles by id and add them to the profiles list
-    for i in range(0, len(ids), batch_size):
-        batch_ids = ids[i:i+batch_size]
-        batch_profiles = client.search_profiles(ids=batch_ids)
-        for profile in batch_profiles:
+    if missing_ids:
+        for profile in client.search_profiles(ids=missing_ids):
             process_profile(profile)
+            if cache is not None:
+                cache.put(client, profile)
 
     ## Get profiles by email and add them to the profiles list
-    for j in range(0, len(emails), batch_size):
-        batch_emails = emails[j:j+batch_size]
-        batch_profile_by_email = client.search_profiles(confirmedEmails=batch_emails)
-        for email, profile in batch_profile_by_email.items():
-            process_profile(profile, email)            
+    if missing_emails:
+        for email, profile in client.search_profiles(confirmedEmails=missing_emails).items():
+            process_profile(profile_by_id.get(profile.id, profile), email)
+            if cache is not None:
+                cache.put(client, profile, [email])
 
     for email in emails:
         if email not in profile_by_id_or_email:
@@ -228,20 +1030,9 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
         client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
         client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
 
-        # Fetch publications from both APIs in parallel per profile
-        from concurrent.futures import ThreadPoolExecutor
-
-        def get_publications(profile):
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                future_v1 = executor.submit(client_v1.get_all_notes, content={'authorids': profile.id})
-                future_v2 = executor.submit(client_v2.get_all_notes, content={'authorids': profile.id})
-                pubs_v1 = future_v1.result()
-                pubs_v2 = future_v2.result()
-                return pubs_v1 + pubs_v2
-
-        publications_all = concurrent_requests(get_publications, profiles, desc='Loading publications from both APIs')
-        for idx, publications in enumerate(publications_all):
-            profiles[idx].content['publications'] = publications
+        publications_by_id = load_publications([client_v1, client_v2], [profile.id for profile in profiles], compact=compact_publications)
+        for profile in profiles:
+            profile.content['publications'] = publications_by_id[profile.id]
 
     if with_relations:
 
@@ -252,7 +1043,7 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
             relation_profile_ids.update(relation_usernames)
             relation_profile_ids.update(relation_emails)
 
-        relation_profiles_by_id = get_profiles(client, list(relation_profile_ids), as_dict=True)
+        relation_profiles_by_id = get_profiles(client, list(relation_profile_ids), as_dict=True, cache=cache)
 
         for profile in profiles:
             for relation in profile.content.get('relations', []):
@@ -584,6 +1375,75 @@ def load_duplicate_domains():
     return duplicate_domains
 
 
+class DomainResolver:
+    """
+    Resolves the canonical domains and subdomains of an email domain, see :func:`tools.subdomains`.
+
+    The public suffix trie and the duplicate domain aliases are loaded only once, and every suffix of a domain is matched against
+    the trie in a single walk instead of parsing each suffix as a URL. If the installed tld doesn't expose the trie, each suffix is
+    checked with tld.is_tld instead. The results are memoized in a bounded LRU cache.
+
+    :param duplicate_domains: dictionary of domain aliases to their canonical domain, by default the aliases in duplicate_domains.json
+    :type duplicate_domains: dict, optional
+    :param maxsize: maximum number of domains to keep in the cache
+    :type maxsize: int, optional
+    """
+    label_regex = re.compile(r'^[a-z0-9-]+$')
+
+    def __init__(self, duplicate_domains=None, maxsize=100000):
+        self.duplicate_domains = load_duplicate_domains() if duplicate_domains is None else duplicate_domains
+        self.trie = DomainResolver.__load_trie()
+        self.subdomains = functools.lru_cache(maxsize=maxsize)(self.__subdomains)
+
+    @staticmethod
+    def __load_trie():
+        ## The trie is not part of the public API of tld, every suffix is checked with tld.is_tld if its structure is different
+        try:
+            parser_class = tld.utils.MozillaTLDSourceParser
+            trie = tld.utils.get_tld_names(parser_class=parser_class)[parser_class.local_path]
+            if all(hasattr(trie.root, name) for name in ['children', 'exception', 'leaf']):
+                return trie
+        except (AttributeError, KeyError, TypeError):
+            pass
+        return None
+
+    def __get_tld_suffixes(self, domain_components):
+        ## Returns a list where the position i is True if the suffix with i + 1 components is a public suffix,
+        ## following the same rules as tld.is_tld
+        if self.trie is None:
+            return [tld.is_tld('.'.join(domain_components[len(domain_components) - index - 1:])) for index in range(len(domain_components))]
+        is_tld = []
+        node = self.trie.root
+        for component in reversed(domain_components):
+            if not DomainResolver.label_regex.match(component):
+                ## Let tld parse the suffixes that contain components that are not plain lowercase labels
+                for index in range(len(is_tld), len(domain_components)):
+                    is_tld.append(tld.is_tld('.'.join(domain_components[len(domain_components) - index - 1:])))
+                return is_tld
+            if node is not None and node.children is not None and component != node.exception:
+                node = node.children.get(component) or node.children.get('*')
+            else:
+                node = None
+            is_tld.append(node is not None and node.leaf)
+        return is_tld
+
+    def __subdomains(self, domain):
+        domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+        is_tld = self.__get_tld_suffixes(domain_components)
+        valid_domains = set()
+        for index in range(len(domain_components)):
+            if not is_tld[len(domain_components) - index - 1]:
+                d = '.'.join(domain_components[index:])
+                valid_domains.add(self.duplicate_domains.get(d, d))
+        return tuple(sorted(valid_domains))
+
+    def cache_info(self):
+        return self.subdomains.cache_info()
+
+@run_once
+def get_domain_resolver():
+    return DomainResolver()
+
 def subdomains(domain):
     """
     Given an email address, returns a list with the domains and subdomains.
@@ -600,15 +1460,7 @@ def subdomains(domain):
     [u'iesl.cs.umass.edu', u'cs.umass.edu', u'umass.edu']
     """
 
-    duplicate_domains: dict = load_duplicate_domains()
-    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
-    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
-    valid_domains = set()
-    for d in domains:
-        if not tld.is_tld(d):
-            valid_domains.add(duplicate_domains.get(d, d))
-
-    return sorted(valid_domains)
+    return list(get_domain_resolver().subdomains(domain))
 
 def get_paperhash(first_author, title):
     """
@@ -688,23 +1540,26 @@ def replace_members_with_ids(client, group):
         )
         return client.get_group(group.id)
 
-def concurrent_get(client, get_function, **params):
+def concurrent_get(client, get_function, scheduler=None, **params):
     """
     Given a function that takes a single parameter, returns a list of results.
 
     :param client: Client used to make requests
     :param get_function: Function that takes a that performs the request
     :type get_function: function
+    :param scheduler: scheduler that limits the number of concurrent requests, by default the scheduler shared by the whole process.
+    :type scheduler: RequestScheduler, optional
     :param params: Parameters to pass to the get_function
     :type params: dict
 
     :return: List of results
     :rtype: list
     """
-    max_workers = min(cpu_count() - 1, 6)
 
     if (params.get('limit') or float('inf')) <= client.limit:
         docs = get_function(**params)
+        if params.get('decode_stream') and not params.get('with_count'):
+            return list(docs)
         return docs
     else:
         get_count_params = params.copy()
@@ -719,7 +1574,7 @@ def concurrent_get(client, get_function, **params):
     limit = params.get('limit')
     if (limit or client.limit) > client.limit:
         params.pop('limit')
-    docs = get_function(**params)
+    docs = list(get_function(**params))
 
     offset = params.get('offset') or 0
 
@@ -735,23 +1590,114 @@ def concurrent_get(client, get_function, **params):
 
     offset_list = list(range(start, end, client.limit))
 
-    futures = []
-    gathering_responses = tqdm(total=len(offset_list), desc='Gathering Responses')
+    params_list = []
+    for count, offset in enumerate(offset_list):
+        offset_params = dict(params, offset=offset)
+        if (count + 1) == len(offset_list) and (end - offset) > 0:
+            offset_params['limit'] = end - offset
+        params_list.append(offset_params)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for count, offset in enumerate(offset_list):
-            params['offset'] = offset
-            if (count + 1) == len(offset_list) and (end - offset) > 0:
-                params['limit'] = end - offset
-            futures.append(executor.submit(get_function, **params))
+    scheduler = scheduler or request_scheduler
+    for batch in scheduler.map(lambda offset_params: list(get_function(**offset_params)), params_list, endpoint=get_function.__name__):
+        docs.extend(batch)
 
-        for future in futures:
-            gathering_responses.update(1)
-            docs.extend(future.result())
+    return docs
 
-        gathering_responses.close()
+class JSONArrayDecoder:
+    """
+    Incrementally decodes the array stored in one of the keys of a JSON object, yielding each element as soon as it is decoded, so the
+    whole response doesn't need to be loaded in memory. The values of the other keys of the object are skipped.
 
-        return docs
+    The functions that return all the results in a list, like :func:`tools.concurrent_get` and the get_all methods of the client, only
+    avoid keeping the raw response and its parsed JSON at the same time, the memory benefit of decoding one element at a time applies
+    when the generator returned by a get method is iterated directly.
+
+    Example:
+
+    >>> list(JSONArrayDecoder([b'{"edges": [{"id": "1"},', b' {"id": "2"}], "count": 2}'], 'edges'))
+    [{'id': '1'}, {'id': '2'}]
+
+    :param chunks: iterable of bytes or str chunks, for example `response.iter_content(chunk_size=65536)`
+    :type chunks: iterable
+    :param key: key of the array to decode
+    :type key: str
+    """
+    whitespace_regex = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, chunks, key):
+        self.chunks = iter(chunks)
+        self.key = key
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+        self.json_decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def __read(self):
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.exhausted = True
+            self.buffer += self.text_decoder.decode(b'', final=True)
+            return False
+        if self.position > len(self.buffer) // 2:
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        self.buffer += self.text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def __next_char(self):
+        while True:
+            self.position = JSONArrayDecoder.whitespace_regex.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.__read():
+                raise ValueError('Unexpected end of JSON stream')
+
+    def __expect(self, chars):
+        char = self.__next_char()
+        if char not in chars:
+            raise ValueError(f'Expected {chars} at position {self.position} of JSON stream, found {char}')
+        self.position += 1
+        return char
+
+    def __decode_value(self):
+        self.__next_char()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+                ## a number at the end of the buffer could continue in the next chunk
+                if end < len(self.buffer) or self.exhausted or not self.__read():
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                ## the value is parsed again from its start, reading at least as much as is already buffered keeps a value that spans
+                ## many chunks linear instead of parsing it once per chunk
+                required = 2 * (len(self.buffer) - self.position)
+                if not self.__read():
+                    raise
+                while len(self.buffer) - self.position < required and self.__read():
+                    pass
+
+    def __iter__(self):
+        self.__expect('{')
+        if self.__next_char() == '}':
+            return
+        while True:
+            name = self.__decode_value()
+            self.__expect(':')
+            if name == self.key:
+                self.__expect('[')
+                if self.__next_char() == ']':
+                    self.position += 1
+                else:
+                    while True:
+                        yield self.__decode_value()
+                        if self.__expect(',]') == ']':
+                            break
+            else:
+                self.__decode_value()
+            if self.__expect(',}') == '}':
+                return
 
 class iterget:
     """
@@ -880,6 +1826,118 @@ class efficient_iterget:
     next = __next__
 
 
+class prefetch_iterget:
+    """
+    This class creates an iterator from a getter method that returns a list, like :class:`tools.efficient_iterget`, but the following
+    pages are requested in a background thread while the current page is being consumed, so the network latency and the decoding of the
+    objects overlap with the work done by the caller.
+
+    At most `prefetch` pages are kept in memory ahead of the caller, the background thread waits until the caller consumes them.
+
+    :param get_function: Any of the getter methods that accept the `limit` parameter
+    :type get_function: function
+    :param desc: Description of the progress bar, only shown when the cursor pagination is used
+    :type desc: str, optional
+    :param prefetch: Maximum number of pages fetched ahead of the caller
+    :type prefetch: int, optional
+    :param paginate: 'after' to paginate with the id of the last object of the page or 'offset' to paginate with offsets, for getters that don't support cursors
+    :type paginate: str, optional
+    :param params: Dictionary containing parameters for the corresponding method. Refer to the passed method documentation for details
+    :type params: dict
+    """
+    def __init__(self, get_function, desc='Gathering Responses', prefetch=2, paginate='after', **params):
+        self.obj_index = 0
+        self.finished = False
+        self.gathering_responses = None
+
+        self.params = params
+        if paginate == 'after':
+            self.params.update({
+                'with_count': True,
+                'sort': params.get('sort') or 'id',
+                'limit': params.get('limit') or 1000
+            })
+            self.current_batch, total = get_function(**self.params)
+            self.params['with_count'] = False
+            self.gathering_responses = tqdm(total=total, desc=desc) if total > self.params['limit'] else None
+        else:
+            self.params.update({
+                'offset': 0,
+                'limit': params.get('limit') or 1000
+            })
+            self.current_batch = get_function(**self.params)
+
+        self.current_batch = list(self.current_batch or [])
+        self.pages = queue.Queue(maxsize=max(prefetch, 1))
+        self.closed = threading.Event()
+
+        if self.current_batch:
+            ## The thread must not hold a reference to the iterator so it can be closed when the iterator is garbage collected
+            thread = threading.Thread(target=self.__fetch_pages, args=(get_function, dict(self.params), paginate, self.current_batch, self.pages, self.closed), daemon=True)
+            thread.start()
+        else:
+            self.finished = True
+
+    @staticmethod
+    def __fetch_pages(get_function, params, paginate, batch, pages, closed):
+
+        def put(item):
+            while not closed.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            while batch:
+                if paginate == 'after':
+                    params['after'] = batch[-1].id
+                else:
+                    params['offset'] += params['limit']
+                batch = list(get_function(**params) or [])
+                if not put(batch):
+                    return
+        except Exception as e:
+            put(e)
+
+    def close(self):
+        self.finished = True
+        self.closed.set()
+        if self.gathering_responses:
+            self.gathering_responses.close()
+            self.gathering_responses = None
+
+    def __del__(self):
+        self.closed.set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.obj_index == len(self.current_batch):
+            if self.finished:
+                raise StopIteration
+            next_batch = self.pages.get()
+            if isinstance(next_batch, Exception):
+                self.close()
+                raise next_batch
+            if not next_batch:
+                self.close()
+                raise StopIteration
+            self.current_batch = next_batch
+            self.obj_index = 0
+
+        next_obj = self.current_batch[self.obj_index]
+        self.obj_index += 1
+        if self.gathering_responses:
+            self.gathering_responses.update(1)
+        return next_obj
+
+    next = __next__
+
+
 def iterget_messages(client, to = None, subject = None, status = None):
     """
     Returns an iterator over Messages ignoring API limit.
@@ -932,7 +1990,7 @@ def iterget_tags(client, id = None, invitation = None, forum = None, signature =
     if tag is not None:
         params['tag'] = tag
 
-    return iterget(client.get_tags, **params)
+    return prefetch_iterget(client.get_tags, paginate='offset', **params)
 
 def iterget_edges (client,
                    invitation = None,
@@ -954,7 +2012,7 @@ def iterget_edges (client,
         params['limit'] = limit
     if trash == True:
         params['trash']=True
-    return iterget(client.get_edges, **params)
+    return prefetch_iterget(client.get_edges, paginate='offset', **params)
 
 def iterget_grouped_edges(
         client,
@@ -1063,7 +2121,7 @@ def iterget_notes(client,
         params['details'] = details
     params['sort'] = sort
 
-    return efficient_iterget(client.get_notes, desc='Getting Notes', **params)
+    return prefetch_iterget(client.get_notes, desc='Getting Notes', **params)
 
 def iterget_references(client, referent = None, invitation = None, mintcdate = None):
     """
@@ -1170,7 +2228,7 @@ def iterget_invitations(client, id=None, ids=None, invitee=None, regex=None, tag
         params['sort'] = sort
 
 
-    return efficient_iterget(client.get_invitations, desc='Getting Invitations', **params)
+    return prefetch_iterget(client.get_invitations, desc='Getting Invitations', **params)
 
 def iterget_groups(client, id = None, regex = None, member = None, host = None, signatory = None, web = None):
     """
@@ -1209,7 +2267,7 @@ def iterget_groups(client, id = None, regex = None, member = None, host = None,
     if web is not None:
         params['web'] = web
 
-    return efficient_iterget(client.get_groups, desc='Getting Groups', **params)
+    return prefetch_iterget(client.get_groups, desc='Getting Groups', **params)
 
 def timestamp_GMT(year, month, day, hour=0, minute=0, second=0):
     """
@@ -1253,6 +2311,51 @@ def datetime_millis(dt):
 
     return dt
 
+def get_recruitment_message(user, first, hash_seed, recruit_reviewers_id, recruit_message, contact_info='info@openreview.net'):
+    """
+    Returns the recruitment message of a user with the links to accept or decline the recruitment invitation, see :func:`recruit_reviewer`
+
+    :param user: User to whom the e-mail will be sent
+    :type user: str
+    :param first: First name of the person to whom e-mail will be sent
+    :type first: str
+    :param hash_seed: a random number for seeding the hash.
+    :type hash_seed: int
+    :param recruit_reviewers_id: id of the recruitment invitation
+    :type recruit_reviewers_id: str
+    :param recruit_message: a formattable string containing the following string variables: (name, accept_url, decline_url)
+    :type recruit_message: str
+    :param contact_info: The information used to contact support for questions
+    :type contact_info: str
+
+    :return: The personalized message
+    :rtype: str
+    """
+    # the HMAC.new() function only accepts bytestrings, not unicode.
+    # In Python 3, all strings are treated as unicode by default, so we must call encode on
+    # these unicode strings to convert them to bytestrings. This behavior is the same in
+    # Python 2, because we imported unicode_literals from __future__.
+    hashkey = HMAC.new(hash_seed.encode('utf-8'), msg=user.encode('utf-8'), digestmod=SHA256).hexdigest()
+    baseurl = 'https://openreview.net' #Always pointing to the live site so we don't send more invitations with localhost
+
+    # build the URL to send in the message
+    url = '{baseurl}/invitation?id={recruitment_inv}&user={user}&key={hashkey}'.format(
+        baseurl = baseurl,
+        recruitment_inv = recruit_reviewers_id,
+        user = urlparse.quote(user),
+        hashkey = hashkey
+    )
+
+    # format the message defined above
+    personalized_message = recruit_message.replace("{{fullname}}", first) if first else recruit_message
+    personalized_message = personalized_message.replace("{{accept_url}}", url + "&response=Yes")
+    personalized_message = personalized_message.replace("{{decline_url}}", url + "&response=No")
+    personalized_message = personalized_message.replace("{{invitation_url}}", url)
+    personalized_message = personalized_message.replace("{{contact_info}}", contact_info)
+
+    personalized_message.format()
+    return personalized_message
+
 def recruit_reviewer(client, user, first,
     hash_seed,
     recruit_reviewers_id,
@@ -1290,29 +2393,7 @@ def recruit_reviewer(client, user, first,
     :type baseurl: str, optional
     """
 
-    # the HMAC.new() function only accepts bytestrings, not unicode.
-    # In Python 3, all strings are treated as unicode by default, so we must call encode on
-    # these unicode strings to convert them to bytestrings. This behavior is the same in
-    # Python 2, because we imported unicode_literals from __future__.
-    hashkey = HMAC.new(hash_seed.encode('utf-8'), msg=user.encode('utf-8'), digestmod=SHA256).hexdigest()
-    baseurl = 'https://openreview.net' #Always pointing to the live site so we don't send more invitations with localhost
-
-    # build the URL to send in the message
-    url = '{baseurl}/invitation?id={recruitment_inv}&user={user}&key={hashkey}'.format(
-        baseurl = baseurl if baseurl else client.baseurl,
-        recruitment_inv = recruit_reviewers_id,
-        user = urlparse.quote(user),
-        hashkey = hashkey
-    )
-
-    # format the message defined above
-    personalized_message = recruit_message.replace("{{fullname}}", first) if first else recruit_message
-    personalized_message = personalized_message.replace("{{accept_url}}", url + "&response=Yes")
-    personalized_message = personalized_message.replace("{{decline_url}}", url + "&response=No")
-    personalized_message = personalized_message.replace("{{invitation_url}}", url)
-    personalized_message = personalized_message.replace("{{contact_info}}", contact_info)
-
-    personalized_message.format()
+    personalized_message = get_recruitment_message(user, first, hash_seed, recruit_reviewers_id, recruit_message, contact_info)
 
     try:
         client.add_members_to_group(reviewers_invited_id, [user])
@@ -1377,28 +2458,121 @@ def get_all_venues(client):
     """
     return client.get_group("host").members
 
-def info_function_builder(policy_function):
+class ProfileInfoCache:
+    """
+    Thread safe LRU cache of the profile information computed by the info functions built with :func:`tools.info_function_builder`.
+
+    Entries are keyed by the profile id and modification date, the policy function and the parameters passed to it, so a profile
+    that was updated is computed again. Profiles without a modification date are not cached. The number of publications and resolved relations are also part of the key because the same
+    profile can be loaded with or without them.
+
+    :param maxsize: maximum number of entries to keep, the least recently used entries are evicted first
+    :type maxsize: int, optional
+    """
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def __copy(info):
+        ## the sets and lists of the information are copied, so a caller that modifies them doesn't change the cached entry
+        return { key: copy.copy(value) for key, value in info.items() }
+
+    @staticmethod
+    def get_key(profile, policy_function, n_years=None, submission_venueid=None):
+        content = profile.content or {}
+        resolved_relations = sum(1 for relation in content.get('relations', []) if 'profile_id' in relation)
+        return (profile.id, profile.tmdate, policy_function, n_years, submission_venueid, len(content.get('publications', [])), resolved_relations)
+
+    def get(self, key):
+        with self.__lock:
+            info = self.__entries.get(key)
+            if info is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            return ProfileInfoCache.__copy(info)
+
+    def put(self, key, info):
+        with self.__lock:
+            self.__entries[key] = ProfileInfoCache.__copy(info)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns the cache counters
+
+        :return: Dictionary with the number of hits, misses and entries of the cache
+        :rtype: dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.__entries),
+            'maxsize': self.maxsize
+        }
+
+profile_info_cache = ProfileInfoCache()
+
+def info_function_builder(policy_function, cache=profile_info_cache):
+    """
+    Builds a function that gets the conflict information of a Profile using the passed policy function, expanding the domains to
+    their subdomains and removing common email domains.
+
+    :param policy_function: function that gets the domains, emails, relations and publications of a Profile, for example :func:`tools.get_profile_info`
+    :type policy_function: function
+    :param cache: cache shared between the built functions, by default the results are shared in the whole process. If None, the information is always computed.
+    :type cache: ProfileInfoCache, optional
+
+    :return: Function that receives a Profile and returns its conflict information
+    :rtype: function
+    """
+    common_domains = ['gmail.com', 'qq.com', '126.com', '163.com',
+                'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com']
+    argspec = inspect.getfullargspec(policy_function)
+    with_submission_venueid = 'submission_venueid' in argspec.args
+
     def inner(profile, n_years=None, submission_venueid=None):
-        common_domains = ['gmail.com', 'qq.com', '126.com', '163.com',
-                    'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com']
-        argspec = inspect.getfullargspec(policy_function)
-        if 'submission_venueid' in argspec.args:
+        key = None
+        ## Profiles without modification date can't be invalidated, e.g. profiles created locally for emails
+        if cache is not None and profile.tmdate is not None:
+            key = ProfileInfoCache.get_key(profile, policy_function, n_years, submission_venueid if with_submission_venueid else None)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        if with_submission_venueid:
             result = policy_function(profile, n_years, submission_venueid)
         else:
             result = policy_function(profile, n_years)
+        domain_resolver = get_domain_resolver()
         domains = set()
-        subdomains_dict = {}
         for domain in result['domains']:
-            if domain not in subdomains_dict:
-                subdomains = openreview.tools.subdomains(domain)
-                subdomains_dict[domain] = subdomains
-            domains.update(subdomains_dict[domain])
+            domains.update(domain_resolver.subdomains(domain))
 
         # Filter common domains
         for common_domain in common_domains:
             domains.discard(common_domain)
 
         result['domains'] = list(domains)
+
+        if key is not None:
+            cache.put(key, result)
         return result
     return inner
 
@@ -1454,6 +2628,105 @@ def get_conflicts(author_profiles, user_profile, policy='default', n_years=None)
 
     return list(conflicts)
 
+class ConflictIndex:
+    """
+    Inverted index over the profile information of a committee, used to find the users that are in conflict with a set of authors without
+    comparing every author with every user.
+
+    Profile ids, relations, domains and publications are interned into integer tokens once per profile. Each token points to the positions
+    of the users that contain it, so the users in conflict with an author are found by looking up the author tokens in the index. The
+    conflict rules are the same ones used by :func:`tools.get_conflicts`, excluding emails.
+
+    Example:
+
+    >>> index = ConflictIndex()
+    >>> index.add_user(info_function(reviewer_profile))
+    >>> index.get_conflicts(info_function(author_profile))
+    {0}
+    """
+    PERSON = 0
+    RELATION = 1
+    DOMAIN = 2
+    PUBLICATION = 3
+
+    def __init__(self):
+        self.user_ids = []
+        self.token_ids = {}
+        self.postings = []
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def __intern(self, token):
+        token_id = self.token_ids.get(token)
+        if token_id is None:
+            token_id = len(self.postings)
+            self.token_ids[token] = token_id
+            self.postings.append([])
+        return token_id
+
+    @staticmethod
+    def __user_tokens(info):
+        yield (ConflictIndex.PERSON, info['id'])
+        for relation in info['relations']:
+            yield (ConflictIndex.RELATION, relation)
+        for domain in info['domains']:
+            yield (ConflictIndex.DOMAIN, domain)
+        for publication in info['publications']:
+            yield (ConflictIndex.PUBLICATION, publication)
+
+    @staticmethod
+    def __author_tokens(info):
+        yield (ConflictIndex.PERSON, info['id'])
+        for relation in info['relations']:
+            yield (ConflictIndex.PERSON, relation)
+        yield (ConflictIndex.RELATION, info['id'])
+        for domain in info['domains']:
+            yield (ConflictIndex.DOMAIN, domain)
+        for publication in info['publications']:
+            yield (ConflictIndex.PUBLICATION, publication)
+
+    def add_user(self, user_info, transferred_infos=None):
+        """
+        Adds a user to the index
+
+        :param user_info: profile information returned by an info function, see :func:`tools.info_function_builder`
+        :type user_info: dict
+        :param transferred_infos: profile information of other users whose conflicts are transferred to this user, for example the SACs assigned to an AC
+        :type transferred_infos: list[dict], optional
+
+        :return: Position of the user in the index
+        :rtype: int
+        """
+        position = len(self.user_ids)
+        self.user_ids.append(user_info['id'])
+
+        token_ids = set()
+        for info in [user_info] + (transferred_infos or []):
+            token_ids.update(self.__intern(token) for token in self.__user_tokens(info))
+
+        for token_id in token_ids:
+            self.postings[token_id].append(position)
+
+        return position
+
+    def get_conflicts(self, author_info):
+        """
+        Gets the users that are in conflict with an author
+
+        :param author_info: profile information returned by an info function, see :func:`tools.info_function_builder`
+        :type author_info: dict
+
+        :return: Positions of the users in conflict with the author
+        :rtype: set[int]
+        """
+        positions = set()
+        for token in self.__author_tokens(author_info):
+            token_id = self.token_ids.get(token)
+            if token_id is not None:
+                positions.update(self.postings[token_id])
+        return positions
+
 def get_profile_info(profile, n_years=None):
     """
     Gets all the domains, emails, relations associated with a Profile
@@ -1740,23 +3013,479 @@ def filter_relations_by_year(relations, cut_off_year, only_relations=None):
 
     return filtered_relations
 
-def post_bulk_edges(client, edges, batch_size = 50000):
-    num_edges = len(edges)
-    result = []
-    for i in tqdm(range(0, num_edges, batch_size), total=(num_edges // batch_size + 1)):
-        end = min(i + batch_size, num_edges)
-        batch = client.post_edges(edges[i:end])
-        result += batch
-    return result
-
-def post_bulk_tags(client, tags, batch_size = 50000):
-    num_tags = len(tags)
-    result = []
-    for i in tqdm(range(0, num_tags, batch_size), total=(num_tags // batch_size + 1)):
-        end = min(i + batch_size, num_tags)
-        batch = client.post_tags(tags[i:end])
-        result += batch
-    return result
+class BulkUploader:
+    """
+    Posts a long list of Edges or Tags in batches that are sent concurrently. A batch that failed before reaching the server, because the
+    connection could not be opened or the server was rate limiting, is retried up to `max_retries` times. Any other error fails the batch
+    right away, since the server may have saved it already.
+
+    When a checkpoint file is passed, the batches acknowledged by the server are saved in it, so running the same upload again after an
+    interruption only posts the missing batches. The checkpoint is ignored if the items or the batch size changed, and it is removed once
+    all the batches are posted. The batches that failed after reaching the server are also saved, and an upload with such batches is
+    not resumed since posting them again could create duplicates.
+
+    :param post_function: function that posts a batch and returns the posted items, e.g. client.post_edges
+    :type post_function: function
+    :param batch_size: number of items sent per request
+    :type batch_size: int, optional
+    :param max_concurrent: maximum number of batches posted at the same time
+    :type max_concurrent: int, optional
+    :param max_retries: number of times a batch that did not reach the server is retried
+    :type max_retries: int, optional
+    :param checkpoint_file: path of the file used to resume an interrupted upload
+    :type checkpoint_file: str, optional
+    :param unit: name of the items shown in the progress bar
+    :type unit: str, optional
+    :param scheduler: scheduler that limits the number of concurrent requests, by default the scheduler shared by the whole process.
+    :type scheduler: RequestScheduler, optional
+    """
+    def __init__(self, post_function, batch_size=50000, max_concurrent=4, max_retries=3, checkpoint_file=None, unit='items', scheduler=None):
+        self.post_function = post_function
+        self.batch_size = batch_size
+        self.max_concurrent = max_concurrent
+        self.max_retries = max_retries
+        self.checkpoint_file = checkpoint_file
+        self.unit = unit
+        self.scheduler = scheduler or request_scheduler
+
+    @staticmethod
+    def get_checkpoint_file(name, baseurl=None, directory=None):
+        """
+        Returns a checkpoint path for the passed name, e.g. the id of the invitation of the Edges, and the baseurl of the client, so the
+        uploads of the same invitation to different servers don't share a checkpoint. By default the file is in the temporary directory.
+        """
+        key = f'{baseurl}-{name}' if baseurl else name
+        return os.path.join(directory or tempfile.gettempdir(), 'openreview-' + re.sub(r'[^\w.-]', '_', key) + '.checkpoint.json')
+
+    @staticmethod
+    def is_retryable(error):
+        """
+        Returns True if the batch that failed with the passed error did not reach the server and can be posted again without creating
+        duplicates: the connection could not be opened, or the server answered 429, or 503 with a Retry-After header.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError):
+            reason = error.args[0] if error.args else None
+            reason = getattr(reason, 'reason', reason)
+            return isinstance(reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError))
+        if isinstance(error, openreview.OpenReviewException):
+            status = getattr(error, 'status', None)
+            return status == 429 or (status == 503 and bool(getattr(error, 'retry_after', None)))
+        return False
+
+    def get_fingerprint(self, items):
+        """
+        Returns the fingerprint that identifies the upload of the items in the checkpoint file, a digest of all the serialized items
+        computed one batch at a time.
+        """
+        digest = hashlib.sha1(f'{len(items)}:{self.batch_size}'.encode())
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            serialized = batch.to_json() if hasattr(batch, 'to_json') else [item.to_json() for item in batch]
+            digest.update(json.dumps(serialized, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def __load_checkpoint(self, fingerprint):
+        ## Returns the acknowledged batches and the batches that failed after reaching the server in a previous run of the same upload
+        if not self.checkpoint_file or not fingerprint or not os.path.exists(self.checkpoint_file):
+            return set(), set()
+        try:
+            with open(self.checkpoint_file) as file_handle:
+                checkpoint = json.load(file_handle)
+        except (OSError, ValueError):
+            return set(), set()
+        if checkpoint.get('fingerprint') != fingerprint:
+            return set(), set()
+        return set(checkpoint.get('acknowledged', [])), set(checkpoint.get('failed', []))
+
+    def __save_checkpoint(self, fingerprint, acknowledged, failed):
+        temp_file = self.checkpoint_file + '.tmp'
+        with open(temp_file, 'w') as file_handle:
+            json.dump({ 'fingerprint': fingerprint, 'acknowledged': sorted(acknowledged), 'failed': sorted(failed) }, file_handle)
+        os.replace(temp_file, self.checkpoint_file)
+
+    def __get_acknowledged(self, fingerprint):
+        acknowledged, failed = self.__load_checkpoint(fingerprint)
+        if failed:
+            raise openreview.OpenReviewException(f'The upload in {self.checkpoint_file} can not be resumed, {len(failed)} batches failed after reaching the server and may have been saved. ' +
+                f'Delete the posted {self.unit} and remove the checkpoint file to start over')
+        return acknowledged
+
+    def can_resume(self, items=None, fingerprint=None):
+        """
+        Returns True if there is a checkpoint of a previous upload of the same items, or of the upload identified by the fingerprint, and
+        none of its batches failed after reaching the server. When it returns False, the posted items should be deleted and the checkpoint
+        removed with :meth:`clear_checkpoint` before uploading again.
+        """
+        if not self.checkpoint_file:
+            return False
+        if fingerprint is None and items is not None:
+            fingerprint = self.get_fingerprint(items)
+        acknowledged, failed = self.__load_checkpoint(fingerprint)
+        return bool(acknowledged) and not failed
+
+    def clear_checkpoint(self):
+        """
+        Removes the checkpoint file, the next upload starts from the first batch
+        """
+        if self.checkpoint_file and os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+    def __post_batch(self, items, index):
+        return self.__post_chunk(items[index * self.batch_size:(index + 1) * self.batch_size], index)
+
+    def __post_chunk(self, batch, index):
+        ## The scheduler retries only the errors where the batch did not reach the server, the others fail the batch
+        return self.scheduler.run(self.post_function, batch, endpoint=getattr(self.post_function, '__name__', None),
+            retry_error=BulkUploader.is_retryable, max_retries=self.max_retries)
+
+    def upload(self, items, return_items=True, fingerprint=None):
+        """
+        Posts the items and returns the posted items in the same order, or their number when return_items is False.
+        The batches acknowledged in a previous run are skipped and their items are not returned.
+
+        :param items: Edges or Tags to post
+        :type items: list or EdgeBatch
+        :param return_items: If False, the posted items are not kept in memory
+        :type return_items: bool, optional
+        :param fingerprint: fingerprint of the items computed with :meth:`get_fingerprint`, to avoid computing it again
+        :type fingerprint: str, optional
+
+        :return: List of posted items or number of posted items
+        :rtype: list or int
+        """
+        num_items = len(items)
+        num_batches = (num_items + self.batch_size - 1) // self.batch_size
+        if self.checkpoint_file and fingerprint is None:
+            fingerprint = self.get_fingerprint(items)
+        acknowledged = self.__get_acknowledged(fingerprint)
+        failed = set()
+        pending = [index for index in range(num_batches) if index not in acknowledged]
+        if acknowledged:
+            print(f'Resuming upload from {self.checkpoint_file}, {len(acknowledged)} of {num_batches} batches already posted')
+
+        batch_length = lambda index: min(self.batch_size, num_items - index * self.batch_size)
+        progress = tqdm(total=num_items, initial=num_items - sum(batch_length(index) for index in pending), unit=self.unit, unit_scale=True)
+        results = {}
+        errors = []
+        posted = 0
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(min(self.max_concurrent, len(pending)), 1)) as executor:
+            futures = { executor.submit(self.__post_batch, items, index): index for index in pending }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as error:
+                    errors.append((index, error))
+                    if not BulkUploader.is_retryable(error):
+                        failed.add(index)
+                        if self.checkpoint_file:
+                            self.__save_checkpoint(fingerprint, acknowledged, failed)
+                    continue
+                acknowledged.add(index)
+                if self.checkpoint_file:
+                    self.__save_checkpoint(fingerprint, acknowledged, failed)
+                posted += len(result)
+                progress.update(batch_length(index))
+                if return_items:
+                    results[index] = result
+        progress.close()
+
+        elapsed = time.monotonic() - start
+        print(f'Posted {posted} {self.unit} in {elapsed:.1f} seconds ({posted / elapsed if elapsed else 0:.0f} {self.unit}/s)')
+
+        if errors:
+            index, error = min(errors, key=lambda e: e[0])
+            message = f'{len(errors)} of {num_batches} batches failed, first failed batch {index}: {error}'
+            if failed:
+                message += f'. {len(failed)} batches failed after reaching the server and may have been saved'
+            elif self.checkpoint_file:
+                message += f'. Run the upload again to resume from {self.checkpoint_file}'
+            raise openreview.OpenReviewException(message)
+
+        if self.checkpoint_file and os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+        if return_items:
+            return [item for index in sorted(results) for item in results[index]]
+        return posted
+
+    def upload_chunks(self, chunks, fingerprint=None):
+        """
+        Posts chunks of items that are produced while the upload runs, e.g. read from a large file, and returns the number of items.
+        Each chunk is posted in a single request and at most `max_concurrent` chunks are kept in memory.
+
+        The checkpoint is only used when a fingerprint that identifies the source of the chunks is passed. The chunks acknowledged in a
+        previous run with the same fingerprint are read but not posted again.
+
+        :param chunks: iterable of lists of items or EdgeBatches
+        :type chunks: iterable
+        :param fingerprint: identifier of the source of the chunks, e.g. a hash of the file
+        :type fingerprint: str, optional
+
+        :return: Number of items in all the chunks
+        :rtype: int
+        """
+        use_checkpoint = bool(self.checkpoint_file and fingerprint)
+        acknowledged = self.__get_acknowledged(fingerprint) if use_checkpoint else set()
+        failed = set()
+        if acknowledged:
+            print(f'Resuming upload from {self.checkpoint_file}, {len(acknowledged)} chunks already posted')
+
+        progress = tqdm(unit=self.unit, unit_scale=True)
+        slots = threading.BoundedSemaphore(self.max_concurrent)
+        lock = threading.Lock()
+        errors = []
+        posted = [0]
+        num_items = 0
+        num_chunks = 0
+        start = time.monotonic()
+
+        def on_done(future, index, length):
+            try:
+                posted_items = future.result()
+            except Exception as error:
+                with lock:
+                    errors.append((index, error))
+                    if not BulkUploader.is_retryable(error):
+                        failed.add(index)
+                        if use_checkpoint:
+                            self.__save_checkpoint(fingerprint, acknowledged, failed)
+            else:
+                with lock:
+                    acknowledged.add(index)
+                    if use_checkpoint:
+                        self.__save_checkpoint(fingerprint, acknowledged, failed)
+                    posted[0] += len(posted_items)
+                    progress.update(length)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=max(self.max_concurrent, 1)) as executor:
+            for index, chunk in enumerate(chunks):
+                num_chunks += 1
+                num_items += len(chunk)
+                if index in acknowledged:
+                    with lock:
+                        progress.update(len(chunk))
+                    continue
+                slots.acquire()
+                future = executor.submit(self.__post_chunk, chunk, index)
+                future.add_done_callback(functools.partial(on_done, index=index, length=len(chunk)))
+        progress.close()
+
+        elapsed = time.monotonic() - start
+        print(f'Posted {posted[0]} {self.unit} in {elapsed:.1f} seconds ({posted[0] / elapsed if elapsed else 0:.0f} {self.unit}/s)')
+
+        if errors:
+            index, error = min(errors, key=lambda e: e[0])
+            message = f'{len(errors)} of {num_chunks} chunks failed, first failed chunk {index}: {error}'
+            if failed:
+                message += f'. {len(failed)} chunks failed after reaching the server and may have been saved'
+            elif use_checkpoint:
+                message += f'. Run the upload again to resume from {self.checkpoint_file}'
+            raise openreview.OpenReviewException(message)
+
+        if use_checkpoint and os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+        return num_items
+
+class BinaryScores:
+    """
+    Columnar representation of a list of scores, like the affinity scores between submissions and users. The heads and tails of the scores
+    are stored once in string tables, and each score is stored as two uint32 indexes into those tables and a float32 value.
+
+    The scores are saved in an uncompressed NumPy .npz file with the arrays `heads`, `tails`, `head_index`, `tail_index` and `score`, so they
+    can be read with numpy.load. When the scores are loaded from a path the columns are memory mapped instead of read.
+
+    Example:
+
+    >>> scores = BinaryScores.from_rows([['paper_id', '~Reviewer_One1', 0.5]])
+    >>> scores.save('scores.npz')
+    >>> scores = BinaryScores.load('scores.npz')
+
+    :param heads: string table of the heads
+    :type heads: list[str]
+    :param tails: string table of the tails
+    :type tails: list[str]
+    :param head_index: index of the head of each score
+    :type head_index: numpy.ndarray
+    :param tail_index: index of the tail of each score
+    :type tail_index: numpy.ndarray
+    :param score: value of each score
+    :type score: numpy.ndarray
+    """
+    COLUMNS = ['heads', 'tails', 'head_index', 'tail_index', 'score']
+    MAGIC = b'PK\x03\x04'
+
+    def __init__(self, heads, tails, head_index, tail_index, score):
+        self.heads = heads
+        self.tails = tails
+        self.head_index = head_index
+        self.tail_index = tail_index
+        self.score = score
+
+    def __len__(self):
+        return len(self.score)
+
+    def __iter__(self):
+        for head, tail, score in zip(self.head_index, self.tail_index, self.score.tolist()):
+            yield [self.heads[head], self.tails[tail], score]
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds the scores from rows of head, tail and score, e.g. the rows of a score CSV file
+
+        :param rows: iterable of [head, tail, score]
+        :type rows: iterable
+
+        :return: The scores
+        :rtype: BinaryScores
+        """
+        heads = {}
+        tails = {}
+        head_index = array.array('I')
+        tail_index = array.array('I')
+        score = array.array('f')
+        for row in rows:
+            if not row:
+                continue
+            head_index.append(heads.setdefault(row[0], len(heads)))
+            tail_index.append(tails.setdefault(row[1], len(tails)))
+            score.append(float(row[2]))
+        return cls(list(heads), list(tails), np.frombuffer(head_index, dtype=np.uint32), np.frombuffer(tail_index, dtype=np.uint32), np.frombuffer(score, dtype=np.float32))
+
+    def save(self, file):
+        """
+        Saves the scores in an uncompressed .npz file
+
+        :param file: path or file object where the scores are written
+        :type file: str or file
+        """
+        if isinstance(file, str):
+            with open(file, 'wb') as file_handle:
+                return self.save(file_handle)
+        np.savez(
+            file,
+            heads=np.array(self.heads, dtype=str),
+            tails=np.array(self.tails, dtype=str),
+            head_index=np.asarray(self.head_index, dtype=np.uint32),
+            tail_index=np.asarray(self.tail_index, dtype=np.uint32),
+            score=np.asarray(self.score, dtype=np.float32)
+        )
+
+    @staticmethod
+    def is_binary(source):
+        """
+        Returns True if the path, bytes or file object contain binary scores instead of a CSV
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source[:4]) == BinaryScores.MAGIC
+        if isinstance(source, str):
+            with open(source, 'rb') as file_handle:
+                return file_handle.read(4) == BinaryScores.MAGIC
+        position = source.tell()
+        prefix = source.read(4)
+        source.seek(position)
+        return prefix == BinaryScores.MAGIC
+
+    @staticmethod
+    def __map_columns(path):
+        ## The members of an uncompressed .npz are .npy files stored as is, so each column can be mapped at its offset in the zip file
+        columns = {}
+        with zipfile.ZipFile(path) as archive, open(path, 'rb') as file_handle:
+            for info in archive.infolist():
+                name = info.filename[:-len('.npy')]
+                if name not in BinaryScores.COLUMNS:
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    return None
+                file_handle.seek(info.header_offset)
+                local_header = file_handle.read(30)
+                file_handle.seek(info.header_offset + 30 + int.from_bytes(local_header[26:28], 'little') + int.from_bytes(local_header[28:30], 'little'))
+                version = np.lib.format.read_magic(file_handle)
+                if version not in [(1, 0), (2, 0)]:
+                    return None
+                read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+                shape, fortran_order, dtype = read_header(file_handle)
+                if dtype.hasobject or fortran_order:
+                    return None
+                columns[name] = np.memmap(path, dtype=dtype, mode='r', offset=file_handle.tell(), shape=shape)
+        return columns
+
+    @classmethod
+    def load(cls, source, mmap=True):
+        """
+        Loads the scores saved with :meth:`save`
+
+        :param source: path, bytes or file object of the .npz file
+        :type source: str or bytes or file
+        :param mmap: If True and the source is a path, the columns are memory mapped instead of read
+        :type mmap: bool, optional
+
+        :return: The scores
+        :rtype: BinaryScores
+        """
+        columns = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        elif isinstance(source, str) and mmap:
+            columns = BinaryScores.__map_columns(source)
+        if columns is None:
+            with np.load(source) as npz:
+                columns = { name: npz[name] for name in BinaryScores.COLUMNS }
+        missing = [name for name in BinaryScores.COLUMNS if name not in columns]
+        if missing:
+            raise openreview.OpenReviewException(f'Invalid binary scores, missing columns: {missing}')
+        return cls(columns['heads'].tolist(), columns['tails'].tolist(), columns['head_index'], columns['tail_index'], columns['score'])
+
+def post_bulk_edges(client, edges, batch_size = 50000, return_edges = True, max_concurrent = 4, checkpoint_file = None):
+    """
+    Posts a list of Edges or an :class:`openreview.api.EdgeBatch` in batches of batch_size Edges, see :class:`BulkUploader`
+
+    :param client: Client used to post the Edges
+    :type client: Client
+    :param edges: Edges to post
+    :type edges: list[Edge] or EdgeBatch
+    :param batch_size: Number of Edges sent per request
+    :type batch_size: int, optional
+    :param return_edges: If False, the posted Edges are not kept in memory and only their number is returned
+    :type return_edges: bool, optional
+    :param max_concurrent: Maximum number of batches posted at the same time
+    :type max_concurrent: int, optional
+    :param checkpoint_file: Path of the file used to resume an interrupted upload
+    :type checkpoint_file: str, optional
+
+    :return: List of posted Edges, or the number of posted Edges when return_edges is False
+    :rtype: list[Edge] or int
+    """
+    uploader = BulkUploader(client.post_edges, batch_size=batch_size, max_concurrent=max_concurrent, checkpoint_file=checkpoint_file, unit='edges')
+    return uploader.upload(edges, return_items=return_edges)
+
+def post_bulk_tags(client, tags, batch_size = 50000, max_concurrent = 4, checkpoint_file = None):
+    """
+    Posts a list of Tags in batches of batch_size Tags, see :class:`BulkUploader`
+
+    :param client: Client used to post the Tags
+    :type client: Client
+    :param tags: Tags to post
+    :type tags: list[Tag]
+    :param batch_size: Number of Tags sent per request
+    :type batch_size: int, optional
+    :param max_concurrent: Maximum number of batches posted at the same time
+    :type max_concurrent: int, optional
+    :param checkpoint_file: Path of the file used to resume an interrupted upload
+    :type checkpoint_file: str, optional
+
+    :return: List of posted Tags
+    :rtype: list[Tag]
+    """
+    uploader = BulkUploader(client.post_tags, batch_size=batch_size, max_concurrent=max_concurrent, checkpoint_file=checkpoint_file, unit='tags')
+    return uploader.upload(tags)
 
 def overwrite_pdf(client, note_id, file_path):
     """
@@ -1948,6 +3677,8 @@ def get_invitation_source(invitation, domain):
     rebuttal_name = domain.content.get('rebuttal_name', {}).get('value', None)
 
     source = invitation.content.get('source', { 'value': { 'venueid': submission_venue_id } }).get('value', { 'venueid': submission_venue_id }) if invitation.content else { 'venueid': submission_venue_id }
+    ## the source is modified below, do not change the content of the invitation
+    source = copy.deepcopy(source)
 
     ## Deprecated, user source as dictionary
     if isinstance(source, str):
@@ -1994,71 +3725,171 @@ def should_match_invitation_source(client, invitation, submission, note=None):
 
     domain = client.get_group(submission.domain)
 
-    source = get_invitation_source(invitation, domain)
+    return InvitationSource(invitation, domain).matches(client, submission, note)
 
-    if submission.content['venueid']['value'] not in source.get('venueid', []):
-        return False
+class InvitationSource:
+    """
+    Source of an invitation of invitations compiled once into a predicate, see :func:`get_invitation_source`. The matches method checks
+    the same conditions as :func:`should_match_invitation_source` without rebuilding the source or getting the domain group again.
 
-    if 'reply_to' in source and not note:
-        return False
-    
-    if 'reply_to' in source and note and not note.invitations[0].endswith(f'/-/{source.get("reply_to")}'):
-        return False
-    
-    if 'reply_to' not in source and note:
-        return False
+    :param invitation: invitation of invitations, e.g. Venue/-/Official_Review
+    :type invitation: Invitation
+    :param domain: domain group of the venue
+    :type domain: Group
+    """
+    def __init__(self, invitation, domain):
+        self.invitation = invitation
+        self.domain = domain
 
-    if 'readers' in source and not set(source['readers']).issubset(set(submission.readers)):
-        return False
+        source = get_invitation_source(invitation, domain)
+        self.venueid = source.get('venueid', [])
+        self.reply_to = f'/-/{source["reply_to"]}' if 'reply_to' in source else None
+        self.readers = set(source['readers']) if 'readers' in source else None
+        self.content = source.get('content', {})
+        self.with_decision_accept = source.get('with_decision_accept')
 
-    if 'content' in source:
-        for key, value in source.get('content', {}).items():
-            if value != submission.content.get(key, {}).get('value'):
-                return False
+        content_keys = invitation.edit.get('content', {}).keys() if invitation.edit else []
+        self.creates_invitations = bool(content_keys) and 'noteId' in content_keys and 'noteNumber' in content_keys and not any(key in content_keys for key in ['withdrawalId', 'deskRejectionId', 'noteReaders'])
+        self.replyto = 'replyto' in content_keys
 
-    if 'with_decision_accept' in source:
-        with_decision_accept = source.get('with_decision_accept')
-        print('checking decision accept for submission', submission.id, 'with_decision_accept', with_decision_accept)
+    def __has_decision_accept(self, client, submission):
+        domain = self.domain
+        print('checking decision accept for submission', submission.id, 'with_decision_accept', self.with_decision_accept)
         decision_invitation_id = f'{domain.id}/{domain.content["submission_name"]["value"]}{submission.number}/-/{domain.content.get("decision_name", {}).get("value", "Decision")}'
-        replies = submission.details.get('replies', submission.details.get('directReplies'))
+        replies = submission.details.get('replies', submission.details.get('directReplies')) if submission.details else None
         if replies is None:
             decision_notes = client.get_notes(forum=submission.id, invitation=decision_invitation_id)
         else:
             decision_notes = [openreview.api.Note.from_json(note) for note in replies if note['invitations'][0] == decision_invitation_id]
-        
+
         if not decision_notes:
             return False
 
         accept_options = domain.content.get('accept_decision_options', {}).get('value')
         decision_value = decision_notes[0].content[domain.content.get('decision_field_name', {}).get('value', 'decision')]['value']
-        if is_accept_decision(decision_value, accept_options) != with_decision_accept:
+        return is_accept_decision(decision_value, accept_options) == self.with_decision_accept
+
+    def matches(self, client, submission, note=None):
+        """
+        Checks if the source matches the submission, or the reply note of the submission
+
+        :param client: client used to get the decision of the submission when its replies are not in its details
+        :type client: OpenReviewClient
+        :param submission: submission of the venue
+        :type submission: Note
+        :param note: reply to the submission
+        :type note: Note, optional
+
+        :return: True if a child invitation should be created for the submission or the note
+        :rtype: bool
+        """
+        ## the conditions that only depend on the invitation are checked first
+        if not self.creates_invitations:
             return False
 
-    
-    content_keys = invitation.edit.get('content', {}).keys()
-    
-    if not content_keys:
-        return False
-    
-    if 'withdrawalId' in content_keys:
-        return False
-    
-    if 'deskRejectionId' in content_keys:
-        return False
-    
-    if 'noteReaders' in content_keys:
-        return False
-    
-    if 'noteId' not in content_keys:
-        return False
-    
-    if 'noteNumber' not in content_keys:
-        return False
+        if note and not self.replyto:
+            return False
 
-    if note and 'replyto' not in content_keys:
-        return False
-    
-    return True
+        if (self.reply_to is None) != (note is None):
+            return False
+
+        if submission.content['venueid']['value'] not in self.venueid:
+            return False
+
+        if note and not note.invitations[0].endswith(self.reply_to):
+            return False
+
+        if self.readers is not None and not self.readers.issubset(set(submission.readers)):
+            return False
+
+        for key, value in self.content.items():
+            if value != submission.content.get(key, {}).get('value'):
+                return False
+
+        if self.with_decision_accept is not None and not self.__has_decision_accept(client, submission):
+            return False
+
+        return True
+
+class InvitationSourceCache:
+    """
+    Thread safe cache of the compiled sources of the invitations of invitations of each domain, used when a new submission or reply
+    creates its child invitations.
+
+    Every lookup gets the domain group and the most recently modified invitation of invitations of the domain with their count. The
+    cached sources are compiled again when the domain group or any of its invitations of invitations was modified, created or deleted.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__entries = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __get_version(client, domain_id):
+        try:
+            invitations, count = client.get_invitations(prefix=domain_id + '/-/', type='invitation', sort='tmdate:desc', limit=1, with_count=True)
+        except openreview.OpenReviewException:
+            return None
+        return (count, invitations[0].id, invitations[0].tmdate) if invitations else (count,)
+
+    def get_sources(self, client, domain_id):
+        """
+        Returns the compiled sources of all the invitations of invitations of the domain, including the inactive ones
+
+        :param client: client used to get the domain and its invitations
+        :type client: OpenReviewClient
+        :param domain_id: id of the domain group, e.g. the venue id
+        :type domain_id: str
+
+        :return: Compiled sources of the invitations
+        :rtype: list[InvitationSource]
+        """
+        key = (ProfileCache.get_namespace(client), domain_id)
+        domain = client.get_group(domain_id)
+        version = InvitationSourceCache.__get_version(client, domain_id)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and version is not None and entry[0] == domain.tmdate and entry[1] == version:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        invitations = client.get_all_invitations(prefix=domain_id + '/-/', type='invitation')
+        sources = [InvitationSource(invitation, domain) for invitation in invitations]
+        if version is not None:
+            with self.__lock:
+                self.__entries[key] = (domain.tmdate, version, sources)
+        return sources
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+invitation_source_cache = InvitationSourceCache()
+
+def match_invitation_sources(client, submission, note=None, domain_id=None):
+    """
+    Evaluates the sources of all the active invitations of invitations of the submission domain, compiled and cached by
+    :class:`InvitationSourceCache`.
+
+    :param client: client used to get the domain and its invitations
+    :type client: OpenReviewClient
+    :param submission: submission of the venue
+    :type submission: Note
+    :param note: reply to the submission
+    :type note: Note, optional
+    :param domain_id: domain of the invitations, by default the domain of the submission
+    :type domain_id: str, optional
+
+    :return: List of the active invitations of invitations and whether their source matches
+    :rtype: list[tuple[Invitation, bool]]
+    """
+    sources = invitation_source_cache.get_sources(client, domain_id or submission.domain)
+    return [(source.invitation, source.matches(client, submission, note)) for source in sources if source.invitation.is_active()]
 
 def is_forum_invitation(invitation):
 
@@ -2073,17 +3904,105 @@ def is_forum_invitation(invitation):
     if 'replyto' in content_keys:
         return False
 
-    return True    
+    return True
+
+
+INVITATION_TEMPLATE_REFERENCE = re.compile(r'\$\{(\d+)/([^}]*)\}')
+
+def apply_invitation_template(template, edit, depth=1):
+    """
+    Resolves the references to an invitation edit in the invitation template of its parent, e.g. '${2/content/noteNumber/value}',
+    to compute locally the child invitation the edit would create. The number of a reference is the number of levels between the string
+    and the object it points to, where every dictionary key and every list element is a level. Only the references that point to the edit
+    are resolved, the ones that point inside the template, like '${3/signatures}' in edit.note.readers, are left as they are.
+
+    The fields of the template that are parameters with a const value, e.g. { 'param': { 'const': { 'delete': True } } }, take that value.
+
+    :param template: template of the child invitation, usually invitation.edit['invitation'] of the parent invitation
+    :type template: dict
+    :param edit: invitation edit posted to the parent invitation with its content, readers, writers and signatures
+    :type edit: dict
+    :param depth: number of levels between the edit and the template, 1 for invitation.edit['invitation']
+    :type depth: int, optional
+
+    :return: Copy of the template with the references resolved
+    :rtype: dict
+    """
+    def resolve(path):
+        value = edit
+        for key in path.split('/'):
+            if isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            elif isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                raise KeyError(path)
+        return value
+
+    def apply(value, depth):
+        if isinstance(value, dict):
+            return { key: apply(item, depth + 1) for key, item in value.items() }
+        if isinstance(value, list):
+            return [apply(item, depth + 1) for item in value]
+        if not isinstance(value, str) or '${' not in value:
+            return value
+
+        match = INVITATION_TEMPLATE_REFERENCE.fullmatch(value)
+        if match and int(match.group(1)) == depth:
+            try:
+                return copy.deepcopy(resolve(match.group(2)))
+            except KeyError:
+                return value
+
+        def replace(match):
+            if int(match.group(1)) != depth:
+                return match.group(0)
+            try:
+                return str(resolve(match.group(2)))
+            except KeyError:
+                return match.group(0)
+
+        return INVITATION_TEMPLATE_REFERENCE.sub(replace, value)
+
+    child = {}
+    for key, value in template.items():
+        if isinstance(value, dict) and list(value.keys()) == ['param'] and 'const' in value['param']:
+            value = value['param']['const']
+        child[key] = apply(value, depth + 1)
+    return child
+
+
+def is_invitation_up_to_date(template, invitation):
+    """
+    Checks if every field of a child invitation computed with :func:`apply_invitation_template` already has the same value in the
+    existing invitation, a field set to { 'delete': True } must be missing.
+
+    :param template: child invitation computed locally
+    :type template: dict
+    :param invitation: existing child invitation
+    :type invitation: Invitation
+
+    :return: True if posting the template would not change the invitation
+    :rtype: bool
+    """
+    current = invitation.to_json()
+    for key, value in template.items():
+        if value == { 'delete': True }:
+            if current.get(key, value) != value:
+                return False
+        elif current.get(key) != value:
+            return False
+    return True
 
 
 def create_replyto_invitations(client, submission, note):
 
-    venue_invitations = [i for i in client.get_all_invitations(prefix=note.domain + '/-/', type='invitation') if i.is_active()]
+    edits = []
 
-    for invitation in venue_invitations:
+    for invitation, matches in match_invitation_sources(client, submission, note, domain_id=note.domain):
         print('processing invitation: ', invitation.id)
 
-        if should_match_invitation_source(client, invitation, submission, note):
+        if matches:
             print('create invitation: ', invitation.id)
             content  = {
                 'noteId': { 'value': note.forum },
@@ -2099,29 +4018,35 @@ def create_replyto_invitations(client, submission, note):
                 content['invitationPrefix'] = { 'value': note.invitations[0].replace('/-/', '/') + str(note.number) }
             if 'replytoReplytoSignatures' in content_keys:
                 content['replytoReplytoSignatures'] = { 'value': client.get_note(note.replyto).signatures[0] }                 
-            client.post_invitation_edit(invitations=invitation.id,
-                content=content,
-                invitation=openreview.api.Invitation()
-            )
+            edits.append({
+                'invitations': invitation.id,
+                'content': content,
+                'invitation': openreview.api.Invitation()
+            })
         else:
             print('skipping invitation: ', invitation.id, ' - does not match source')             
 
+    ## all the child invitations are posted together
+    if edits:
+        client.post_invitation_edits(edits)
+
 def create_forum_invitations(client, submission):
     
-    invitation_invitations = [i for i in client.get_all_invitations(prefix=submission.domain + '/-/', type='invitation') if i.is_active()]
+    edits = []
 
-    for invitation in invitation_invitations:
+    for invitation, matches in match_invitation_sources(client, submission):
         print('processing invitation: ', invitation.id)
         
-        if should_match_invitation_source(client, invitation, submission):
+        if matches:
             print('create invitation: ', invitation.id)
-            client.post_invitation_edit(invitations=invitation.id,
-                content={
+            edits.append({
+                'invitations': invitation.id,
+                'content': {
                     'noteId': { 'value': submission.id },
                     'noteNumber': { 'value': submission.number }
                 },
-                invitation=openreview.api.Invitation()
-            )
+                'invitation': openreview.api.Invitation()
+            })
         else:
             print('skipping invitation: ', invitation.id, ' - does not match source')
             if is_forum_invitation(invitation):
@@ -2134,4 +4059,8 @@ def create_forum_invitations(client, submission):
                         invitation=openreview.api.Invitation(id=forum_invitation.id,
                             ddate=openreview.tools.datetime_millis(datetime.datetime.now())
                         )            
-                    )
\ No newline at end of file
+                    )
+
+    ## all the child invitations are posted together
+    if edits:
+        client.post_invitation_edits(edits)
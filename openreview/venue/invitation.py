@@ -1,9 +1,11 @@
+import contextlib
 import csv
 import datetime
 import inspect
 import json
 import os
 import time
+import threading
 import re
 from openreview.api import Invitation
 from openreview.api import Note
@@ -24,6 +26,8 @@ class InvitationBuilder(object):
         self.update_wait_time = 1000 if 'localhost' in venue.client.baseurl else update_wait_time
         self.spleep_time_for_logs = 0.5 if 'localhost' in venue.client.baseurl else 10
         self.update_date_string = "#{4/mdate} + " + str(self.update_wait_time)
+        self.pending_date_processes = None
+        self.pending_date_processes_lock = threading.Lock()
         self.invitation_edit_process = '''def process(client, invitation):
     meta_invitation = client.get_invitation("''' + self.venue.get_meta_invitation_id() + '''")
     script = meta_invitation.content["invitation_edit_script"]['value']
@@ -67,21 +71,74 @@ class InvitationBuilder(object):
         invitation = self.client.get_invitation(invitation.id)
 
         if invitation.date_processes and len(invitation.date_processes[0]['dates']) > 1 and self.update_date_string == invitation.date_processes[0]['dates'][1]:
-            process_logs = self.client.get_process_logs(id=invitation.id + '-0-1', min_sdate = invitation.tmdate + self.update_wait_time - 1000)
-            count = 0
-            max_count = 1800 / self.spleep_time_for_logs
-            while len(process_logs) == 0 and count < max_count: ## wait up to 30 minutes
-                time.sleep(self.spleep_time_for_logs)
-                process_logs = self.client.get_process_logs(id=invitation.id + '-0-1', min_sdate = invitation.tmdate + self.update_wait_time - 1000)
-                count += 1
+            date_process = (invitation.id, invitation.tmdate + self.update_wait_time - 1000)
+            with self.pending_date_processes_lock:
+                deferred = self.pending_date_processes is not None
+                if deferred:
+                    self.pending_date_processes.append(date_process)
+            if not deferred:
+                self.await_date_processes([date_process])
 
-            if len(process_logs) == 0:
-                raise openreview.OpenReviewException('Time out waiting for invitation to complete: ' + invitation.id)
+        return invitation
 
-            if process_logs[0]['status'] == 'error':
-                raise openreview.OpenReviewException('Error saving invitation: ' + invitation.id)
+    @contextlib.contextmanager
+    def defer_date_processes(self):
+        """
+        Context manager that makes save_invitation return without waiting for the date process of the invitation, the date processes
+        of all the invitations saved inside the context are awaited together when it exits.
+
+        Example:
+
+        >>> with venue.invitation_builder.defer_date_processes():
+        ...     venue.create_review_stage()
+        ...     venue.create_meta_review_stage()
+        """
+        with self.pending_date_processes_lock:
+            nested = self.pending_date_processes is not None
+            if not nested:
+                self.pending_date_processes = []
+        if nested:
+            yield
+            return
 
-        return invitation
+        try:
+            yield
+        finally:
+            with self.pending_date_processes_lock:
+                pending = self.pending_date_processes
+                self.pending_date_processes = None
+        self.await_date_processes(pending)
+
+    def await_date_processes(self, date_processes):
+        """
+        Waits up to 30 minutes for the date processes that run after the invitations are saved. All the pending processes are checked
+        in the same poll.
+
+        :param date_processes: id of each invitation and the minimum start date of its process log
+        :type date_processes: list[tuple[str, int]]
+        """
+        def get_process_logs(date_process):
+            invitation_id, min_sdate = date_process
+            return self.client.get_process_logs(id=invitation_id + '-0-1', min_sdate = min_sdate)
+
+        pending = list(date_processes)
+        count = 0
+        max_count = 1800 / self.spleep_time_for_logs
+        while pending:
+            all_process_logs = tools.concurrent_requests(get_process_logs, pending, desc='await_date_processes') if len(pending) > 1 else [get_process_logs(pending[0])]
+            waiting = []
+            for date_process, process_logs in zip(pending, all_process_logs):
+                if len(process_logs) == 0:
+                    waiting.append(date_process)
+                elif process_logs[0]['status'] == 'error':
+                    raise openreview.OpenReviewException('Error saving invitation: ' + date_process[0])
+            pending = waiting
+            if not pending:
+                break
+            if count >= max_count: ## wait up to 30 minutes
+                raise openreview.OpenReviewException('Time out waiting for invitation to complete: ' + pending[0][0])
+            time.sleep(self.spleep_time_for_logs)
+            count += 1
 
     def expire_invitation(self, invitation_id):
         invitation = tools.get_invitation(self.client, id = invitation_id)
@@ -1,8 +1,12 @@
 import csv
 import datetime
+import hashlib
+import io
 import os
+import numpy as np
 import openreview
 from openreview.api import Edge
+from openreview.api import EdgeBatch
 from openreview.api import Invitation
 from tqdm import tqdm
 import time
@@ -14,7 +18,7 @@ from functools import reduce
 
 class Matching(object):
 
-    def __init__(self, venue, match_group, alternate_matching_group=None, submission_content=None):
+    def __init__(self, venue, match_group, alternate_matching_group=None, submission_content=None, checkpoint_dir=None, profile_cache=None):
         self.venue = venue
         self.client = venue.client
         self.match_group = match_group
@@ -39,8 +43,14 @@ class Matching(object):
         
         self.should_read_by_area_chair = self.is_reviewer and venue.use_area_chairs and (openreview.stages.IdentityReaders.AREA_CHAIRS_ASSIGNED in self.venue.reviewer_identity_readers or openreview.stages.IdentityReaders.AREA_CHAIRS in self.venue.reviewer_identity_readers)
         self.sac_profile_info = None #expects a policy, for example: openreview.tools.get_sac_profile_info
+        ## the cache of the venue is shared by the matchings of all its committees
+        if profile_cache is None:
+            profile_cache = getattr(venue, 'profile_cache', None)
+        self.profile_cache = profile_cache if profile_cache is not None else tools.ProfileCache()
         self.sac_n_years = None
         self.submission_content = submission_content
+        ## directory of the checkpoints used to resume interrupted edge uploads, no checkpoints are used by default
+        self.checkpoint_dir = checkpoint_dir
 
     def _get_submission_content_query(self):
         if not self.submission_content:
@@ -83,6 +93,27 @@ class Matching(object):
         readers.append(tail)
         return readers
 
+    def _update_groups_members(self, members_changes):
+        results = self.client.update_groups_members(members_changes)
+        failed = { group_id: str(result['error']) for group_id, result in results.items() if not result['success'] }
+        if failed:
+            raise openreview.OpenReviewException(f'Failed to update the members of {len(failed)} groups: {failed}')
+
+    def _post_edges(self, invitation_id, edges=None, chunks=None, fingerprint=None):
+        ## Replace the previous edges of the invitation. With a checkpoint directory, an interrupted upload of exactly the same edges to the
+        ## same server is resumed, unless some batches failed after reaching the server. The edges can also be chunks read while they are
+        ## posted, identified by a fingerprint of their source
+        checkpoint_file = tools.BulkUploader.get_checkpoint_file(invitation_id, self.client.baseurl, directory=self.checkpoint_dir) if self.checkpoint_dir else None
+        uploader = tools.BulkUploader(self.client.post_edges, checkpoint_file=checkpoint_file, unit='edges')
+        if chunks is None and checkpoint_file:
+            fingerprint = uploader.get_fingerprint(edges)
+        if not uploader.can_resume(fingerprint=fingerprint):
+            uploader.clear_checkpoint()
+            self.client.delete_edges(invitation_id, wait_to_finish=True)
+        if chunks is not None:
+            return uploader.upload_chunks(chunks, fingerprint=fingerprint)
+        return uploader.upload(edges, return_items=False, fingerprint=fingerprint)
+
     def _create_edge_invitation(self, edge_id, any_tail=False, default_label=None):
 
         if self.venue.is_template_related_workflow() and (edge_id.endswith('Affinity_Score') or edge_id.endswith('Conflict') or edge_id.endswith('/Assignment')):
@@ -326,19 +357,18 @@ class Matching(object):
         info_function = tools.info_function_builder(get_profile_info)
         user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
         # Get profile info from all the authors
-        all_authorids = []
+        all_authorids = set()
         for submission in submissions:
-            authorids = submission.content['authorids']['value']
-            all_authorids = all_authorids + authorids
+            all_authorids.update(submission.content['authorids']['value'])
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True)
+        author_profile_by_id = tools.get_profiles(self.client, list(all_authorids), with_publications=True, compact_publications=True, with_relations=True, as_dict=True, cache=self.profile_cache)
 
         ## for AC conflicts, check SAC conflicts too
         sac_user_info_by_id = {}
         if self.is_area_chair:
             sacs_by_ac =  { g['id']['head']: [v['tail'] for v in g['values']] for g in self.client.get_grouped_edges(invitation=self.venue.get_assignment_id(self.senior_area_chairs_id, deployed=True), groupby='head', select=None)}
             if sacs_by_ac:
-                sac_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.senior_area_chairs_id).members, with_publications=True, with_relations=True)
+                sac_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.senior_area_chairs_id).members, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)
                 if self.sac_profile_info:
                     info_funcion = tools.info_function_builder(self.sac_profile_info)
                     sac_user_info_by_id = { p.id: info_funcion(p, self.sac_n_years, self.venue.get_submission_venue_id()) for p in sac_user_profiles }
@@ -347,79 +377,49 @@ class Matching(object):
 
             pcs_by_sac = { g['id']['head']: g['values'][0]['tail'] for g in self.client.get_grouped_edges(invitation=self.venue.get_assignment_id(self.venue.get_program_chairs_id(), deployed=True), groupby='head', select=None)}
             if pcs_by_sac:
-                pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, with_relations=True)   
+                pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, compact_publications=True, with_relations=True, cache=self.profile_cache)   
                 pc_user_info_by_id = { p.id: info_function(p, compute_conflicts_n_years) for p in pc_user_profiles }
 
-        edges = []
+        # Index the match group, transferring the conflicts of the assigned SACs and PCs to each AC
+        conflict_index = tools.ConflictIndex()
+        for user_info in user_profiles_info:
+            transferred_infos = []
+            if self.is_area_chair:
+                assigned_sacs = sacs_by_ac.get(user_info['id'], [])
+                transferred_infos += [sac_user_info_by_id[sac] for sac in assigned_sacs if sac in sac_user_info_by_id]
+                if pcs_by_sac:
+                    assigned_pcs = [pcs_by_sac.get(sac) for sac in assigned_sacs]
+                    transferred_infos += [pc_user_info_by_id[pc] for pc in assigned_pcs if pc in pc_user_info_by_id]
+            conflict_index.add_user(user_info, transferred_infos)
+
+        edges = EdgeBatch(
+            invitation=invitation_id,
+            label='Conflict',
+            readers=self._get_edge_readers(tail=EdgeBatch.TAIL),
+            writers=[self.venue.id],
+            signatures=[self.venue.id]
+        )
+        conflicts_by_author = {}
 
         for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
             # Get author profiles
             authorids = submission.content['authorids']['value']
 
-            # Extract domains from each authorprofile
-            author_ids = set()
-            author_domains = set()
-            author_relations = set()
-            author_publications = set()
+            # Find the users in conflict with each author, every author is looked up only once
+            conflicts = set()
             for authorid in authorids:
                 if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
-                    author_ids.add(author_info['id'])
-                    author_domains.update(author_info['domains'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
+                    if authorid not in conflicts_by_author:
+                        author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
+                        conflicts_by_author[authorid] = conflict_index.get_conflicts(author_info)
+                    conflicts.update(conflicts_by_author[authorid])
                 else:
                     print(f'Profile not found: {authorid}')
 
-            # Compute conflicts for each user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_ids.intersection(set([user_info['id']])))
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection([user_info['id']]))
-                conflicts.update(author_ids.intersection(user_info['relations']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                ## Transfer SAC conflicts
-                if len(conflicts) == 0 and self.is_area_chair:
-                    assigned_sacs = sacs_by_ac.get(user_info['id'], [])
-                    for sac in assigned_sacs:
-                        sac_info = sac_user_info_by_id.get(sac)
-                        if sac_info:
-                            conflicts.update(author_ids.intersection(set([sac_info['id']])))
-                            conflicts.update(author_domains.intersection(sac_info['domains']))
-                            conflicts.update(author_relations.intersection([sac_info['id']]))
-                            conflicts.update(author_ids.intersection(sac_info['relations']))
-                            conflicts.update(author_publications.intersection(sac_info['publications']))
-
-                ## Transfer PC conflicts
-                if len(conflicts) == 0 and self.is_area_chair and pcs_by_sac:
-                    assigned_pcs = [pcs_by_sac.get(sac) for sac in assigned_sacs]
-                    for pc in assigned_pcs:
-                        pc_info = pc_user_info_by_id.get(pc)
-                        if pc_info:
-                            conflicts.update(author_ids.intersection(set([pc_info['id']])))                            
-                            conflicts.update(author_domains.intersection(pc_info['domains']))
-                            conflicts.update(author_relations.intersection([pc_info['id']]))
-                            conflicts.update(author_ids.intersection(pc_info['relations']))
-                            conflicts.update(author_publications.intersection(pc_info['publications']))
-
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation_id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
-
-        ## Delete previous conflicts
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+            for position in sorted(conflicts):
+                edges.add(submission.id, conflict_index.user_ids[position], -1)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        self._post_edges(invitation_id, edges)
 
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
@@ -477,99 +477,134 @@ class Matching(object):
 
         return invitation
 
+    def _get_scores_fingerprint(self, source):
+        ## A digest of the scores identifies a previous interrupted upload of the same scores, it is only computed when checkpoints are used
+        ## since it reads the whole source once more
+        if not self.checkpoint_dir:
+            return None
+        if isinstance(source, str):
+            digest = hashlib.sha1()
+            with open(source, 'rb') as file_handle:
+                for block in iter(lambda: file_handle.read(1 << 20), b''):
+                    digest.update(block)
+            return digest.hexdigest()
+        return hashlib.sha1(source).hexdigest()
+
     def _build_scores_from_file(self, score_invitation_id, score_file, submissions):
-        if self.alternate_matching_group:
-            return self._build_profile_scores(score_invitation_id, score_file=score_file)
-        scores = []
-        with open(score_file) as file_handle:
-            scores = [row for row in csv.reader(file_handle)]
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+        ## The file is read row by row while the edges are posted
+        fingerprint = self._get_scores_fingerprint(score_file)
+        if tools.BinaryScores.is_binary(score_file):
+            scores = tools.BinaryScores.load(score_file)
+            if self.alternate_matching_group:
+                return self._build_profile_scores(score_invitation_id, scores=scores, score_file=score_file, fingerprint=fingerprint)
+            return self._build_note_scores(score_invitation_id, scores, submissions, score_file=score_file, fingerprint=fingerprint)
+        with open(score_file, newline='') as file_handle:
+            if self.alternate_matching_group:
+                return self._build_profile_scores(score_invitation_id, scores=csv.reader(file_handle), score_file=score_file, fingerprint=fingerprint)
+            return self._build_note_scores(score_invitation_id, csv.reader(file_handle), submissions, score_file=score_file, fingerprint=fingerprint)
 
     def _build_scores_from_stream(self, score_invitation_id, scores_stream, submissions):
-        scores = [input_line.split(',') for input_line in scores_stream.decode().strip().split('\n')]
+        fingerprint = self._get_scores_fingerprint(scores_stream)
+        if tools.BinaryScores.is_binary(scores_stream):
+            scores = tools.BinaryScores.load(scores_stream)
+        else:
+            scores = csv.reader(io.TextIOWrapper(io.BytesIO(scores_stream), newline=''))
         if self.alternate_matching_group:
-            return self._build_profile_scores(score_invitation_id, scores=scores)
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+            return self._build_profile_scores(score_invitation_id, scores=scores, fingerprint=fingerprint)
+        return self._build_note_scores(score_invitation_id, scores, submissions, fingerprint=fingerprint)
 
-    def _build_profile_scores(self, score_invitation_id, score_file=None, scores=None):
+    def _get_score_chunks(self, invitation_id, scores, submission_ids=None, chunk_size=50000):
+        ## Yields EdgeBatches of chunk_size scores, the scores of papers that are not in submission_ids are skipped
+        if isinstance(scores, tools.BinaryScores):
+            yield from self._get_binary_score_chunks(invitation_id, scores, submission_ids, chunk_size)
+            return
+        deleted_papers = set()
+        chunk = None
+        for row in tqdm(scores, desc='_build_scores'):
+            if not row:
+                continue
+            if submission_ids is not None and row[0] not in submission_ids:
+                deleted_papers.add(row[0])
+                continue
+            if chunk is None:
+                chunk = EdgeBatch(
+                    invitation=invitation_id,
+                    readers=self._get_edge_readers(tail=EdgeBatch.TAIL),
+                    writers=[self.venue.id],
+                    signatures=[self.venue.id]
+                )
+            chunk.add(row[0], row[1], max(round(float(row[2]), 4), 0))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = None
+        if chunk is not None:
+            yield chunk
+        if submission_ids is not None:
+            print('deleted papers', deleted_papers)
+
+    def _get_binary_score_chunks(self, invitation_id, scores, submission_ids=None, chunk_size=50000):
+        ## The columns are sliced, filtered and rounded chunk by chunk, so memory mapped scores are never fully read in memory
+        ids = scores.heads + scores.tails
+        valid_heads = np.array([submission_ids is None or head in submission_ids for head in scores.heads], dtype=bool)
+        deleted_heads = np.zeros(len(scores.heads), dtype=bool)
+        for start in tqdm(range(0, len(scores), chunk_size), desc='_build_scores'):
+            head_index = np.asarray(scores.head_index[start:start + chunk_size])
+            mask = valid_heads[head_index]
+            deleted_heads[head_index[~mask]] = True
+            if not mask.any():
+                continue
+            yield EdgeBatch.from_arrays(
+                invitation=invitation_id,
+                ids=ids,
+                heads=head_index[mask],
+                tails=np.asarray(scores.tail_index[start:start + chunk_size])[mask] + len(scores.heads),
+                weights=np.maximum(np.round(np.asarray(scores.score[start:start + chunk_size], dtype=np.float64)[mask], 4), 0),
+                readers=self._get_edge_readers(tail=EdgeBatch.TAIL),
+                writers=[self.venue.id],
+                signatures=[self.venue.id]
+            )
+        if submission_ids is not None:
+            print('deleted papers', set([scores.heads[index] for index in np.flatnonzero(deleted_heads)]))
+
+    def _build_profile_scores(self, score_invitation_id, score_file=None, scores=None, fingerprint=None):
 
         invitation = self._create_edge_invitation(score_invitation_id)
         invitation_id = invitation.id
-        edges = []
 
         # Validate and select scores
         if not scores and not score_file:
             raise openreview.OpenReviewException('No profile scores provided')
-        if scores:
-            score_handle = scores
-        elif score_file:
-            score_handle = csv.reader(open(score_file))
-
-        for row in tqdm(score_handle, desc='_build_scores'):
 
-            score = str(max(round(float(row[2]), 4), 0))
-            edges.append(Edge(
-                    invitation=invitation_id,
-                    head=row[0],
-                    tail=row[1],
-                    weight=float(score),
-                    readers=self._get_edge_readers(tail=row[1]),
-                    writers=[self.venue.id],
-                    signatures=[self.venue.id]
-                ))
-
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        if scores:
+            num_scores = self._post_edges(invitation_id, chunks=self._get_score_chunks(invitation_id, scores), fingerprint=fingerprint)
+        else:
+            with open(score_file, newline='') as file_handle:
+                num_scores = self._post_edges(invitation_id, chunks=self._get_score_chunks(invitation_id, csv.reader(file_handle)), fingerprint=fingerprint)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < num_scores:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, num_scores, edges_posted))
         return invitation
 
-    def _build_note_scores(self, score_invitation_id, scores, submissions):
+    def _build_note_scores(self, score_invitation_id, scores, submissions, score_file=None, fingerprint=None):
 
         invitation = self._create_edge_invitation(score_invitation_id)
         invitation_id = invitation.id
 
-        submissions_per_id = {note.id: note.number for note in submissions}
-
-        edges = []
-        deleted_papers = set()
-        for score_line in tqdm(scores, desc='_build_scores'):
-            if score_line:
-                paper_note_id = score_line[0]
-                paper_number = submissions_per_id.get(paper_note_id)
-                if paper_number:
-                    profile_id = score_line[1]
-                    score = str(max(round(float(score_line[2]), 4), 0))
-                    edges.append(openreview.Edge(
-                        invitation=invitation_id,
-                        head=paper_note_id,
-                        tail=profile_id,
-                        weight=float(score),
-                        readers=self._get_edge_readers(tail=profile_id),
-                        # nonreaders=[self.venue.get_authors_id(number=paper_number)],
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
-                else:
-                    deleted_papers.add(paper_note_id)
-
-        print('deleted papers', deleted_papers)
+        submission_ids = set([note.id for note in submissions if note.number])
+        if fingerprint:
+            fingerprint = hashlib.sha1((fingerprint + ''.join(sorted(submission_ids))).encode()).hexdigest()
 
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        num_scores = self._post_edges(invitation_id, chunks=self._get_score_chunks(invitation_id, scores, submission_ids), fingerprint=fingerprint)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < num_scores:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, num_scores, edges_posted))
         return invitation
 
-    def _compute_scores(self, score_invitation_id, submissions, model='specter+mfr'):
+    def _compute_scores(self, score_invitation_id, submissions, model='specter+mfr', score_file=None):
 
         venue = self.venue
         client = self.client
@@ -605,10 +640,18 @@ class Matching(object):
 
                 if self.alternate_matching_group:
                     scores = [[entry['submission_member'], entry['match_member'], entry['score']] for entry in result['results']]
-                    return self._build_profile_scores(score_invitation_id, scores=scores), matching_status
+                else:
+                    scores = [[entry['submission'], entry['user'], entry['score']] for entry in result['results']]
+
+                if score_file:
+                    ## Keep the results in the binary format, the file can be passed later as compute_affinity_scores
+                    scores = tools.BinaryScores.from_rows(scores)
+                    scores.save(score_file)
 
-                scores = [[entry['submission'], entry['user'], entry['score']] for entry in result['results']]
-                return self._build_note_scores(score_invitation_id, scores, submissions), matching_status
+                if self.alternate_matching_group:
+                    return self._build_profile_scores(score_invitation_id, scores=scores, fingerprint=job_id['jobId']), matching_status
+
+                return self._build_note_scores(score_invitation_id, scores, submissions, fingerprint=job_id['jobId']), matching_status
             if 'Error' in status:
                 raise openreview.OpenReviewException('There was an error computing scores, description: ' + desc)
             if call_count == 1440:
@@ -960,7 +1003,7 @@ class Matching(object):
 
         invitation = venue.invitation_builder.save_invitation(config_inv)
 
-    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None):
+    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, affinity_scores_file=None):
 
         venue = self.venue
         client = self.client
@@ -978,7 +1021,7 @@ class Matching(object):
                 'WARNING: not all reviewers have been converted to profile IDs.',
                 'Members without profiles will not have metadata created.')
 
-        user_profiles = openreview.tools.get_profiles(client, self.match_group.members, with_publications=compute_conflicts, with_relations=compute_conflicts)
+        user_profiles = openreview.tools.get_profiles(client, self.match_group.members, with_publications=compute_conflicts, compact_publications=True, with_relations=compute_conflicts, cache=self.profile_cache)
 
         submissions = self._get_submissions()
 
@@ -999,7 +1042,8 @@ class Matching(object):
                 invitation, matching_status = self._compute_scores(
                     venue.get_affinity_score_id(self.match_group.id),
                     submissions,
-                    compute_affinity_scores
+                    compute_affinity_scores,
+                    score_file=affinity_scores_file
                 )                
             else:
                 self._build_scores_from_file(
@@ -1018,7 +1062,8 @@ class Matching(object):
         if compute_affinity_scores == True:
             invitation, matching_status = self._compute_scores(
                 venue.get_affinity_score_id(self.match_group.id),
-                submissions
+                submissions,
+                score_file=affinity_scores_file
             )
 
         if compute_conflicts:
@@ -1186,17 +1231,20 @@ class Matching(object):
             if reviews:
                 raise openreview.OpenReviewException('Can not overwrite assignments when there are reviews posted.')
             ## Remove the members from the groups based on the current assignments
+            members_changes = {}
             for paper in tqdm(papers, total=len(papers)):
                 if paper.id in current_assignment_edges:
                     paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
                     current_edges=current_assignment_edges[paper.id]
-                    for current_edge in current_edges:
-                        client.remove_members_from_group(paper_committee_id, current_edge['tail'])
+                    members_changes[paper_committee_id] = { 'remove': [current_edge['tail'] for current_edge in current_edges] }
                 else:
                     print('assignment not found', paper.id)
+            self._update_groups_members(members_changes)
             ## Delete current assignment edges with a ddate in case we need to do rollback
             client.delete_edges(invitation=assignment_invitation_id, wait_to_finish=True, soft_delete=True)
 
+        members_changes = {}
+
         def process_paper_assignments(paper):
             paper_assignment_edges = []
             if paper.id in proposed_assignment_edges:
@@ -1231,7 +1279,7 @@ class Matching(object):
                         weight=proposed_edge.get('weight')
                     ))
                     assigned_users.append(assigned_user)
-                client.add_members_to_group(paper_committee_id, assigned_users)
+                members_changes[paper_committee_id] = { 'add': assigned_users }
                 return paper_assignment_edges
             else:
                 print('assignment not found', paper.id)
@@ -1239,6 +1287,8 @@ class Matching(object):
 
         assignment_edges = reduce(concat,tools.concurrent_requests(process_paper_assignments, papers))
 
+        self._update_groups_members(members_changes)
+
         print('Posting assignment edges', len(assignment_edges))
         openreview.tools.post_bulk_edges(client=client, edges=assignment_edges)
 
@@ -1334,6 +1384,7 @@ class Matching(object):
                 raise openreview.OpenReviewException('Can not delete assignments when there are reviews posted.')
 
         def process_paper_assignments(paper):
+            members_changes = []
             if paper.id in proposed_assignment_edges:
                 paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
                 proposed_edges=proposed_assignment_edges[paper.id]
@@ -1345,16 +1396,21 @@ class Matching(object):
                         for sac_assignment in sac_assignments:
                             assigned_sac = sac_assignment['tail']
                             sac_group_id = venue.get_senior_area_chairs_id(number=paper.number)
-                            client.remove_members_from_group(sac_group_id,[assigned_sac])
+                            members_changes.append((sac_group_id, assigned_sac))
                     assigned_users.append(assigned_user)
                     assignment_edge_id = current_assignment_edges.get(paper.id, {}).get(assigned_user)
                     if assignment_edge_id:
                         client.delete_edges(id=assignment_edge_id, invitation=assignment_invitation_id, wait_to_finish=True, soft_delete=True)
-                client.remove_members_from_group(paper_committee_id, assigned_users)
+                members_changes += [(paper_committee_id, assigned_user) for assigned_user in assigned_users]
             else:
                 print('assignment not found', paper.id)
+            return members_changes
 
-        tools.concurrent_requests(process_paper_assignments, papers, desc='undeploy_assignments')
+        ## Remove the members from all the groups at the end, the SAC groups can be shared by several ACs
+        members_changes = {}
+        for group_id, member in reduce(concat, tools.concurrent_requests(process_paper_assignments, papers, desc='undeploy_assignments'), []):
+            members_changes.setdefault(group_id, { 'remove': [] })['remove'].append(member)
+        self._update_groups_members(members_changes)
     
     def deploy(self, assignment_title, overwrite=False, enable_reviewer_reassignment=False):
 
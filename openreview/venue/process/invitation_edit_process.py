@@ -71,9 +71,9 @@ def process(client, invitation):
 
         return filter_by_source(source)
     
-    def update_note_readers(submission, paper_invitation):
-        ## Update readers of current notes
-        notes = client.get_notes(invitation=paper_invitation.id)
+    def update_note_readers(submission, forumNote, paper_invitation):
+        ## Update readers of current notes, the replies were already fetched with the submissions
+        notes = [openreview.api.Note.from_json(reply) for reply in forumNote.details['replies'] if paper_invitation.id in reply['invitations']]
         invitation_readers = paper_invitation.edit['note'].get('readers', [])
 
         ## if invitation has param in readers, we ignore the update
@@ -126,9 +126,7 @@ def process(client, invitation):
                     note = updated_note
                 )
 
-    def post_invitation(note):
-
-        note, forumNote = note
+    def get_content(note, forumNote):
 
         def find_note_from_details(note_id):
             if note_id == forumNote.id:
@@ -174,27 +172,63 @@ def process(client, invitation):
                         final_readers.append(ethics_chairs_id)
             content['noteReaders'] = { 'value': final_readers }
 
-        paper_invitation_edit = client.post_invitation_edit(invitations=invitation.id,
-            readers=[venue_id],
-            writers=[venue_id],
-            signatures=[venue_id],
-            content=content,
-            invitation=openreview.api.Invitation()
-        )
-        paper_invitation = client.get_invitation(paper_invitation_edit['invitation']['id'])
-        if paper_invitation.edit and paper_invitation.edit.get('note'):
-            update_note_readers(note, paper_invitation)
-
-        return paper_invitation
+        return content
 
     notes = get_children_notes()
 
-    current_child_invitations = client.get_all_invitations(invitation=invitation.id)
+    current_child_invitations = { i.id: i for i in client.get_all_invitations(invitation=invitation.id) }
+
+    def get_child_invitation(note):
+
+        note, forumNote = note
+
+        content = get_content(note, forumNote)
+
+        ## compute the child invitation locally and only post it when it differs from the current one
+        child_invitation = openreview.tools.apply_invitation_template(invitation.edit['invitation'], {
+            'content': content,
+            'readers': [venue_id],
+            'writers': [venue_id],
+            'signatures': [venue_id]
+        })
+        current_invitation = current_child_invitations.get(child_invitation.get('id'))
+        if current_invitation and openreview.tools.is_invitation_up_to_date(child_invitation, current_invitation):
+            return (note, forumNote, current_invitation.id, None)
+
+        return (note, forumNote, None, content)
 
     print(f'create or update {len(notes)} child invitations')
-    posted_invitations = openreview.tools.concurrent_requests(post_invitation, notes, desc=f'edit_invitation_process')
-    posted_invitations_by_id = { i.id: i for i in posted_invitations}
+    child_invitations = [get_child_invitation(note) for note in notes]
+    changed_invitations = [(note, forumNote, content) for note, forumNote, invitation_id, content in child_invitations if content]
+    print(f'{len(changed_invitations)} child invitations changed')
+
+    ## the changed child invitations are posted in bulk
+    posted_edits = client.post_invitation_edits([{
+        'invitations': invitation.id,
+        'readers': [venue_id],
+        'writers': [venue_id],
+        'signatures': [venue_id],
+        'content': content,
+        'invitation': openreview.api.Invitation()
+    } for _, _, content in changed_invitations]) if changed_invitations else []
+
+    posted_invitation_ids = iter([edit['invitation']['id'] for edit in posted_edits])
+    all_child_invitations = [(note, forumNote, next(posted_invitation_ids) if content else invitation_id) for note, forumNote, invitation_id, content in child_invitations]
+    child_invitation_ids = set([invitation_id for _, _, invitation_id in all_child_invitations])
+
+    ## get all the updated child invitations at once instead of one request per child
+    child_invitations_by_id = { i.id: i for i in client.get_all_invitations(invitation=invitation.id) } if changed_invitations else current_child_invitations
+
+    def update_readers(child_invitation):
+        note, forumNote, invitation_id = child_invitation
+        paper_invitation = child_invitations_by_id.get(invitation_id) or client.get_invitation(invitation_id)
+        if paper_invitation.edit and paper_invitation.edit.get('note'):
+            update_note_readers(note, forumNote, paper_invitation)
+
+    ## the readers of the replies are checked for all the children, the replies were fetched with the submissions and only the
+    ## notes with different readers are posted
+    openreview.tools.concurrent_requests(update_readers, all_child_invitations, desc=f'edit_invitation_process_readers')
 
-    for current_invitation in current_child_invitations:
-        if current_invitation.id not in posted_invitations_by_id:
+    for current_invitation in current_child_invitations.values():
+        if current_invitation.id not in child_invitation_ids:
             delete_invitation(current_invitation, now)
\ No newline at end of file
@@ -11,6 +11,64 @@ class Recruitment(object):
         self.client = venue.client
         self.venue = venue
 
+    def get_profiles(self, invitees, batch_size=1000):
+        """
+        Gets the profiles of the invitees in bulk, by profile id or confirmed email. The profile ids that can not be searched in bulk,
+        e.g. because one of them is invalid, are requested one by one.
+
+        :return: Profile or OpenReviewException of each invitee, the invitees without profile are missing
+        :rtype: dict
+        """
+        profiles = {}
+
+        profile_ids = [invitee for invitee in invitees if invitee.startswith('~')]
+        for i in range(0, len(profile_ids), batch_size):
+            batch = profile_ids[i:i + batch_size]
+            try:
+                for profile in self.client.search_profiles(ids=batch):
+                    for username in [profile.id] + [name.get('username') for name in profile.content.get('names', []) if name.get('username')]:
+                        profiles[username] = profile
+            except openreview.OpenReviewException:
+                for profile_id in batch:
+                    try:
+                        profile = tools.get_profile(self.client, profile_id)
+                        if profile:
+                            profiles[profile_id] = profile
+                    except openreview.OpenReviewException as e:
+                        profiles[profile_id] = e
+
+        emails = [invitee for invitee in invitees if not invitee.startswith('~')]
+        for i in range(0, len(emails), batch_size):
+            try:
+                profiles.update(self.client.search_profiles(confirmedEmails=emails[i:i + batch_size]))
+            except openreview.OpenReviewException as e:
+                ## the profiles of the emails are only used to find memberships of their other emails and usernames
+                print('Profiles of the emails could not be retrieved', repr(e))
+
+        return profiles
+
+    def send_messages(self, recipients, title, message, hash_seed, invitation_id, committee_invited_id, contact_info, max_concurrent=8):
+        """
+        Sends the personalized recruitment message of each recipient with at most max_concurrent messages sent at the same time
+
+        :param recipients: user and name of each recipient
+        :type recipients: list[tuple[str, str]]
+
+        :return: None or the exception raised sending the message of each recipient
+        :rtype: list
+        """
+        scheduler = tools.RequestScheduler(max_in_flight=max_concurrent, initial_limit=max_concurrent)
+
+        def send_message(recipient):
+            user, name = recipient
+            try:
+                personalized_message = tools.get_recruitment_message(user, name, hash_seed, invitation_id, message, contact_info)
+                self.client.post_message(title, [user], personalized_message, parentGroup=committee_invited_id, invitation=self.venue.get_meta_invitation_id(), signature=self.venue.venue_id)
+            except Exception as e:
+                return e
+
+        return tools.concurrent_requests(send_message, recipients, desc='send_invitations', scheduler=scheduler) if recipients else []
+
     def invite_committee(self, 
             title,
             message,
@@ -23,7 +81,8 @@ class Recruitment(object):
             reduced_load_on_decline,
             allow_accept_with_reduced_load,
             # default_load,
-            allow_overlap_official_committee):
+            allow_overlap_official_committee,
+            max_concurrent_messages=8):
 
         venue = self.venue
         venue_id = venue.venue_id
@@ -43,6 +102,11 @@ class Recruitment(object):
             'errors': {}
         }
 
+        def add_error(error_string, user):
+            if error_string not in recruitment_status['errors']:
+                recruitment_status['errors'][error_string] = []
+            recruitment_status['errors'][error_string].append(user)
+
         options = {
             'allow_overlap_official_committee': allow_overlap_official_committee,
             'reduced_load_on_decline': reduced_load_on_decline,
@@ -56,92 +120,82 @@ class Recruitment(object):
 
         invitees = [e.lower() if '@' in e else e for e in invitees if len(e) > 0]
 
+        ## the memberships of all the invitees are computed from the members of the committee groups
+        invited_roles = [f'{venue_id}/{role}/Invited' for role in committee_roles]
+        member_roles = [f'{venue_id}/{role}' for role in committee_roles]
+        groups = { group_id: tools.get_group(self.client, group_id) for group_id in set(invited_roles + member_roles + [committee_id, committee_invited_id, committee_declined_id]) }
+        group_members = { group_id: set(group.members) if group else set() for group_id, group in groups.items() }
+
         if remind:
-            committee_invited_group = self.client.get_group(committee_invited_id)
-            invited_committee = committee_invited_group.members
+            invited_committee = groups[committee_invited_id].members
             print("Sending reminders for recruitment invitations")
-            for invited_user in tqdm(invited_committee, desc='remind recruitment'):
-                memberships = [g.id for g in self.client.get_groups(member=invited_user, prefix=committee_id)] if tools.get_group(self.client, invited_user) else []
-                if committee_id not in memberships and committee_declined_id not in memberships:
+            reminder_profiles = self.get_profiles(invited_committee)
+            recipients = []
+            for invited_user in invited_committee:
+                identities = self.get_identities(invited_user, reminder_profiles.get(invited_user))
+                if not identities & (group_members[committee_id] | group_members[committee_declined_id]):
                     name = 'invitee'
                     if invited_user.startswith('~') :
                         name = None
                     elif (invited_user in invitees) and invitee_names:
                         name = invitee_names[invitees.index(invited_user)]
-                    try:
-                        tools.recruit_reviewer(self.client, invited_user, name,
-                            hash_seed,
-                            invitation_id,
-                            message,
-                            'Reminder: ' + title,
-                            committee_invited_id,
-                            contact_info,
-                            verbose = False,
-                            invitation = self.venue.get_meta_invitation_id(),
-                            signature = venue_id)
-                        recruitment_status['reminded'].append(invited_user)
-                    except Exception as e:
-                        self.client.remove_members_from_group(committee_invited_id, invited_user)
-                        if repr(e) not in recruitment_status['errors']:
-                            recruitment_status['errors'][repr(e)] = []
-                        recruitment_status['errors'][repr(e)].append(invited_user)
+                    recipients.append((invited_user, name))
 
-        print('sending recruitment invitations')
-        for index, email in enumerate(tqdm(invitees, desc='send_invitations')):
-            profile_emails = []
-            profile = None
+            errors = self.send_messages(recipients, 'Reminder: ' + title, message, hash_seed, invitation_id, committee_invited_id, contact_info, max_concurrent_messages)
+            failed = [user for (user, _), error in zip(recipients, errors) if error]
+            if failed:
+                self.client.remove_members_from_group(committee_invited_id, failed)
+            for (user, _), error in zip(recipients, errors):
+                if error:
+                    add_error(repr(error), user)
+                else:
+                    recruitment_status['reminded'].append(user)
+
+        print('resolving profiles and memberships of the invitees')
+        profiles = self.get_profiles(invitees)
+        new_invitees = []
+        for index, email in enumerate(invitees):
+            profile = profiles.get(email)
             is_profile_id = email.startswith('~')
-            invalid_profile_id = False
-            no_profile_found = False
-            if is_profile_id:
-                try:
-                    profile = tools.get_profile(self.client, email)
-                except openreview.OpenReviewException as e:
-                    error_string = repr(e)
-                    if 'ValidationError' in error_string:
-                        invalid_profile_id = True
-                    else:
-                        if error_string not in recruitment_status['errors']:
-                            recruitment_status['errors'][error_string] = []
-                        recruitment_status['errors'][error_string].append(email)
-                        continue
-                if not profile:
-                    no_profile_found = True
-                profile_emails = profile.content['emails'] if profile else []
-
-            memberships = [g.id for g in self.client.get_groups(member=email, prefix=venue_id)] if tools.get_group(self.client, email) else []
-            invited_roles = [f'{venue_id}/{role}/Invited' for role in committee_roles]
-            member_roles = [f'{venue_id}/{role}' for role in committee_roles]
-
-            invited_group_ids=list(set(invited_roles) & set(memberships))
-            member_group_ids=list(set(member_roles) & set(memberships))
-
-            if profile and not profile_emails:
-                if 'profiles_without_email' not in recruitment_status['errors']:
-                    recruitment_status['errors']['profiles_without_email'] = []
-                recruitment_status['errors']['profiles_without_email'].append(email)
-            elif invalid_profile_id:
-                if 'invalid_profile_ids' not in recruitment_status['errors']:
-                    recruitment_status['errors']['invalid_profile_ids'] = []
-                recruitment_status['errors']['invalid_profile_ids'].append(email)
-            elif no_profile_found:
-                if 'profile_not_found' not in recruitment_status['errors']:
-                    recruitment_status['errors']['profile_not_found'] = []
-                recruitment_status['errors']['profile_not_found'].append(email)
+
+            if isinstance(profile, openreview.OpenReviewException):
+                error_string = repr(profile)
+                if 'ValidationError' not in error_string:
+                    add_error(error_string, email)
+                    continue
+                add_error('invalid_profile_ids', email)
+                continue
+
+            identities = self.get_identities(email, profile)
+            invited_group_ids = [group_id for group_id in invited_roles if identities & group_members[group_id]]
+            member_group_ids = [group_id for group_id in member_roles if identities & group_members[group_id]]
+
+            if is_profile_id and profile and not profile.content.get('emails'):
+                add_error('profiles_without_email', email)
+            elif is_profile_id and not profile:
+                add_error('profile_not_found', email)
             elif invited_group_ids:
-                invited_group_id=invited_group_ids[0]
-                if invited_group_id not in recruitment_status['already_invited']:
-                    recruitment_status['already_invited'][invited_group_id] = [] 
-                recruitment_status['already_invited'][invited_group_id].append(email)
+                recruitment_status['already_invited'].setdefault(invited_group_ids[0], []).append(email)
             elif member_group_ids:
-                member_group_id = member_group_ids[0]
-                if member_group_id not in recruitment_status['already_member']:
-                    recruitment_status['already_member'][member_group_id] = []
-                recruitment_status['already_member'][member_group_id].append(email)
+                recruitment_status['already_member'].setdefault(member_group_ids[0], []).append(email)
             else:
                 name = invitee_names[index] if (invitee_names and index < len(invitee_names)) else None
                 if not name and not is_profile_id:
                     name = 'invitee'
+                new_invitees.append((email, name))
+                ## repeated invitees are already invited
+                group_members[committee_invited_id].add(email)
+
+        if not new_invitees:
+            return recruitment_status
+
+        print('sending recruitment invitations')
+        try:
+            ## all the new invitees are added to the invited group in one edit
+            self.client.add_members_to_group(committee_invited_id, [email for email, _ in new_invitees])
+        except openreview.OpenReviewException as e:
+            print('Invitees could not be added in one edit, inviting them one by one', repr(e))
+            for email, name in tqdm(new_invitees, desc='send_invitations'):
                 try:
                     tools.recruit_reviewer(self.client, email, name,
                         hash_seed,
@@ -155,18 +209,40 @@ class Recruitment(object):
                         signature=venue_id)
                     recruitment_status['invited'].append(email)
                 except Exception as e:
-                    error_string = repr(e)
-                    if 'NotFoundError' in error_string:
-                        error_string = 'InvalidGroup'
-                    else:
-                        try:
-                            self.client.remove_members_from_group(committee_invited_id, email)
-                        except Exception as e:
-                            new_error_string = repr(e)
-                            if new_error_string not in recruitment_status['errors']:
-                                recruitment_status['errors'][new_error_string] = []
-                            recruitment_status['errors'][new_error_string].append(email)
-                    if error_string not in recruitment_status['errors']:
-                        recruitment_status['errors'][error_string] = []
-                    recruitment_status['errors'][error_string].append(email)
-        return recruitment_status
\ No newline at end of file
+                    self.__add_recruitment_error(recruitment_status, committee_invited_id, e, [email])
+            return recruitment_status
+
+        errors = self.send_messages(new_invitees, title, message, hash_seed, invitation_id, committee_invited_id, contact_info, max_concurrent_messages)
+        failed = {}
+        for (email, _), error in zip(new_invitees, errors):
+            if error:
+                failed.setdefault(repr(error), []).append(email)
+            else:
+                recruitment_status['invited'].append(email)
+        for error_string, emails in failed.items():
+            self.__add_recruitment_error(recruitment_status, committee_invited_id, error_string, emails)
+
+        return recruitment_status
+
+    @staticmethod
+    def get_identities(invitee, profile):
+        ## usernames and emails that identify the invitee as a member of a group
+        identities = { invitee }
+        if profile and not isinstance(profile, Exception):
+            identities.update(name.get('username') for name in profile.content.get('names', []) if name.get('username'))
+            identities.update(profile.content.get('emails', []))
+            identities.add(profile.id)
+        return identities
+
+    def __add_recruitment_error(self, recruitment_status, committee_invited_id, error, emails):
+        ## the invitees whose message was not sent are removed from the invited group
+        error_string = error if isinstance(error, str) else repr(error)
+        errors = recruitment_status['errors']
+        if 'NotFoundError' in error_string:
+            error_string = 'InvalidGroup'
+        else:
+            try:
+                self.client.remove_members_from_group(committee_invited_id, emails)
+            except Exception as e:
+                errors.setdefault(repr(e), []).extend(emails)
+        errors.setdefault(error_string, []).extend(emails)
@@ -99,6 +99,8 @@ class Venue(object):
         self.iThenticate_plagiarism_check_exclude_custom_sections = False
         self.iThenticate_plagiarism_check_exclude_small_matches = 8
         self.comment_notification_threshold = None
+        ## Profiles retrieved by the matching and assignment steps of the venue, shared by all the committees
+        self.profile_cache = tools.ProfileCache()
 
     def set_main_settings(self, request_note):
         self.name = request_note.content['official_venue_name']['value']
@@ -563,36 +565,38 @@ class Venue(object):
             allow_overlap_official_committee)
 
     def create_submission_stage(self):
-        self.invitation_builder.set_submission_invitation()
-        if self.iThenticate_plagiarism_check:
-            self.invitation_builder.set_iThenticate_plagiarism_check_invitation()
-        self.invitation_builder.set_withdrawal_invitation()
-        self.invitation_builder.set_desk_rejection_invitation()
-        self.invitation_builder.set_post_submission_invitation()
-        self.invitation_builder.set_pc_submission_revision_invitation()
-        self.invitation_builder.set_submission_reviewer_group_invitation()
-        self.invitation_builder.set_submission_message_invitation()
-        if self.use_area_chairs:
-            self.invitation_builder.set_submission_area_chair_group_invitation()
-        if self.use_senior_area_chairs:
-            self.invitation_builder.set_submission_senior_area_chair_group_invitation()
-        if self.expertise_selection_stage:
-            self.invitation_builder.set_expertise_selection_invitations()
-
-        if self.submission_stage.second_due_date:
-            stage = self.submission_stage
-            submission_revision_stage = openreview.stages.SubmissionRevisionStage(name='Full_Submission',
-                start_date=stage.exp_date,
-                due_date=stage.second_due_date,
-                additional_fields=stage.second_deadline_additional_fields if stage.second_deadline_additional_fields else stage.additional_fields,
-                remove_fields=stage.second_deadline_remove_fields if stage.second_deadline_remove_fields else stage.remove_fields,
-                only_accepted=False,
-                multiReply=True,
-                allow_author_reorder=stage.author_reorder_after_first_deadline,
-                allow_license_edition=True
-            )
-            self.invitation_builder.set_submission_revision_invitation(submission_revision_stage)
-            self.invitation_builder.set_submission_deletion_invitation(submission_revision_stage)
+        ## the invitations are saved in order, only the date processes are awaited together
+        with self.invitation_builder.defer_date_processes():
+            self.invitation_builder.set_submission_invitation()
+            if self.iThenticate_plagiarism_check:
+                self.invitation_builder.set_iThenticate_plagiarism_check_invitation()
+            self.invitation_builder.set_withdrawal_invitation()
+            self.invitation_builder.set_desk_rejection_invitation()
+            self.invitation_builder.set_post_submission_invitation()
+            self.invitation_builder.set_pc_submission_revision_invitation()
+            self.invitation_builder.set_submission_reviewer_group_invitation()
+            self.invitation_builder.set_submission_message_invitation()
+            if self.use_area_chairs:
+                self.invitation_builder.set_submission_area_chair_group_invitation()
+            if self.use_senior_area_chairs:
+                self.invitation_builder.set_submission_senior_area_chair_group_invitation()
+            if self.expertise_selection_stage:
+                self.invitation_builder.set_expertise_selection_invitations()
+
+            if self.submission_stage.second_due_date:
+                stage = self.submission_stage
+                submission_revision_stage = openreview.stages.SubmissionRevisionStage(name='Full_Submission',
+                    start_date=stage.exp_date,
+                    due_date=stage.second_due_date,
+                    additional_fields=stage.second_deadline_additional_fields if stage.second_deadline_additional_fields else stage.additional_fields,
+                    remove_fields=stage.second_deadline_remove_fields if stage.second_deadline_remove_fields else stage.remove_fields,
+                    only_accepted=False,
+                    multiReply=True,
+                    allow_author_reorder=stage.author_reorder_after_first_deadline,
+                    allow_license_edition=True
+                )
+                self.invitation_builder.set_submission_revision_invitation(submission_revision_stage)
+                self.invitation_builder.set_submission_deletion_invitation(submission_revision_stage)
 
     def create_post_submission_stage(self):
 
@@ -629,11 +633,62 @@ class Venue(object):
         self.invitation_builder.set_bid_invitations()
 
     def create_comment_stage(self):
-        self.invitation_builder.set_official_comment_invitation()
-        if self.comment_stage.allow_public_comments:
-            self.invitation_builder.set_public_comment_invitation()
+        ## the invitations are saved in order, only the date processes are awaited together
+        with self.invitation_builder.defer_date_processes():
+            self.invitation_builder.set_official_comment_invitation()
+            if self.comment_stage.allow_public_comments:
+                self.invitation_builder.set_public_comment_invitation()
+
+            self.invitation_builder.set_chat_invitation()
+
+    ## stages that only save their own invitations, so create_stages can create them concurrently after the stages they read
+    concurrent_stages = {
+        'review': [],
+        'review_rebuttal': ['review'],
+        'meta_review': [],
+        'comment': [],
+        'bid': [],
+        'registration': []
+    }
+
+    def create_stages(self, stages):
+        """
+        Creates several stages, e.g. venue.create_stages(['review', 'meta_review', 'comment']). The consecutive stages declared in
+        Venue.concurrent_stages are saved concurrently and the date processes of all of them are awaited together. Any other stage is
+        created after the previous stages are done, the same way as calling its create method.
+
+        :param stages: names of the stages, each name calls the create_<name>_stage or create_<name>_stages method of the venue
+        :type stages: list[str]
+
+        :return: Result of the create method of each stage by name
+        :rtype: dict
+        """
+        create_methods = {}
+        for stage in stages:
+            create_stage = getattr(self, f'create_{stage}_stage', None) or getattr(self, f'create_{stage}_stages', None)
+            if create_stage is None:
+                raise openreview.OpenReviewException(f'Unknown stage: {stage}')
+            create_methods[stage] = create_stage
+
+        results = {}
+        plan = tools.DeploymentPlan()
+
+        def run_plan(plan):
+            with self.invitation_builder.defer_date_processes():
+                results.update(plan.run())
+            return tools.DeploymentPlan()
+
+        for stage in stages:
+            if stage in self.concurrent_stages:
+                plan.add(stage, create_methods[stage], depends_on=[dependency for dependency in self.concurrent_stages[stage] if dependency in plan.steps])
+                continue
+            if plan:
+                plan = run_plan(plan)
+            results[stage] = create_methods[stage]()
+        if plan:
+            run_plan(plan)
 
-        self.invitation_builder.set_chat_invitation()
+        return results
 
     def create_decision_stage(self):
         invitation = self.invitation_builder.set_decision_invitation()
@@ -792,9 +847,9 @@ class Venue(object):
         results = []
         errors = {}
 
-        with ThreadPoolExecutor(max_workers=min(6, cpu_count() - 1)) as executor:
+        with ThreadPoolExecutor(max_workers=tools.request_scheduler.max_in_flight) as executor:
             for _decision in decisions_data:
-                _future = executor.submit(post_decision, _decision)
+                _future = executor.submit(tools.request_scheduler.run, post_decision, _decision)
                 futures.append(_future)
                 futures_param_mapping[_future] = str(_decision)
 
@@ -961,12 +1016,12 @@ Total Errors: {len(errors)}
 
         tools.concurrent_requests(send_notification, paper_notes)
 
-    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None):
+    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None, checkpoint_dir=None):
         if committee_id is None:
             committee_id=self.get_reviewers_id()
         if self.use_senior_area_chairs and committee_id == self.get_senior_area_chairs_id() and not alternate_matching_group and not self.sac_paper_assignments:
             alternate_matching_group = self.get_area_chairs_id()
-        venue_matching = matching.Matching(self, self.client.get_group(committee_id), alternate_matching_group, { 'track': submission_track } if submission_track else None)
+        venue_matching = matching.Matching(self, self.client.get_group(committee_id), alternate_matching_group, { 'track': submission_track } if submission_track else None, checkpoint_dir=checkpoint_dir, profile_cache=self.profile_cache)
 
         return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years)
 
@@ -974,19 +1029,19 @@ Total Errors: {len(errors)}
 
         match_group = self.client.get_group(committee_id)
         assignment_invitation = self.client.get_invitation(self.get_assignment_id(match_group.id))
-        conference_matching = matching.Matching(self, match_group, submission_content=assignment_invitation.edit.get('head', {}).get('param', {}).get('withContent'))
+        conference_matching = matching.Matching(self, match_group, submission_content=assignment_invitation.edit.get('head', {}).get('param', {}).get('withContent'), profile_cache=self.profile_cache)
         return conference_matching.deploy(assignment_title, overwrite, enable_reviewer_reassignment)
     
     def unset_assignments(self, assignment_title, committee_id):
 
         match_group = self.client.get_group(committee_id)
-        conference_matching = matching.Matching(self, match_group)
+        conference_matching = matching.Matching(self, match_group, profile_cache=self.profile_cache)
         return conference_matching.undeploy(assignment_title)    
 
     def setup_assignment_recruitment(self, committee_id, hash_seed, due_date, assignment_title=None, invitation_labels={}, email_template=None):
 
         match_group = self.client.get_group(committee_id)
-        conference_matching = matching.Matching(self, match_group)
+        conference_matching = matching.Matching(self, match_group, profile_cache=self.profile_cache)
         return conference_matching.setup_invite_assignment(hash_seed, assignment_title, due_date, invitation_labels=invitation_labels, email_template=email_template)
     
     def set_track_sac_assignments(self, track_sac_file, conflict_policy=None, conflict_n_years=None, track_ac_file=None):
@@ -1030,8 +1085,8 @@ Total Errors: {len(errors)}
             authorids = submission.content['authorids']['value']
             all_authorids = all_authorids + authorids
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True)
-        sac_profile_by_id = tools.get_profiles(self.client, list(set(all_sacs)), with_publications=True, with_relations=True, as_dict=True)   
+        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, compact_publications=True, with_relations=True, as_dict=True, cache=self.profile_cache)
+        sac_profile_by_id = tools.get_profiles(self.client, list(set(all_sacs)), with_publications=True, compact_publications=True, with_relations=True, as_dict=True, cache=self.profile_cache)   
 
         info_function = tools.info_function_builder(openreview.tools.get_neurips_profile_info if conflict_policy == 'NeurIPS' else openreview.tools.get_profile_info)
 
@@ -1481,14 +1536,14 @@ Total Errors: {len(errors)}
         
         reviewer_assignment_id = self.get_assignment_id(reviewers_id, deployed=True)
         assignments_by_reviewers = { e['id']['tail']: e['values'] for e in self.client.get_grouped_edges(invitation=reviewer_assignment_id, groupby='tail')}
-        all_submission_groups = self.client.get_all_groups(prefix=self.get_submission_venue_id())
+        all_submission_groups = self.client.get_all_groups(prefix=self.get_submission_venue_id(), select='id,members')
 
         all_anon_reviewer_groups = [g for g in all_submission_groups if f'/{self.get_anon_committee_name(self.reviewers_name)}' in g.id ]
         all_anon_reviewer_group_members = []
         for g in all_anon_reviewer_groups:
             all_anon_reviewer_group_members += g.members
         all_profile_ids = set(all_anon_reviewer_group_members + list(assignments_by_reviewers.keys()))
-        profile_by_id = openreview.tools.get_profiles(self.client, list(all_profile_ids), as_dict=True)
+        profile_by_id = openreview.tools.get_profiles(self.client, list(all_profile_ids), as_dict=True, cache=self.profile_cache)
 
         reviewer_anon_groups = {}
         for g in all_anon_reviewer_groups:
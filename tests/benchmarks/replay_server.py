@@ -0,0 +1,277 @@
+"""
+Local stand-in for the OpenReview API used to benchmark the client without a live server.
+
+:class:`Recorder` captures the requests of a real client to a cassette file, one JSON object per line, and :class:`ReplayServer`
+answers them again with a configurable latency. The server can also serve synthetic collections of notes, edges, groups and
+profiles with the pagination parameters of the API (limit, offset, after, sort=id, count, stream), capping every page at
+`page_size` objects. The posted edits, bulk edges, bulk tags and bulk invitation edits are kept in `posted` by path.
+
+    recorder = Recorder('cassette.jsonl')
+    recorder.attach(client)
+    ...
+    recorder.close()
+
+    with ReplayServer(cassette='cassette.jsonl', latency=0.05) as server:
+        client = openreview.api.OpenReviewClient(baseurl=server.url)
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+
+def request_key(method, path, query, body=None):
+    return json.dumps([method, path, sorted(query), body], sort_keys=True)
+
+
+class Recorder:
+    """
+    Records every request sent by a client and its response to a cassette file
+
+    :param path: path of the cassette, the requests are appended to it
+    :type path: str
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, 'a')
+
+    def attach(self, client):
+        client.session.hooks['response'].append(self)
+
+    def detach(self, client):
+        client.session.hooks['response'].remove(self)
+
+    def __call__(self, response, *args, **kwargs):
+        request = response.request
+        url = urlsplit(request.url)
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        entry = {
+            'method': request.method,
+            'path': url.path,
+            'query': parse_qsl(url.query, keep_blank_values=True),
+            'body': json.loads(body) if body else None,
+            'status': response.status_code,
+            'content_type': response.headers.get('Content-Type', 'application/json'),
+            'response': response.text
+        }
+        with self.lock:
+            self.file.write(json.dumps(entry) + '\n')
+        return response
+
+    def close(self):
+        self.file.close()
+
+
+class ReplayServer:
+    """
+    HTTP server that replays a cassette and serves synthetic collections
+
+    :param cassette: path of a cassette written by :class:`Recorder`
+    :type cassette: str, optional
+    :param latency: seconds to wait before answering every request
+    :type latency: float, optional
+    :param page_size: maximum number of objects returned in a page, like the limit of the API
+    :type page_size: int, optional
+    :param bulk_edits: if False, the bulk invitation edits endpoint answers 404 like the servers that do not support it
+    :type bulk_edits: bool, optional
+    """
+    COLLECTIONS = {
+        '/notes': 'notes',
+        '/edges': 'edges',
+        '/groups': 'groups',
+        '/invitations': 'invitations',
+        '/profiles': 'profiles'
+    }
+
+    def __init__(self, cassette=None, latency=0.0, page_size=1000, bulk_edits=True):
+        self.latency = latency
+        self.page_size = page_size
+        self.bulk_edits = bulk_edits
+        self.recorded = {}
+        self.collections = {}
+        self.indexes = {}
+        self.posted = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+        if cassette:
+            self.load_cassette(cassette)
+        self.server = None
+        self.thread = None
+
+    def load_cassette(self, path):
+        with open(path) as f:
+            for line in f:
+                entry = json.loads(line)
+                ## the last response recorded for the same request is replayed
+                self.recorded[request_key(entry['method'], entry['path'], [tuple(item) for item in entry['query']], entry['body'])] = entry
+
+    def add_collection(self, path, items):
+        """
+        Serves the items in GET requests to path, e.g. '/notes', sorted by id. The dict items are served as they are.
+        """
+        items = sorted(items, key=lambda item: item['id'])
+        self.collections[path] = items
+        self.indexes[path] = {}
+
+    def get_index(self, path, field):
+        ## index of the objects by the value of a field, or by each value of a list field like emails
+        index = self.indexes[path].get(field)
+        if index is None:
+            index = {}
+            for position, item in enumerate(self.collections[path]):
+                if field.startswith('content.'):
+                    value = item.get('content', {}).get(field[len('content.'):], {})
+                    value = value.get('value') if isinstance(value, dict) else value
+                else:
+                    value = item[field] if field in item else item.get('content', {}).get(field)
+                for key in (value if isinstance(value, list) else [value]):
+                    index.setdefault(key, []).append(position)
+            self.indexes[path][field] = index
+        return index
+
+    def start(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.__handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def __handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_body(self, status, body, content_type='application/json'):
+                body = body.encode('utf-8') if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def handle_request(self):
+                with replay.lock:
+                    replay.requests += 1
+                if replay.latency:
+                    time.sleep(replay.latency)
+                url = urlsplit(self.path)
+                query = parse_qsl(url.query, keep_blank_values=True)
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+
+                entry = replay.recorded.get(request_key(self.command, url.path, query, body))
+                if entry:
+                    return self.send_body(entry['status'], entry['response'], entry['content_type'])
+
+                status, response = replay.respond(self.command, url.path, dict(query), body)
+                self.send_body(status, json.dumps(response))
+
+            do_GET = handle_request
+            do_POST = handle_request
+            do_DELETE = handle_request
+
+        return Handler
+
+    def respond(self, method, path, query, body):
+        if method == 'GET' and path in self.collections:
+            return 200, self.get_page(path, query)
+        if method == 'GET' and path == '/edges/count' and '/edges' in self.collections:
+            return 200, { 'count': len(self.filter('/edges', query)) }
+        if method == 'POST' and path == '/profiles/search' and '/profiles' in self.collections:
+            return 200, { 'profiles': self.search_profiles(body) }
+        if method == 'POST' and path in ('/edges/bulk', '/tags/bulk'):
+            posted = [dict(item, id=item.get('id') or uuid.uuid4().hex[:10]) for item in body]
+            with self.lock:
+                self.posted.setdefault(path, []).extend(posted)
+            return 200, posted
+        if method == 'POST' and path == '/invitations/edits/bulk' and self.bulk_edits:
+            ## the edits of a bulk request are validated before any of them is saved
+            if not isinstance(body, list) or any('invitations' not in edit for edit in body):
+                return 400, { 'name': 'ValidationError', 'message': 'every edit must have invitations' }
+            return 200, [self.post_edit(path, edit) for edit in body]
+        if method == 'POST' and path.endswith('/edits'):
+            return 200, self.post_edit(path, body)
+        return 404, { 'name': 'NotFoundError', 'message': f'{method} {path} is not recorded' }
+
+    def post_edit(self, path, edit):
+        edit = dict(edit, id=uuid.uuid4().hex[:10])
+        if 'invitation' in edit and 'id' not in edit['invitation']:
+            ## the id of the child invitation comes from the template of its parent, the stand-in uses the parent id and the note number
+            number = edit.get('content', {}).get('noteNumber', {}).get('value')
+            edit['invitation'] = dict(edit['invitation'], id=f'{edit.get("invitations")}/{number}' if number is not None else edit.get('invitations'))
+        with self.lock:
+            self.posted.setdefault(path, []).append(edit)
+        return edit
+
+    def filter(self, path, query):
+        filters = { key: value for key, value in query.items() if key not in ('limit', 'offset', 'after', 'sort', 'count', 'stream', 'select', 'details', 'trash', 'domain') }
+        items = self.collections[path]
+        positions = None
+        for key, value in filters.items():
+            if key == 'invitation' and path == '/notes':
+                key = 'invitations'
+            index = self.get_index(path, key)
+            matches = set(index.get(int(value) if key == 'number' else value, []))
+            positions = matches if positions is None else positions & matches
+        if positions is None:
+            return items
+        return [items[position] for position in sorted(positions)]
+
+    def get_page(self, path, query):
+        key = self.COLLECTIONS[path]
+        items = self.filter(path, query)
+        count = len(items)
+        if query.get('after'):
+            ids = [item['id'] for item in items]
+            start = next((i for i, item_id in enumerate(ids) if item_id > query['after']), len(ids))
+            items = items[start:]
+        offset = int(query.get('offset') or 0)
+        if query.get('stream') == 'true' and 'limit' not in query:
+            page = items[offset:]
+        else:
+            limit = min(int(query.get('limit') or self.page_size), self.page_size)
+            page = items[offset:offset + limit]
+        if query.get('select'):
+            fields = [field.split('.')[0] for field in query['select'].split(',')]
+            page = [{ field: item[field] for field in fields if field in item } for item in page]
+        response = { key: page }
+        if query.get('count') == 'true':
+            response['count'] = count
+        return response
+
+    def search_profiles(self, body):
+        if 'ids' in body:
+            index = self.get_index('/profiles', 'id')
+            return [self.collections['/profiles'][position] for profile_id in body['ids'] for position in index.get(profile_id, [])]
+        field = 'emails' if 'emails' in body else 'confirmedEmails'
+        index = self.get_index('/profiles', 'emails')
+        profiles = []
+        for email in body[field]:
+            for position in index.get(email, []):
+                profiles.append(dict(self.collections['/profiles'][position], email=email))
+        return profiles
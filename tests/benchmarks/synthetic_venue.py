@@ -0,0 +1,287 @@
+"""
+Deterministic synthetic venue to benchmark matching, conflicts and statistics without a real conference.
+
+The same parameters and seed always generate the same submissions, profiles, publications and affinity scores. The objects are
+plain API JSON, so they can be served by :class:`replay_server.ReplayServer`, and they are also returned as Notes, Profiles and
+BinaryScores to call the conflict and score building functions directly.
+
+    venue = SyntheticVenue(submissions=50000, reviewers=50000, seed=1)
+    venue.write_scores('scores.csv', scores_per_paper=500)
+    profiles = venue.get_profiles(venue.reviewer_ids)
+"""
+import csv
+import random
+import numpy as np
+import openreview
+from openreview.api import Note
+from openreview.tools import BinaryScores, PublicationRecord
+
+FIRST_NAMES = ['Alex', 'Maria', 'Wei', 'Priya', 'John', 'Fatima', 'Luca', 'Yuki', 'Olga', 'Carlos', 'Amara', 'Jin', 'Sara', 'Omar', 'Elena', 'Ravi']
+LAST_NAMES = ['Smith', 'Garcia', 'Zhang', 'Patel', 'Kim', 'Rossi', 'Nguyen', 'Ivanova', 'Silva', 'Okafor', 'Tanaka', 'Muller', 'Haddad', 'Kowalski']
+COMMON_DOMAINS = ['gmail.com', 'outlook.com', 'qq.com', '163.com', 'yahoo.com']
+INSTITUTION_SUFFIXES = ['edu', 'ac.uk', 'edu.cn', 'ac.jp', 'de', 'ca', 'edu.au', 'fr', 'com']
+POSITIONS = ['PhD Student', 'Postdoc', 'Assistant Professor', 'Associate Professor', 'Professor', 'Research Scientist']
+RELATIONS = ['Coauthor', 'Advisor', 'Advisee', 'Collaborator', 'Colleague']
+TOPICS = 16
+
+
+class SyntheticVenue:
+    """
+    :param venue_id: id of the venue
+    :type venue_id: str, optional
+    :param submissions: number of submissions
+    :type submissions: int, optional
+    :param reviewers: number of reviewer profiles
+    :type reviewers: int, optional
+    :param authors: number of profiles that only author submissions, by default twice the number of submissions
+    :type authors: int, optional
+    :param institutions: number of institutions, by default one per 50 profiles
+    :type institutions: int, optional
+    :param reviewer_author_ratio: probability that an author of a submission is a reviewer
+    :type reviewer_author_ratio: float, optional
+    :param publications_per_profile: average number of publications of a profile
+    :type publications_per_profile: int, optional
+    :param seed: seed of the generator
+    :type seed: int, optional
+    """
+    def __init__(self, venue_id='Synthetic.cc/2025/Conference', submissions=1000, reviewers=1000, authors=None, institutions=None,
+            reviewer_author_ratio=0.3, publications_per_profile=8, year=2025, seed=0):
+        self.venue_id = venue_id
+        self.year = year
+        self.seed = seed
+        self.rng = random.Random(seed)
+        authors = authors if authors is not None else 2 * submissions
+        institutions = institutions or max((reviewers + authors) // 50, 10)
+
+        self.domains = [f'institution{i}.{INSTITUTION_SUFFIXES[i % len(INSTITUTION_SUFFIXES)]}' for i in range(institutions)]
+        self.reviewer_ids = [self.__profile_id(i) for i in range(reviewers)]
+        self.author_ids = [self.__profile_id(i) for i in range(reviewers, reviewers + authors)]
+        self.topics = {}
+        self.profiles = [self.__build_profile(profile_id) for profile_id in self.reviewer_ids + self.author_ids]
+        self.profile_by_id = { profile['id']: profile for profile in self.profiles }
+        self.__add_relations()
+        self.publications = self.__build_publications(publications_per_profile)
+        self.submissions = [self.__build_submission(number, reviewer_author_ratio) for number in range(1, submissions + 1)]
+
+    def __profile_id(self, index):
+        ## the index makes the id unique, the names are repeated
+        return f'~{FIRST_NAMES[index % len(FIRST_NAMES)]}_{LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]}{index + 1}'
+
+    def __build_profile(self, profile_id):
+        rng = self.rng
+        fullname = ' '.join(profile_id[1:].rstrip('0123456789').split('_'))
+        history = []
+        start = self.year - rng.randint(1, 25)
+        for position in range(rng.choice([1, 1, 2, 2, 3])):
+            end = start + rng.randint(1, 6)
+            history.append({
+                'position': rng.choice(POSITIONS),
+                'start': start,
+                'end': end if end < self.year else None,
+                'institution': { 'name': 'Institution', 'domain': rng.choice(self.domains) }
+            })
+            if end >= self.year:
+                break
+            start = end
+        history.reverse()
+        history[0]['end'] = None
+        current_domain = history[0]['institution']['domain']
+        emails = [f'{profile_id[1:].lower()}@{current_domain}']
+        if rng.random() < 0.4:
+            emails.append(f'{profile_id[1:].lower()}@{rng.choice(COMMON_DOMAINS)}')
+        if len(history) > 1 and rng.random() < 0.5:
+            emails.append(f'{profile_id[1:].lower()}@{history[-1]["institution"]["domain"]}')
+        self.topics[profile_id] = rng.randrange(TOPICS)
+        return {
+            'id': profile_id,
+            'tcdate': 1600000000000,
+            'tmdate': 1600000000000,
+            'content': {
+                'names': [{ 'fullname': fullname, 'username': profile_id, 'preferred': True }],
+                'emails': emails,
+                'emailsConfirmed': emails,
+                'preferredEmail': emails[0],
+                'history': history,
+                'relations': []
+            }
+        }
+
+    def __add_relations(self):
+        rng = self.rng
+        profile_ids = list(self.profile_by_id)
+        for profile in self.profiles:
+            for _ in range(rng.choice([0, 0, 1, 2, 3, 5])):
+                related_id = rng.choice(profile_ids)
+                if related_id == profile['id']:
+                    continue
+                start = self.year - rng.randint(1, 15)
+                end = start + rng.randint(1, 10)
+                profile['content']['relations'].append({
+                    'relation': rng.choice(RELATIONS),
+                    'name': self.profile_by_id[related_id]['content']['names'][0]['fullname'],
+                    'username': related_id,
+                    'start': start,
+                    'end': end if end < self.year else None,
+                    'readers': ['everyone']
+                })
+
+    def __build_publications(self, publications_per_profile):
+        ## the coauthors of a publication usually share the topic of the first author
+        rng = self.rng
+        profile_ids = list(self.profile_by_id)
+        by_topic = {}
+        for profile_id in profile_ids:
+            by_topic.setdefault(self.topics[profile_id], []).append(profile_id)
+        publications = []
+        count = len(profile_ids) * publications_per_profile // 3
+        for i in range(count):
+            first_author = rng.choice(profile_ids)
+            same_topic = by_topic[self.topics[first_author]]
+            coauthors = { rng.choice(same_topic) if rng.random() < 0.8 else rng.choice(profile_ids) for _ in range(rng.randint(0, 4)) }
+            authorids = [first_author] + sorted(coauthors - { first_author })
+            year = self.year - rng.randint(0, 12)
+            pdate = int((year - 1970) * 365.25 * 86400000) + rng.randrange(300) * 86400000
+            publications.append({
+                'id': f'publication{i:08d}',
+                'invitations': ['DBLP.org/-/Record'],
+                'domain': 'DBLP.org',
+                'readers': ['everyone'],
+                'writers': ['DBLP.org'],
+                'signatures': ['DBLP.org'],
+                'pdate': pdate,
+                'cdate': pdate,
+                'tcdate': pdate,
+                'tmdate': pdate,
+                'content': {
+                    'title': { 'value': f'Publication {i}' },
+                    'authorids': { 'value': authorids },
+                    'year': { 'value': str(year) },
+                    'venueid': { 'value': 'dblp.org/conf/synthetic' }
+                }
+            })
+        return publications
+
+    def __build_submission(self, number, reviewer_author_ratio):
+        rng = self.rng
+        authorids = []
+        for _ in range(rng.choice([1, 2, 3, 3, 4, 4, 5, 6, 8])):
+            authorid = rng.choice(self.reviewer_ids if self.reviewer_ids and rng.random() < reviewer_author_ratio else self.author_ids)
+            if authorid not in authorids:
+                authorids.append(authorid)
+        return {
+            'id': f'submission{number:07d}',
+            'number': number,
+            'invitations': [f'{self.venue_id}/-/Submission'],
+            'domain': self.venue_id,
+            'readers': [self.venue_id, f'{self.venue_id}/Submission{number}/Authors'],
+            'writers': [self.venue_id, f'{self.venue_id}/Submission{number}/Authors'],
+            'signatures': [f'{self.venue_id}/Submission{number}/Authors'],
+            'cdate': 1700000000000 + number,
+            'tcdate': 1700000000000 + number,
+            'tmdate': 1700000000000 + number,
+            'content': {
+                'title': { 'value': f'Submission {number}' },
+                'abstract': { 'value': f'Abstract of submission {number}' },
+                'authors': { 'value': [self.profile_by_id[authorid]['content']['names'][0]['fullname'] for authorid in authorids] },
+                'authorids': { 'value': authorids },
+                'venueid': { 'value': f'{self.venue_id}/Submission' }
+            }
+        }
+
+    def get_groups(self):
+        """
+        Returns the Reviewers group and the Authors group of each submission as API JSON
+        """
+        groups = [{ 'id': f'{self.venue_id}/Reviewers', 'members': list(self.reviewer_ids), 'domain': self.venue_id, 'readers': [self.venue_id], 'writers': [self.venue_id], 'signatures': [self.venue_id], 'signatories': [self.venue_id] }]
+        for submission in self.submissions:
+            number = submission['number']
+            groups.append({ 'id': f'{self.venue_id}/Submission{number}/Authors', 'members': list(submission['content']['authorids']['value']), 'domain': self.venue_id, 'readers': [self.venue_id], 'writers': [self.venue_id], 'signatures': [self.venue_id], 'signatories': [self.venue_id] })
+        return groups
+
+    def get_submissions(self):
+        """
+        Returns the submissions as Notes
+        """
+        return [Note.from_json(submission) for submission in self.submissions]
+
+    def get_profiles(self, ids=None, with_publications=True):
+        """
+        Returns Profiles like tools.get_profiles with_publications=True, compact_publications=True and with_relations=True
+
+        :param ids: ids of the profiles, by default all the profiles
+        :type ids: list[str], optional
+        """
+        publications_by_id = {}
+        if with_publications:
+            for publication in self.publications:
+                record = PublicationRecord(publication['id'], publication['pdate'], publication['cdate'], publication['tcdate'], { 'year': publication['content']['year'], 'venueid': publication['content']['venueid'] })
+                for authorid in publication['content']['authorids']['value']:
+                    publications_by_id.setdefault(authorid, []).append(record)
+        profiles = []
+        for profile_id in (ids if ids is not None else self.profile_by_id):
+            profile = openreview.Profile.from_json(self.profile_by_id[profile_id])
+            profile.content = dict(profile.content, relations=[dict(relation, profile_id=relation['username']) for relation in profile.content['relations']])
+            if with_publications:
+                profile.content['publications'] = publications_by_id.get(profile_id, [])
+            profiles.append(profile)
+        return profiles
+
+    def iter_scores(self, scores_per_paper=None, chunk_size=1000):
+        """
+        Yields rows of submission id, reviewer id and affinity score. The score is higher when the topics of the submission and the
+        reviewer are close.
+
+        :param scores_per_paper: number of reviewers scored for each submission, by default all the reviewers
+        :type scores_per_paper: int, optional
+        """
+        for heads, tails, scores in self.__score_chunks(scores_per_paper, chunk_size):
+            for head, tail, score in zip(heads, tails, scores.tolist()):
+                yield [self.submissions[head]['id'], self.reviewer_ids[tail], score]
+
+    def __score_chunks(self, scores_per_paper, chunk_size):
+        rng = np.random.default_rng(self.seed)
+        reviewers = len(self.reviewer_ids)
+        reviewer_topics = np.array([self.topics[reviewer_id] for reviewer_id in self.reviewer_ids])
+        paper_topics = np.array([self.topics[submission['content']['authorids']['value'][0]] for submission in self.submissions])
+        per_paper = min(scores_per_paper or reviewers, reviewers)
+        for start in range(0, len(self.submissions), chunk_size):
+            papers = np.arange(start, min(start + chunk_size, len(self.submissions)))
+            if per_paper == reviewers:
+                tails = np.tile(np.arange(reviewers), len(papers))
+            else:
+                tails = np.concatenate([np.sort(rng.choice(reviewers, per_paper, replace=False)) for _ in papers])
+            heads = np.repeat(papers, per_paper)
+            distance = np.abs(paper_topics[heads] - reviewer_topics[tails])
+            distance = np.minimum(distance, TOPICS - distance) / (TOPICS / 2)
+            scores = np.clip(1 - distance + rng.normal(0, 0.1, len(heads)), 0, 1).round(3)
+            yield heads, tails, scores
+
+    def write_scores(self, path, scores_per_paper=None):
+        """
+        Writes the affinity scores to a CSV file like the ones passed to Matching.setup
+        """
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            for heads, tails, scores in self.__score_chunks(scores_per_paper, 1000):
+                writer.writerows(zip((self.submissions[head]['id'] for head in heads), (self.reviewer_ids[tail] for tail in tails), scores.tolist()))
+
+    def get_binary_scores(self, scores_per_paper=None):
+        """
+        Returns the affinity scores as BinaryScores, which can be saved to a file that Matching.setup accepts
+        """
+        chunks = list(self.__score_chunks(scores_per_paper, 1000))
+        return BinaryScores(
+            [submission['id'] for submission in self.submissions],
+            list(self.reviewer_ids),
+            np.concatenate([heads for heads, _, _ in chunks]).astype(np.uint32),
+            np.concatenate([tails for _, tails, _ in chunks]).astype(np.uint32),
+            np.concatenate([scores for _, _, scores in chunks]).astype(np.float32)
+        )
+
+    def serve(self, server):
+        """
+        Adds the submissions, publications, profiles and groups to a ReplayServer
+        """
+        server.add_collection('/notes', self.submissions + self.publications)
+        server.add_collection('/profiles', self.profiles)
+        server.add_collection('/groups', self.get_groups())
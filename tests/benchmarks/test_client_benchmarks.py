@@ -0,0 +1,223 @@
+"""
+Throughput and peak memory of the client hot paths against the local replay server.
+
+The scales are set with OPENREVIEW_BENCHMARK_SCALES, by default '1000,10000', e.g. OPENREVIEW_BENCHMARK_SCALES=1000,10000,100000.
+OPENREVIEW_BENCHMARK_LATENCY sets the seconds the server waits before every response.
+
+If OPENREVIEW_BENCHMARK_OUTPUT is set, the results are written to that JSON file. If OPENREVIEW_BENCHMARK_BASELINE points to
+a previous output, a benchmark fails when its throughput drops or its peak memory grows more than OPENREVIEW_BENCHMARK_TOLERANCE,
+by default 0.3. Only the metrics present in the baseline are compared.
+
+The CI job compares against tests/benchmarks/baseline.json, which only has the peak memory of each benchmark since the throughput
+depends on the machine. After a change that is expected to use more memory, regenerate it with
+
+OPENREVIEW_BENCHMARK_OUTPUT=results.json pytest tests/benchmarks/test_client_benchmarks.py
+python tests/benchmarks/test_client_benchmarks.py results.json > tests/benchmarks/baseline.json
+"""
+import gc
+import json
+import os
+import time
+import tracemalloc
+import pytest
+import openreview
+from openreview.api import OpenReviewClient, EdgeBatch
+from replay_server import ReplayServer
+from synthetic_venue import SyntheticVenue
+
+SCALES = [int(scale) for scale in os.environ.get('OPENREVIEW_BENCHMARK_SCALES', '1000,10000').split(',')]
+LATENCY = float(os.environ.get('OPENREVIEW_BENCHMARK_LATENCY', '0.005'))
+TOLERANCE = float(os.environ.get('OPENREVIEW_BENCHMARK_TOLERANCE', '0.3'))
+RESULTS = {}
+
+
+def build_notes(count):
+    return [{
+        'id': f'note{i:07d}',
+        'number': i + 1,
+        'invitations': ['Venue/-/Submission'],
+        'domain': 'Venue',
+        'readers': ['Venue'],
+        'writers': ['Venue'],
+        'signatures': [f'Venue/Submission{i + 1}/Authors'],
+        'content': {
+            'title': { 'value': f'Paper title {i}' },
+            'abstract': { 'value': 'Abstract ' * 30 },
+            'authorids': { 'value': [f'~Author_{i}1', f'~Author_{i + 1}1'] }
+        },
+        'cdate': 1700000000000 + i,
+        'tcdate': 1700000000000 + i,
+        'tmdate': 1700000000000 + i
+    } for i in range(count)]
+
+
+def build_edges(count):
+    return [{
+        'id': f'edge{i:07d}',
+        'invitation': 'Venue/Reviewers/-/Affinity_Score',
+        'head': f'note{i % 1000:07d}',
+        'tail': f'~Reviewer_{i // 1000}1',
+        'weight': round((i % 97) / 97, 3),
+        'domain': 'Venue',
+        'readers': ['Venue'],
+        'writers': ['Venue'],
+        'signatures': ['Venue'],
+        'cdate': 1700000000000 + i
+    } for i in range(count)]
+
+
+def build_profiles(count):
+    return [{
+        'id': f'~Reviewer_{i}1',
+        'content': {
+            'names': [{ 'fullname': f'Reviewer {i}', 'username': f'~Reviewer_{i}1' }],
+            'emails': [f'reviewer{i}@university{i % 500}.edu'],
+            'emailsConfirmed': [f'reviewer{i}@university{i % 500}.edu'],
+            'history': [{ 'position': 'Professor', 'institution': { 'domain': f'university{i % 500}.edu' } }]
+        }
+    } for i in range(count)]
+
+
+@pytest.fixture(scope='module', params=SCALES)
+def server(request):
+    scale = request.param
+    server = ReplayServer(latency=LATENCY)
+    server.add_collection('/notes', build_notes(scale))
+    server.add_collection('/edges', build_edges(scale))
+    server.add_collection('/profiles', build_profiles(scale))
+    server.scale = scale
+    with server:
+        yield server
+
+
+@pytest.fixture(scope='module', autouse=True)
+def report():
+    yield
+    for name, result in sorted(RESULTS.items()):
+        print(f'{name:40} {result["throughput"]:12.0f} objects/s {result["peak_memory"] / 1e6:10.1f} MB')
+    output = os.environ.get('OPENREVIEW_BENCHMARK_OUTPUT')
+    if output:
+        with open(output, 'w') as f:
+            json.dump(RESULTS, f, indent=2)
+
+
+def measure(name, scale, func):
+    """
+    Runs func once to measure its throughput and again with tracemalloc to measure its peak memory
+    """
+    gc.collect()
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    assert count == scale
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    key = f'{name}[{scale}]'
+    RESULTS[key] = { 'seconds': elapsed, 'throughput': scale / elapsed, 'peak_memory': peak_memory }
+
+    baseline_file = os.environ.get('OPENREVIEW_BENCHMARK_BASELINE')
+    if baseline_file:
+        with open(baseline_file) as f:
+            baseline = json.load(f).get(key)
+        if baseline and 'throughput' in baseline:
+            assert RESULTS[key]['throughput'] >= baseline['throughput'] * (1 - TOLERANCE), f'{key} throughput regressed'
+        if baseline and 'peak_memory' in baseline:
+            assert RESULTS[key]['peak_memory'] <= baseline['peak_memory'] * (1 + TOLERANCE), f'{key} peak memory regressed'
+
+
+class TestClientBenchmarks:
+
+    def test_get_all_notes(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        measure('get_all_notes', server.scale, lambda: len(client.get_all_notes(invitation='Venue/-/Submission')))
+
+    def test_get_all_notes_decode_stream(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        measure('get_all_notes_decode_stream', server.scale, lambda: len(client.get_all_notes(invitation='Venue/-/Submission', decode_stream=True)))
+
+    def test_concurrent_get(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        measure('concurrent_get', server.scale, lambda: len(openreview.tools.concurrent_get(client, client.get_edges, invitation='Venue/Reviewers/-/Affinity_Score')))
+
+    def test_efficient_iterget(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        measure('efficient_iterget', server.scale, lambda: sum(1 for _ in openreview.tools.efficient_iterget(client.get_notes, invitation='Venue/-/Submission')))
+
+    def test_prefetch_iterget(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        measure('prefetch_iterget', server.scale, lambda: sum(1 for _ in openreview.tools.prefetch_iterget(client.get_notes, invitation='Venue/-/Submission')))
+
+    def test_post_bulk_edges(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+
+        def post():
+            edges = EdgeBatch('Venue/Reviewers/-/Affinity_Score', readers=['Venue'], writers=['Venue'], signatures=['Venue'])
+            for i in range(server.scale):
+                edges.add(f'note{i % 1000:07d}', f'~Reviewer_{i // 1000}1', (i % 97) / 97)
+            return len(openreview.tools.post_bulk_edges(client, edges, batch_size=5000))
+
+        measure('post_bulk_edges', server.scale, post)
+
+    def test_post_invitation_edits(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        edits = [{
+            'invitations': 'Venue/-/Official_Review',
+            'readers': ['Venue'],
+            'writers': ['Venue'],
+            'signatures': ['Venue'],
+            'content': { 'noteId': { 'value': f'note{i:07d}' }, 'noteNumber': { 'value': i + 1 } },
+            'invitation': openreview.api.Invitation()
+        } for i in range(server.scale)]
+        measure('post_invitation_edits', server.scale, lambda: len(client.post_invitation_edits(edits)))
+
+    def test_search_profiles_by_ids(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        ids = [f'~Reviewer_{i}1' for i in range(server.scale)]
+        measure('search_profiles_ids', server.scale, lambda: len(client.search_profiles(ids=ids)))
+
+    def test_search_profiles_by_emails(self, server):
+        client = OpenReviewClient(baseurl=server.url)
+        emails = [f'reviewer{i}@university{i % 500}.edu' for i in range(server.scale)]
+        measure('search_profiles_emails', server.scale, lambda: len(client.search_profiles(confirmedEmails=emails)))
+
+
+@pytest.fixture(scope='module', params=SCALES)
+def venue(request):
+    venue = SyntheticVenue(submissions=request.param, reviewers=request.param, seed=1)
+    venue.scale = request.param
+    return venue
+
+
+class TestConflictBenchmarks:
+
+    def test_build_conflicts(self, venue):
+        reviewer_profiles = venue.get_profiles(venue.reviewer_ids)
+        profile_by_id = { profile.id: profile for profile in venue.get_profiles(venue.author_ids + venue.reviewer_ids) }
+        submissions = venue.get_submissions()
+
+        def build_conflicts():
+            info_function = openreview.tools.info_function_builder(openreview.tools.get_profile_info, cache=None)
+            conflict_index = openreview.tools.ConflictIndex()
+            for profile in reviewer_profiles:
+                conflict_index.add_user(info_function(profile))
+            conflicts_by_author = {}
+            for submission in submissions:
+                for authorid in submission.content['authorids']['value']:
+                    if authorid not in conflicts_by_author:
+                        conflicts_by_author[authorid] = conflict_index.get_conflicts(info_function(profile_by_id[authorid]))
+            return len(submissions)
+
+        measure('build_conflicts', venue.scale, build_conflicts)
+
+
+if __name__ == '__main__':
+    ## prints the peak memory of a results file as a baseline
+    import sys
+    with open(sys.argv[1]) as f:
+        results = json.load(f)
+    print(json.dumps({ key: { 'peak_memory': result['peak_memory'] } for key, result in sorted(results.items()) }, indent=2))
@@ -0,0 +1,59 @@
+import openreview
+from openreview.api import OpenReviewClient
+from replay_server import Recorder, ReplayServer
+
+
+class TestReplayServer:
+
+    def test_pagination(self):
+        notes = [{ 'id': f'note{i:03d}', 'number': i + 1, 'invitations': ['Venue/-/Submission'], 'content': {} } for i in range(25)]
+        with ReplayServer(page_size=10) as server:
+            server.add_collection('/notes', notes)
+            client = OpenReviewClient(baseurl=server.url)
+
+            assert len(client.get_notes(invitation='Venue/-/Submission')) == 10
+            assert [n.number for n in client.get_notes(invitation='Venue/-/Submission', limit=5, offset=20)] == [21, 22, 23, 24, 25]
+            assert [n.id for n in client.get_notes(invitation='Venue/-/Submission', after='note022')] == ['note023', 'note024']
+            assert [n.id for n in openreview.tools.efficient_iterget(client.get_notes, invitation='Venue/-/Submission', limit=10)] == [n['id'] for n in notes]
+            assert client.get_notes(number=3)[0].id == 'note002'
+            assert client.get_notes(invitation='Venue/-/Other') == []
+
+    def test_record_and_replay(self, tmp_path):
+        cassette = str(tmp_path / 'cassette.jsonl')
+        with ReplayServer() as server:
+            server.add_collection('/notes', [{ 'id': 'note1', 'invitations': ['Venue/-/Submission'], 'content': { 'title': { 'value': 'Paper' } } }])
+            client = OpenReviewClient(baseurl=server.url)
+            recorder = Recorder(cassette)
+            recorder.attach(client)
+            client.get_notes(invitation='Venue/-/Submission')
+            client.post_edges([openreview.api.Edge(invitation='Venue/-/Bid', head='note1', tail='~Reviewer_One1', label='High')])
+            recorder.detach(client)
+            recorder.close()
+
+        with ReplayServer(cassette=cassette, latency=0.01) as server:
+            client = OpenReviewClient(baseurl=server.url)
+            notes = client.get_notes(invitation='Venue/-/Submission')
+            assert notes[0].content['title']['value'] == 'Paper'
+            assert server.requests == 1
+
+    def test_bulk_invitation_edits(self):
+        edits = [{ 'invitations': 'Venue/-/Official_Review', 'content': { 'noteId': { 'value': f'note{i}' }, 'noteNumber': { 'value': i } }, 'invitation': openreview.api.Invitation() } for i in range(1, 251)]
+        with ReplayServer() as server:
+            client = OpenReviewClient(baseurl=server.url)
+            posted = client.post_invitation_edits(edits, batch_size=100)
+            assert [edit['invitation']['id'] for edit in posted] == [f'Venue/-/Official_Review/{i}' for i in range(1, 251)]
+            assert server.requests == 3
+            assert len(server.posted['/invitations/edits/bulk']) == 250
+
+    def test_bulk_invitation_edits_fallback(self):
+        edits = [{ 'invitations': 'Venue/-/Official_Review', 'content': { 'noteId': { 'value': f'note{i}' }, 'noteNumber': { 'value': i } }, 'invitation': openreview.api.Invitation() } for i in range(1, 251)]
+        with ReplayServer(bulk_edits=False) as server:
+            client = OpenReviewClient(baseurl=server.url)
+            posted = client.post_invitation_edits(edits, batch_size=100)
+            assert [edit['invitation']['id'] for edit in posted] == [f'Venue/-/Official_Review/{i}' for i in range(1, 251)]
+            assert server.requests == 251
+            assert len(server.posted['/invitations/edits']) == 250
+
+            ## the client remembers that the server does not support bulk edits
+            client.post_invitation_edits(edits[:2])
+            assert server.requests == 253
@@ -0,0 +1,69 @@
+import openreview
+from openreview.api import OpenReviewClient
+from replay_server import ReplayServer
+from synthetic_venue import SyntheticVenue
+
+
+class TestSyntheticVenue:
+
+    def test_deterministic(self):
+        venue = SyntheticVenue(submissions=50, reviewers=40, seed=7)
+        other = SyntheticVenue(submissions=50, reviewers=40, seed=7)
+        assert venue.submissions == other.submissions
+        assert venue.profiles == other.profiles
+        assert venue.publications == other.publications
+        assert list(venue.iter_scores(scores_per_paper=10)) == list(other.iter_scores(scores_per_paper=10))
+        assert venue.submissions != SyntheticVenue(submissions=50, reviewers=40, seed=8).submissions
+
+    def test_scores(self, tmp_path):
+        venue = SyntheticVenue(submissions=30, reviewers=20, seed=1)
+        rows = list(venue.iter_scores())
+        assert len(rows) == 600
+        assert all(0 <= score <= 1 for _, _, score in rows)
+
+        venue.write_scores(str(tmp_path / 'scores.csv'), scores_per_paper=5)
+        with open(tmp_path / 'scores.csv') as f:
+            assert len(f.readlines()) == 150
+
+        binary_scores = venue.get_binary_scores(scores_per_paper=5)
+        binary_scores.save(str(tmp_path / 'scores.npz'))
+        loaded = openreview.tools.BinaryScores.load(str(tmp_path / 'scores.npz'))
+        assert [row[:2] for row in loaded] == [row[:2] for row in venue.iter_scores(scores_per_paper=5)]
+
+    def test_conflicts(self):
+        venue = SyntheticVenue(submissions=100, reviewers=100, seed=3)
+        info_function = openreview.tools.info_function_builder(openreview.tools.get_profile_info, cache=None)
+        conflict_index = openreview.tools.ConflictIndex()
+        for profile in venue.get_profiles(venue.reviewer_ids):
+            conflict_index.add_user(info_function(profile))
+
+        profile_by_id = { profile.id: profile for profile in venue.get_profiles() }
+        conflicts = 0
+        for submission in venue.get_submissions():
+            authorids = submission.content['authorids']['value']
+            found = set()
+            for authorid in authorids:
+                found.update(conflict_index.get_conflicts(info_function(profile_by_id[authorid])))
+            ## the reviewers that are authors of the submission are always in conflict
+            assert { conflict_index.user_ids.index(authorid) for authorid in authorids if authorid in venue.reviewer_ids } <= found
+            conflicts += len(found)
+        assert conflicts > 0
+
+    def test_serve(self):
+        venue = SyntheticVenue(submissions=20, reviewers=10, seed=2)
+        with ReplayServer() as server:
+            venue.serve(server)
+            client = OpenReviewClient(baseurl=server.url)
+
+            submissions = client.get_all_notes(invitation=f'{venue.venue_id}/-/Submission')
+            assert [n.id for n in submissions] == [s['id'] for s in venue.submissions]
+            assert client.get_group(f'{venue.venue_id}/Reviewers').members == venue.reviewer_ids
+
+            profiles = openreview.tools.get_profiles(client, venue.reviewer_ids)
+            assert sorted(p.id for p in profiles) == sorted(venue.reviewer_ids)
+
+            publications = openreview.tools.load_publications([client], venue.reviewer_ids[:3], compact=True)
+            expected = venue.get_profiles(venue.reviewer_ids[:3])
+            for profile in expected:
+                ## the submissions of the profile are also returned, like in the API
+                assert sorted(p.id for p in publications[profile.id] if p.id.startswith('publication')) == sorted(p.id for p in profile.content['publications'])
@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+import openreview
+from openreview.api import AsyncOpenReviewClient
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+
+async def start_server(notes, failures=0, throttled=0):
+    state = { 'requests': [], 'failures': failures, 'throttled': throttled, 'polls': 0 }
+
+    async def get_notes(request):
+        state['requests'].append(dict(request.query))
+        if state['failures']:
+            state['failures'] -= 1
+            return web.Response(status=503)
+        if request.query.get('invitation') == 'Venue/-/Missing':
+            return web.json_response({ 'name': 'NotFoundError', 'message': 'Invitation not found' }, status=404)
+        offset = int(request.query.get('offset', 0))
+        limit = int(request.query.get('limit', 1000))
+        response = { 'notes': notes[offset:offset + limit] }
+        if request.query.get('count') == 'true':
+            response['count'] = len(notes)
+        return web.json_response(response)
+
+    async def post_edges(request):
+        edges = await request.json()
+        state['requests'].append(edges)
+        if state['throttled']:
+            state['throttled'] -= 1
+            return web.json_response({ 'name': 'TooManyRequestsError', 'message': 'Too many requests' }, status=429, headers={ 'Retry-After': '0' })
+        if state['failures']:
+            state['failures'] -= 1
+            return web.Response(status=503)
+        return web.json_response([dict(edge, id=f'edge{i}') for i, edge in enumerate(edges)])
+
+    async def get_process_logs(request):
+        state['polls'] += 1
+        return web.json_response({ 'logs': [{ 'id': edit_id, 'status': 'running' } for edit_id in request.query['id'].split(',')] })
+
+    app = web.Application()
+    app.router.add_get('/notes', get_notes)
+    app.router.add_post('/edges/bulk', post_edges)
+    app.router.add_get('/logs/process', get_process_logs)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f'http://127.0.0.1:{port}', state
+
+
+def run(coroutine_function, notes, failures=0, throttled=0):
+
+    async def main():
+        runner, baseurl, state = await start_server(notes, failures, throttled)
+        try:
+            async with AsyncOpenReviewClient(baseurl=baseurl) as client:
+                client.limit = 10
+                return await coroutine_function(client), state
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+class TestAsyncOpenReviewClient:
+
+    def test_get_all_notes(self):
+        notes = [{ 'id': f'note{i}', 'number': i + 1, 'content': { 'title': { 'value': f'Paper {i}' } } } for i in range(35)]
+        result, state = run(lambda client: client.get_all_notes(invitation='Venue/-/Submission'), notes)
+
+        assert [note.number for note in result] == list(range(1, 36))
+        assert isinstance(result[0], openreview.api.Note)
+        assert result[0].content['title']['value'] == 'Paper 0'
+        assert sorted(int(query.get('offset', 0)) for query in state['requests']) == [0, 10, 20, 30]
+
+    def test_get_notes_with_select(self):
+        notes = [{ 'id': 'note0', 'number': 1 }]
+        result, state = run(lambda client: client.get_notes(invitation='Venue/-/Submission', select='id,number'), notes)
+
+        assert state['requests'][0]['select'] == 'id,number'
+        assert type(result[0]).__name__ == 'NoteRecord'
+        assert result[0].number == 1
+
+    def test_retry_and_errors(self):
+        result, state = run(lambda client: client.get_notes(invitation='Venue/-/Submission'), [{ 'id': 'note0' }], failures=1)
+        assert [note.id for note in result] == ['note0']
+        assert len(state['requests']) == 2
+
+        with pytest.raises(openreview.OpenReviewException, match='Invitation not found') as exception:
+            run(lambda client: client.get_notes(invitation='Venue/-/Missing'), [])
+        assert exception.value.status == 404
+
+    def test_post_edges(self):
+        edges = [openreview.api.Edge(invitation='Venue/-/Affinity_Score', head=f'note{i}', tail='~Reviewer_One1', weight=0.5, readers=['Venue'], writers=['Venue'], signatures=['Venue']) for i in range(3)]
+        result, state = run(lambda client: client.post_edges(edges), [])
+        assert [edge.id for edge in result] == ['edge0', 'edge1', 'edge2']
+        assert result[2].head == 'note2'
+
+    def test_post_is_not_retried(self):
+        edges = [openreview.api.Edge(invitation='Venue/-/Affinity_Score', head='note0', tail='~Reviewer_One1', weight=0.5, readers=['Venue'], writers=['Venue'], signatures=['Venue'])]
+        with pytest.raises(openreview.OpenReviewException) as exception:
+            run(lambda client: client.post_edges(edges), [], failures=1)
+        assert exception.value.status == 503
+
+    def test_throttled_post_is_retried(self):
+        edges = [openreview.api.Edge(invitation='Venue/-/Affinity_Score', head='note0', tail='~Reviewer_One1', weight=0.5, readers=['Venue'], writers=['Venue'], signatures=['Venue'])]
+        result, state = run(lambda client: client.post_edges(edges), [], throttled=2)
+        assert [edge.id for edge in result] == ['edge0']
+        assert len(state['requests']) == 3
+
+        with pytest.raises(openreview.OpenReviewException, match='Too many requests') as exception:
+            run(lambda client: client.post_edges(edges), [], throttled=4)
+        assert exception.value.status == 429
+        assert exception.value.retry_after == '0'
+
+    def test_await_processes_polls_at_the_deadline(self):
+        result, state = run(lambda client: client.await_processes(['edit1', 'edit2'], timeout=1, min_delay=0.4), [])
+        assert [status.status for status in result.values()] == ['timeout', 'timeout']
+        ## polls at 0, 0.4 and 1 second
+        assert state['polls'] == 3
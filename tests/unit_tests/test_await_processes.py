@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+import openreview
+from openreview.api import OpenReviewClient
+
+
+def build_client(logs, batching=True):
+    client = OpenReviewClient(baseurl='http://localhost:3001')
+    client.requests = []
+
+    def get_process_logs(id=None, invitation=None, status=None, min_sdate=None):
+        client.requests.append(id)
+        ids = id.split(',')
+        if len(ids) > 1 and not batching:
+            return []
+        found = []
+        for edit_id in ids:
+            if edit_id in logs:
+                status = logs[edit_id].pop(0) if len(logs[edit_id]) > 1 else logs[edit_id][0]
+                found.append({ 'id': edit_id, 'status': status, 'log': ['failed'] if status == 'error' else [] })
+        return found
+
+    client.get_process_logs = get_process_logs
+    return client
+
+
+class TestAwaitProcesses:
+
+    def test_one_poll_for_all_edits(self):
+        client = build_client({ 'edit1': ['queued', 'running', 'ok'], 'edit2': ['ok'], 'edit3': ['running', 'error'] })
+        statuses = client.await_processes(['edit1', 'edit2', 'edit3', 'edit4'], min_delay=0.01)
+
+        assert list(statuses.keys()) == ['edit1', 'edit2', 'edit3', 'edit4']
+        assert statuses['edit1'].status == 'ok'
+        assert statuses['edit2'].succeeded()
+        assert statuses['edit3'].status == 'error'
+        assert statuses['edit3'].log == ['failed']
+        assert statuses['edit4'].status == 'none'
+        assert client.requests == ['edit1,edit2,edit3,edit4', 'edit1,edit3', 'edit1']
+
+    def test_batch_size_and_timeout(self):
+        client = build_client({ f'edit{i}': ['running'] for i in range(5) })
+        statuses = client.await_processes([f'edit{i}' for i in range(5)], timeout=0.05, batch_size=2, min_delay=0.01)
+
+        assert all(status.status == 'timeout' for status in statuses.values())
+        assert sorted(client.requests[:3]) == ['edit0,edit1', 'edit2,edit3', 'edit4']
+
+    def test_fallback_without_batch_support(self):
+        client = build_client({ 'edit1': ['running', 'ok'], 'edit2': ['ok'] }, batching=False)
+        statuses = client.await_processes(['edit1', 'edit2'], min_delay=0.01)
+
+        assert statuses['edit1'].status == 'ok'
+        assert statuses['edit2'].status == 'ok'
+        assert client.requests == ['edit1,edit2', 'edit1', 'edit2', 'edit1']
+
+    def test_watch_processes(self):
+        client = build_client({ 'edit1': ['running', 'ok'] })
+
+        async def wait():
+            return await asyncio.wrap_future(client.watch_processes(['edit1'], min_delay=0.01))
+
+        statuses = asyncio.run(wait())
+        assert statuses['edit1'].status == 'ok'
+
+    def test_post_edit_await_process_raises_error(self):
+        client = build_client({ 'edit1': ['running', 'error'] })
+
+        class Response:
+            def raise_for_status(self):
+                pass
+            def json(self):
+                return { 'id': 'edit1' }
+
+        client.session.post = lambda url, json=None, headers=None: Response()
+        with pytest.raises(openreview.OpenReviewException, match='failed'):
+            client.post_note_edit(invitation='Venue/-/Submission', signatures=['~Author_One1'], await_process=True)
+
+    def test_last_poll_at_the_deadline(self, monkeypatch):
+        client = build_client({ 'edit1': ['running', 'running', 'ok'] })
+        now = [0.0]
+        monkeypatch.setattr(openreview.api.client.time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr(openreview.api.client.time, 'sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+
+        statuses = client.await_processes(['edit1'], timeout=3, min_delay=2, max_delay=5)
+        assert statuses['edit1'].status == 'ok'
+        assert now[0] == 3
+
+    def test_single_edit_is_polled_every_half_second(self, monkeypatch):
+        client = build_client({ 'edit1': ['running', 'running', 'running', 'running', 'ok'] })
+        delays = []
+        monkeypatch.setattr(openreview.api.client.time, 'sleep', delays.append)
+
+        client._OpenReviewClient__await_process('edit1')
+        assert delays == [0.5, 0.5, 0.5, 0.5]
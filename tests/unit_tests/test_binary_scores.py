@@ -0,0 +1,44 @@
+import io
+import numpy as np
+from openreview.tools import BinaryScores
+
+
+ROWS = [
+    ['paper1', '~Reviewer_One1', '0.5'],
+    ['paper1', '~Reviewer_Two1', '0.25'],
+    [],
+    ['paper2', '~Reviewer_One1', '0.125']
+]
+
+
+class TestBinaryScores:
+
+    def test_from_rows(self):
+        scores = BinaryScores.from_rows(ROWS)
+        assert len(scores) == 3
+        assert scores.heads == ['paper1', 'paper2']
+        assert scores.tails == ['~Reviewer_One1', '~Reviewer_Two1']
+        assert list(scores) == [['paper1', '~Reviewer_One1', 0.5], ['paper1', '~Reviewer_Two1', 0.25], ['paper2', '~Reviewer_One1', 0.125]]
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / 'scores.npz')
+        BinaryScores.from_rows(ROWS).save(path)
+
+        assert BinaryScores.is_binary(path)
+        mapped = BinaryScores.load(path)
+        assert isinstance(mapped.score, np.memmap)
+        assert mapped.score.dtype == np.float32
+        assert list(mapped) == list(BinaryScores.from_rows(ROWS))
+
+        with open(path, 'rb') as file_handle:
+            data = file_handle.read()
+        assert BinaryScores.is_binary(data)
+        assert list(BinaryScores.load(data)) == list(mapped)
+        assert list(BinaryScores.load(path, mmap=False)) == list(mapped)
+
+        with np.load(path) as npz:
+            assert npz['heads'].tolist() == ['paper1', 'paper2']
+
+    def test_csv_is_not_binary(self):
+        assert not BinaryScores.is_binary(b'paper1,~Reviewer_One1,0.5\n')
+        assert not BinaryScores.is_binary(io.BytesIO(b'paper1,~Reviewer_One1,0.5\n'))
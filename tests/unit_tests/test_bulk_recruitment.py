@@ -0,0 +1,160 @@
+import threading
+import openreview
+from openreview.api import Group, Invitation
+from openreview.venue.recruitment import Recruitment
+
+
+class FakeVenue:
+
+    def __init__(self, client):
+        self.client = client
+        self.venue_id = 'Venue'
+        self.group_builder = self
+        self.invitation_builder = self
+
+    def create_recruitment_committee_groups(self, committee_name):
+        pass
+
+    def set_recruitment_invitation(self, committee_name, options):
+        return Invitation(id=f'Venue/{committee_name}/-/Recruitment', content={ 'hash_seed': { 'value': '1234' } })
+
+    def get_committee_id(self, name):
+        return f'Venue/{name}'
+
+    def get_committee_id_invited(self, name):
+        return f'Venue/{name}/Invited'
+
+    def get_committee_id_declined(self, name):
+        return f'Venue/{name}/Declined'
+
+    def get_committee_names(self):
+        return ['Reviewers', 'Area_Chairs']
+
+    def get_meta_invitation_id(self):
+        return 'Venue/-/Edit'
+
+
+class FakeClient:
+
+    def __init__(self, groups, profiles, failing_messages=[]):
+        self.groups = groups
+        self.profiles = profiles
+        self.failing_messages = failing_messages
+        self.messages = []
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get_group(self, id):
+        self.requests.append('get_group')
+        if id not in self.groups:
+            raise openreview.OpenReviewException({ 'name': 'NotFoundError', 'message': f'Group Not Found: {id}' })
+        return Group(id=id, members=list(self.groups[id]))
+
+    def search_profiles(self, ids=None, confirmedEmails=None):
+        self.requests.append('search_profiles')
+        if ids is not None:
+            if any(' ' in profile_id for profile_id in ids):
+                raise openreview.OpenReviewException({ 'name': 'ValidationError', 'message': 'Invalid id' })
+            return [profile for profile_id in ids for profile in [self.profiles.get(profile_id)] if profile]
+        return { email: self.profiles[email] for email in confirmedEmails if email in self.profiles }
+
+    def get_profile(self, profile_id):
+        self.requests.append('get_profile')
+        if ' ' in profile_id:
+            raise openreview.OpenReviewException({ 'name': 'ValidationError', 'message': 'Invalid id' })
+        if profile_id not in self.profiles:
+            raise openreview.OpenReviewException('Profile Not Found')
+        return self.profiles[profile_id]
+
+    def add_members_to_group(self, group, members):
+        self.requests.append('add_members_to_group')
+        self.groups[group] = self.groups[group] + members
+
+    def remove_members_from_group(self, group, members):
+        self.requests.append('remove_members_from_group')
+        self.groups[group] = [member for member in self.groups[group] if member not in members]
+
+    def post_message(self, subject, recipients, message, parentGroup=None, invitation=None, signature=None, **kwargs):
+        with self.lock:
+            self.requests.append('post_message')
+            if recipients[0] in self.failing_messages:
+                raise openreview.OpenReviewException({ 'name': 'Error', 'message': 'Message not sent' })
+            self.messages.append((subject, recipients[0], message))
+
+
+def build_profile(profile_id, emails):
+    return openreview.Profile(id=profile_id, content={ 'names': [{ 'fullname': profile_id, 'username': profile_id }], 'emails': emails })
+
+
+def build_recruitment(client):
+    recruitment = object.__new__(Recruitment)
+    recruitment.client = client
+    recruitment.venue = FakeVenue(client)
+    return recruitment
+
+
+def invite(recruitment, invitees, invitee_names=[], remind=False):
+    return recruitment.invite_committee('Invitation to review', 'Dear {{fullname}}, {{accept_url}}', invitees, 'Reviewers', remind, invitee_names,
+        False, 'info@venue.org', None, False, False)
+
+
+class TestBulkRecruitment:
+
+    def test_recruitment_status(self):
+        profiles = {
+            '~Invited_One1': build_profile('~Invited_One1', ['invited@mail.com']),
+            '~Member_One1': build_profile('~Member_One1', ['member@mail.com']),
+            '~New_One1': build_profile('~New_One1', ['new@mail.com']),
+            '~No_Email1': build_profile('~No_Email1', []),
+            'alias@mail.com': build_profile('~Alias_One1', ['alias@mail.com'])
+        }
+        client = FakeClient({
+            'Venue/Reviewers': ['~Member_One1'],
+            'Venue/Reviewers/Invited': ['invited@mail.com'],
+            'Venue/Reviewers/Declined': [],
+            'Venue/Area_Chairs': ['~Alias_One1'],
+            'Venue/Area_Chairs/Invited': []
+        }, profiles, failing_messages=['fail@mail.com'])
+        recruitment = build_recruitment(client)
+
+        status = invite(recruitment, ['~Invited_One1', '~Member_One1', '~New_One1', '~No_Email1', '~Not_Found1', 'NEW@mail.com', 'alias@mail.com', 'fail@mail.com', '', 'new@mail.com'],
+            invitee_names=['', '', '', '', '', 'New'])
+
+        assert status['invited'] == ['~New_One1', 'new@mail.com']
+        assert status['reminded'] == []
+        assert status['already_invited'] == { 'Venue/Reviewers/Invited': ['~Invited_One1', 'new@mail.com'] }
+        assert status['already_member'] == { 'Venue/Reviewers': ['~Member_One1'], 'Venue/Area_Chairs': ['alias@mail.com'] }
+        assert status['errors'] == {
+            'profiles_without_email': ['~No_Email1'],
+            'profile_not_found': ['~Not_Found1'],
+            repr(openreview.OpenReviewException({ 'name': 'Error', 'message': 'Message not sent' })): ['fail@mail.com']
+        }
+        assert client.groups['Venue/Reviewers/Invited'] == ['invited@mail.com', '~New_One1', 'new@mail.com']
+        assert client.requests.count('add_members_to_group') == 1
+        assert client.requests.count('search_profiles') == 2
+
+        messages = { recipient: message for _, recipient, message in client.messages }
+        assert messages['new@mail.com'].startswith('Dear New, https://openreview.net/invitation?id=Venue/Reviewers/-/Recruitment&user=new%40mail.com')
+        assert messages['~New_One1'].startswith('Dear {{fullname}}')
+
+    def test_invalid_profile_ids(self):
+        client = FakeClient({ 'Venue/Reviewers': [], 'Venue/Reviewers/Invited': [], 'Venue/Reviewers/Declined': [], 'Venue/Area_Chairs': [], 'Venue/Area_Chairs/Invited': [] },
+            { '~Valid_One1': build_profile('~Valid_One1', ['valid@mail.com']) })
+
+        status = invite(build_recruitment(client), ['~Valid_One1', '~Invalid One'])
+        assert status['invited'] == ['~Valid_One1']
+        assert status['errors'] == { 'invalid_profile_ids': ['~Invalid One'] }
+
+    def test_remind(self):
+        client = FakeClient({
+            'Venue/Reviewers': ['~Accepted_One1'],
+            'Venue/Reviewers/Invited': ['~Accepted_One1', 'declined@mail.com', 'pending@mail.com', '~Pending_Two1'],
+            'Venue/Reviewers/Declined': ['declined@mail.com'],
+            'Venue/Area_Chairs': [],
+            'Venue/Area_Chairs/Invited': []
+        }, { '~Pending_Two1': build_profile('~Pending_Two1', ['pending2@mail.com']) })
+
+        status = invite(build_recruitment(client), ['pending@mail.com'], invitee_names=['Pending'], remind=True)
+        assert status['reminded'] == ['pending@mail.com', '~Pending_Two1']
+        assert status['already_invited'] == { 'Venue/Reviewers/Invited': ['pending@mail.com'] }
+        assert [(subject, recipient) for subject, recipient, _ in sorted(client.messages)] == [('Reminder: Invitation to review', 'pending@mail.com'), ('Reminder: Invitation to review', '~Pending_Two1')]
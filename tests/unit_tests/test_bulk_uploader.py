@@ -0,0 +1,189 @@
+import os
+import threading
+import pytest
+import requests
+import urllib3
+import openreview
+from openreview.api import Edge
+from openreview.tools import BulkUploader
+from openreview.venue.matching import Matching
+
+
+class FakeClient:
+
+    def __init__(self, failures=None, error=None):
+        self.failures = failures or {}
+        self.error = error or server_error
+        self.baseurl = 'http://localhost:3001'
+        self.posted = []
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    def delete_edges(self, invitation, wait_to_finish=False):
+        self.deleted.append(invitation)
+
+    def post_edges(self, edges):
+        head = edges[0].head
+        with self.lock:
+            if self.failures.get(head, 0) > 0:
+                self.failures[head] -= 1
+                raise self.error()
+            self.posted.append(head)
+        return [Edge.from_json(edge.to_json()) for edge in edges]
+
+
+def server_error(status=500, retry_after=None):
+    error = openreview.OpenReviewException({ 'name': 'Error', 'message': 'Internal Server Error' })
+    error.status = status
+    error.retry_after = retry_after
+    return error
+
+
+def connection_error():
+    return requests.exceptions.ConnectionError(urllib3.exceptions.MaxRetryError(None, '/edges', urllib3.exceptions.NewConnectionError(None, 'Connection refused')))
+
+
+def build_edges(count):
+    return [Edge(invitation='Venue/Reviewers/-/Affinity_Score', head=f'paper{i}', tail='~Reviewer_One1', weight=0.5) for i in range(count)]
+
+
+class TestBulkUploader:
+
+    def test_upload_in_order(self):
+        client = FakeClient()
+        edges = build_edges(95)
+        result = openreview.tools.post_bulk_edges(client, edges, batch_size=10, max_concurrent=4)
+        assert [edge.head for edge in result] == [edge.head for edge in edges]
+        assert sorted(client.posted) == sorted([f'paper{i}' for i in range(0, 95, 10)])
+
+    def test_retry_failed_batch(self):
+        for error in [connection_error, lambda: server_error(429), lambda: server_error(503, retry_after='0')]:
+            client = FakeClient(failures={ 'paper20': 1 }, error=error)
+            uploader = BulkUploader(client.post_edges, batch_size=10, max_retries=1)
+            assert uploader.upload(build_edges(30), return_items=False) == 30
+            assert client.posted.count('paper20') == 1
+
+    def test_errors_after_reaching_the_server_are_not_retried(self):
+        errors = [server_error, lambda: server_error(400), lambda: server_error(503), lambda: requests.exceptions.ReadTimeout('Read timed out')]
+        for error in errors:
+            client = FakeClient(failures={ 'paper20': 1 }, error=error)
+            uploader = BulkUploader(client.post_edges, batch_size=10, max_retries=3)
+            with pytest.raises(openreview.OpenReviewException, match='1 of 3 batches failed'):
+                uploader.upload(build_edges(30))
+            assert 'paper20' not in client.posted
+
+    def test_fingerprint(self):
+        uploader = BulkUploader(None, batch_size=10)
+        edges = build_edges(30)
+        changed = build_edges(30)
+        changed[15].weight = 0.7
+        assert uploader.get_fingerprint(edges) == uploader.get_fingerprint(build_edges(30))
+        assert uploader.get_fingerprint(edges) != uploader.get_fingerprint(changed)
+
+    def test_checkpoint_file(self):
+        checkpoint_file = BulkUploader.get_checkpoint_file('Venue/Reviewers/-/Affinity_Score', 'https://api2.openreview.net')
+        assert checkpoint_file != BulkUploader.get_checkpoint_file('Venue/Reviewers/-/Affinity_Score', 'http://localhost:3001')
+        assert os.path.basename(checkpoint_file) == 'openreview-https___api2.openreview.net-Venue_Reviewers_-_Affinity_Score.checkpoint.json'
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        checkpoint_file = str(tmp_path / 'edges.checkpoint.json')
+        edges = build_edges(50)
+
+        client = FakeClient(failures={ 'paper30': 1 }, error=connection_error)
+        uploader = BulkUploader(client.post_edges, batch_size=10, max_retries=0, checkpoint_file=checkpoint_file)
+        with pytest.raises(openreview.OpenReviewException, match='1 of 5 batches failed'):
+            uploader.upload(edges)
+        assert os.path.exists(checkpoint_file)
+        assert uploader.can_resume(edges)
+        assert not uploader.can_resume(build_edges(49))
+
+        client = FakeClient()
+        uploader = BulkUploader(client.post_edges, batch_size=10, checkpoint_file=checkpoint_file)
+        assert uploader.upload(edges, return_items=False, fingerprint=uploader.get_fingerprint(edges)) == 10
+        assert client.posted == ['paper30']
+        assert not os.path.exists(checkpoint_file)
+
+    def test_resume_chunks_from_checkpoint(self, tmp_path):
+        checkpoint_file = str(tmp_path / 'chunks.checkpoint.json')
+        edges = build_edges(50)
+        chunks = lambda: (edges[start:start + 10] for start in range(0, 50, 10))
+
+        client = FakeClient(failures={ 'paper10': 1 }, error=connection_error)
+        uploader = BulkUploader(client.post_edges, max_concurrent=2, max_retries=0, checkpoint_file=checkpoint_file)
+        with pytest.raises(openreview.OpenReviewException, match='1 of 5 chunks failed'):
+            uploader.upload_chunks(chunks(), fingerprint='scores.csv')
+        assert uploader.can_resume(fingerprint='scores.csv')
+        assert not uploader.can_resume(fingerprint='other_scores.csv')
+
+        client = FakeClient()
+        uploader = BulkUploader(client.post_edges, max_concurrent=2, checkpoint_file=checkpoint_file)
+        assert uploader.upload_chunks(chunks(), fingerprint='scores.csv') == 50
+        assert client.posted == ['paper10']
+        assert not os.path.exists(checkpoint_file)
+
+    def test_batches_that_reached_the_server_are_not_resumed(self, tmp_path):
+        checkpoint_file = str(tmp_path / 'edges.checkpoint.json')
+        edges = build_edges(50)
+
+        client = FakeClient(failures={ 'paper30': 1 })
+        uploader = BulkUploader(client.post_edges, batch_size=10, checkpoint_file=checkpoint_file)
+        with pytest.raises(openreview.OpenReviewException, match='may have been saved'):
+            uploader.upload(edges)
+        assert not uploader.can_resume(edges)
+        with pytest.raises(openreview.OpenReviewException, match='can not be resumed'):
+            uploader.upload(edges)
+
+        uploader.clear_checkpoint()
+        client = FakeClient()
+        uploader = BulkUploader(client.post_edges, batch_size=10, checkpoint_file=checkpoint_file)
+        assert uploader.upload(edges, return_items=False) == 50
+        assert len(client.posted) == 5
+
+
+def build_matching(client, checkpoint_dir=None):
+    matching = object.__new__(Matching)
+    matching.client = client
+    matching.checkpoint_dir = checkpoint_dir
+    return matching
+
+
+class TestMatchingPostEdges:
+
+    def test_without_checkpoint(self, tmp_path):
+        client = FakeClient()
+        assert build_matching(client)._post_edges('Venue/Reviewers/-/Conflict', build_edges(20)) == 20
+        assert client.deleted == ['Venue/Reviewers/-/Conflict']
+
+    def test_resume(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(openreview.tools.time, 'sleep', lambda seconds: None)
+        edges = build_edges(120000)
+        client = FakeClient(failures={ 'paper50000': 4 }, error=connection_error)
+        with pytest.raises(openreview.OpenReviewException, match='Run the upload again'):
+            build_matching(client, str(tmp_path))._post_edges('Venue/Reviewers/-/Conflict', edges)
+        assert client.deleted == ['Venue/Reviewers/-/Conflict']
+
+        client = FakeClient()
+        assert build_matching(client, str(tmp_path))._post_edges('Venue/Reviewers/-/Conflict', edges) == 50000
+        assert client.deleted == []
+        assert client.posted == ['paper50000']
+        assert os.listdir(tmp_path) == []
+
+    def test_start_over_after_batches_reached_the_server(self, tmp_path):
+        edges = build_edges(120000)
+        client = FakeClient(failures={ 'paper50000': 1 })
+        with pytest.raises(openreview.OpenReviewException, match='may have been saved'):
+            build_matching(client, str(tmp_path))._post_edges('Venue/Reviewers/-/Conflict', edges)
+
+        client = FakeClient()
+        assert build_matching(client, str(tmp_path))._post_edges('Venue/Reviewers/-/Conflict', edges) == 120000
+        assert client.deleted == ['Venue/Reviewers/-/Conflict']
+        assert sorted(client.posted) == ['paper0', 'paper100000', 'paper50000']
+
+    def test_scores_are_only_hashed_with_checkpoints(self, tmp_path):
+        score_file = tmp_path / 'scores.csv'
+        score_file.write_text('paper0,~Reviewer_One1,0.5\n')
+        assert build_matching(FakeClient())._get_scores_fingerprint(str(score_file)) is None
+        assert build_matching(FakeClient())._get_scores_fingerprint(score_file.read_bytes()) is None
+
+        matching = build_matching(FakeClient(), str(tmp_path))
+        assert matching._get_scores_fingerprint(str(score_file)) == matching._get_scores_fingerprint(score_file.read_bytes())
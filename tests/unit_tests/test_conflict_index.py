@@ -0,0 +1,75 @@
+import random
+from openreview.tools import ConflictIndex
+
+
+def brute_force_conflicts(author_infos, user_info):
+    author_ids = set()
+    author_domains = set()
+    author_relations = set()
+    author_publications = set()
+    for author_info in author_infos:
+        author_ids.add(author_info['id'])
+        author_domains.update(author_info['domains'])
+        author_relations.update(author_info['relations'])
+        author_publications.update(author_info['publications'])
+
+    conflicts = set()
+    conflicts.update(author_ids.intersection(set([user_info['id']])))
+    conflicts.update(author_domains.intersection(user_info['domains']))
+    conflicts.update(author_relations.intersection([user_info['id']]))
+    conflicts.update(author_ids.intersection(user_info['relations']))
+    conflicts.update(author_publications.intersection(user_info['publications']))
+    return conflicts
+
+
+def random_info(rng, profile_id, people):
+    return {
+        'id': profile_id,
+        'domains': set(rng.sample([f'domain{i}.edu' for i in range(40)], rng.randint(0, 3))),
+        'emails': set(),
+        'relations': set(rng.sample(people, rng.randint(0, 2))),
+        'publications': set(rng.sample([f'paper{i}' for i in range(200)], rng.randint(0, 4)))
+    }
+
+
+class TestConflictIndex:
+
+    def test_get_conflicts(self):
+        index = ConflictIndex()
+        index.add_user({ 'id': '~Reviewer_One1', 'domains': { 'umass.edu' }, 'emails': set(), 'relations': set(), 'publications': set() })
+        index.add_user({ 'id': '~Reviewer_Two1', 'domains': { 'mit.edu' }, 'emails': set(), 'relations': { '~Author_One1' }, 'publications': set() })
+        index.add_user({ 'id': '~Reviewer_Three1', 'domains': { 'cmu.edu' }, 'emails': set(), 'relations': set(), 'publications': { 'paper1' } })
+        index.add_user({ 'id': '~Reviewer_Four1', 'domains': { 'stanford.edu' }, 'emails': set(), 'relations': set(), 'publications': set() })
+
+        assert len(index) == 4
+        assert index.get_conflicts({ 'id': '~Author_One1', 'domains': { 'umass.edu' }, 'emails': set(), 'relations': set(), 'publications': { 'paper1' } }) == { 0, 1, 2 }
+        assert index.get_conflicts({ 'id': '~Author_Two1', 'domains': set(), 'emails': set(), 'relations': { '~Reviewer_Four1' }, 'publications': set() }) == { 3 }
+        assert index.get_conflicts({ 'id': '~Author_Three1', 'domains': { 'google.com' }, 'emails': set(), 'relations': set(), 'publications': set() }) == set()
+
+    def test_transferred_conflicts(self):
+        index = ConflictIndex()
+        sac_info = { 'id': '~SAC_One1', 'domains': { 'umass.edu' }, 'emails': set(), 'relations': set(), 'publications': set() }
+        index.add_user({ 'id': '~AC_One1', 'domains': { 'mit.edu' }, 'emails': set(), 'relations': set(), 'publications': set() }, [sac_info])
+        index.add_user({ 'id': '~AC_Two1', 'domains': { 'mit.edu' }, 'emails': set(), 'relations': set(), 'publications': set() })
+
+        assert index.get_conflicts({ 'id': '~Author_One1', 'domains': { 'umass.edu' }, 'emails': set(), 'relations': set(), 'publications': set() }) == { 0 }
+        assert index.get_conflicts({ 'id': '~Author_Two1', 'domains': set(), 'emails': set(), 'relations': { '~SAC_One1' }, 'publications': set() }) == { 0 }
+        assert index.get_conflicts({ 'id': '~SAC_One1', 'domains': set(), 'emails': set(), 'relations': set(), 'publications': set() }) == { 0 }
+
+    def test_same_conflicts_as_pairwise_intersection(self):
+        rng = random.Random(42)
+        people = [f'~Person_{i}1' for i in range(100)]
+        user_infos = [random_info(rng, people[i], people) for i in range(50)]
+        author_infos = [random_info(rng, people[i], people) for i in range(40, 100)]
+
+        index = ConflictIndex()
+        for user_info in user_infos:
+            index.add_user(user_info)
+
+        for _ in range(200):
+            paper_authors = rng.sample(author_infos, rng.randint(1, 5))
+            expected = { position for position, user_info in enumerate(user_infos) if brute_force_conflicts(paper_authors, user_info) }
+            found = set()
+            for author_info in paper_authors:
+                found.update(index.get_conflicts(author_info))
+            assert found == expected
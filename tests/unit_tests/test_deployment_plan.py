@@ -0,0 +1,178 @@
+import threading
+import time
+import pytest
+import openreview
+from openreview.venue.invitation import InvitationBuilder
+
+
+class FakeClient:
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get_process_logs(self, id=None, min_sdate=None):
+        with self.lock:
+            self.requests.append(id)
+            statuses = self.logs.get(id, [])
+            status = statuses.pop(0) if len(statuses) > 1 else (statuses[0] if statuses else None)
+        return [{ 'id': id, 'status': status }] if status else []
+
+
+def build_invitation_builder(client):
+    builder = object.__new__(InvitationBuilder)
+    builder.client = client
+    builder.spleep_time_for_logs = 0.01
+    builder.pending_date_processes = None
+    builder.pending_date_processes_lock = threading.Lock()
+    return builder
+
+
+class TestDeploymentPlan:
+
+    def test_independent_steps_run_concurrently(self):
+        plan = openreview.tools.DeploymentPlan()
+        for name in ['review', 'meta_review', 'comment']:
+            plan.add(name, time.sleep, 0.2)
+
+        start = time.monotonic()
+        plan.run()
+        assert time.monotonic() - start < 0.5
+
+    def test_dependencies(self):
+        finished = []
+        lock = threading.Lock()
+
+        def step(name):
+            time.sleep(0.05)
+            with lock:
+                finished.append(name)
+            return name
+
+        plan = openreview.tools.DeploymentPlan()
+        plan.add('submission', step, 'submission')
+        plan.add('withdrawal', step, 'withdrawal', depends_on=['submission'])
+        plan.add('rebuttal', step, 'rebuttal', depends_on=['review'])
+        plan.add('review', step, 'review')
+
+        assert plan.get_order() == [['submission', 'review'], ['withdrawal', 'rebuttal']]
+        assert plan.run() == { 'submission': 'submission', 'review': 'review', 'withdrawal': 'withdrawal', 'rebuttal': 'rebuttal' }
+        assert finished.index('withdrawal') > finished.index('submission')
+        assert finished.index('rebuttal') > finished.index('review')
+
+    def test_failed_step(self):
+        started = []
+
+        def fail():
+            raise openreview.OpenReviewException('Error saving invitation')
+
+        plan = openreview.tools.DeploymentPlan()
+        plan.add('submission', fail)
+        plan.add('withdrawal', started.append, 'withdrawal', depends_on=['submission'])
+
+        with pytest.raises(openreview.OpenReviewException, match='Error saving invitation'):
+            plan.run()
+        assert started == []
+
+    def test_invalid_dependencies(self):
+        plan = openreview.tools.DeploymentPlan()
+        plan.add('review', print, depends_on=['submission'])
+        with pytest.raises(openreview.OpenReviewException, match='unknown step'):
+            plan.run()
+
+        plan = openreview.tools.DeploymentPlan()
+        plan.add('review', print, depends_on=['rebuttal'])
+        plan.add('rebuttal', print, depends_on=['review'])
+        with pytest.raises(openreview.OpenReviewException, match='Circular dependency'):
+            plan.run()
+
+
+class TestAwaitDateProcesses:
+
+    def test_one_poll_for_all_invitations(self):
+        client = FakeClient({ 'Venue/-/Review-0-1': [None, 'ok'], 'Venue/-/Comment-0-1': ['ok'], 'Venue/-/Meta_Review-0-1': [None, None, 'ok'] })
+        builder = build_invitation_builder(client)
+
+        builder.await_date_processes([('Venue/-/Review', 0), ('Venue/-/Comment', 0), ('Venue/-/Meta_Review', 0)])
+        assert len(client.requests) == 6
+        assert client.requests[-1] == 'Venue/-/Meta_Review-0-1'
+
+    def test_error(self):
+        client = FakeClient({ 'Venue/-/Review-0-1': ['ok'], 'Venue/-/Comment-0-1': [None, 'error'] })
+        builder = build_invitation_builder(client)
+
+        with pytest.raises(openreview.OpenReviewException, match='Error saving invitation: Venue/-/Comment'):
+            builder.await_date_processes([('Venue/-/Review', 0), ('Venue/-/Comment', 0)])
+
+    def test_timeout(self, monkeypatch):
+        builder = build_invitation_builder(FakeClient({}))
+        builder.spleep_time_for_logs = 600
+        monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+
+        with pytest.raises(openreview.OpenReviewException, match='Time out waiting for invitation to complete: Venue/-/Review'):
+            builder.await_date_processes([('Venue/-/Review', 0)])
+        assert len(builder.client.requests) == 4
+
+    def test_defer_date_processes(self):
+        builder = build_invitation_builder(FakeClient({ 'Venue/-/Review-0-1': ['ok'], 'Venue/-/Comment-0-1': ['ok'] }))
+        awaited = []
+        builder.await_date_processes = lambda date_processes: awaited.append(list(date_processes))
+
+        with builder.defer_date_processes():
+            with builder.defer_date_processes():
+                builder.pending_date_processes.append(('Venue/-/Review', 0))
+            assert awaited == []
+            builder.pending_date_processes.append(('Venue/-/Comment', 0))
+
+        assert awaited == [[('Venue/-/Review', 0), ('Venue/-/Comment', 0)]]
+        assert builder.pending_date_processes is None
+
+
+class TestCreateStages:
+
+    def build_venue(self, events):
+        client = FakeClient({})
+        client.baseurl = 'http://localhost:3001'
+        client.token = None
+        venue = openreview.venue.Venue(client, 'Venue', 'openreview.net/Support')
+        builder = venue.invitation_builder
+        builder.await_date_processes = lambda date_processes: events.append(('await', sorted(name for name, _ in date_processes)))
+
+        def create_stage(name):
+            def create():
+                ## same deferral as save_invitation
+                with builder.pending_date_processes_lock:
+                    deferred = builder.pending_date_processes is not None
+                    if deferred:
+                        builder.pending_date_processes.append((name, 0))
+                events.append(('save', name))
+                if not deferred:
+                    builder.await_date_processes([(name, 0)])
+                return name
+            return create
+
+        for name in ['submission', 'review', 'review_rebuttal', 'meta_review', 'decision']:
+            setattr(venue, f'create_{name}_stage', create_stage(name))
+        venue.create_bid_stages = create_stage('bid')
+        return venue
+
+    def test_declared_stages_run_together(self):
+        events = []
+        venue = self.build_venue(events)
+
+        results = venue.create_stages(['submission', 'review', 'meta_review', 'bid', 'review_rebuttal', 'decision'])
+        assert results == { name: name for name in ['submission', 'review', 'meta_review', 'bid', 'review_rebuttal', 'decision'] }
+
+        ## the stages without declared dependencies run in order and wait for their own date processes
+        assert events[:2] == [('save', 'submission'), ('await', ['submission'])]
+        assert events[-2:] == [('save', 'decision'), ('await', ['decision'])]
+        assert events[-3] == ('await', ['bid', 'meta_review', 'review', 'review_rebuttal'])
+        saved = [name for event, name in events[2:-3]]
+        assert sorted(saved) == ['bid', 'meta_review', 'review', 'review_rebuttal']
+        assert saved.index('review') < saved.index('review_rebuttal')
+
+    def test_unknown_stage(self):
+        venue = self.build_venue([])
+        with pytest.raises(openreview.OpenReviewException, match='Unknown stage: rebuttal'):
+            venue.create_stages(['review', 'rebuttal'])
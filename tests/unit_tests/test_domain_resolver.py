@@ -0,0 +1,48 @@
+import tld
+from openreview.tools import DomainResolver, load_duplicate_domains
+
+
+def subdomains_with_tld(domain):
+    duplicate_domains = load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    valid_domains = set()
+    for index in range(len(domain_components)):
+        d = '.'.join(domain_components[index:])
+        if not tld.is_tld(d):
+            valid_domains.add(duplicate_domains.get(d, d))
+    return sorted(valid_domains)
+
+
+class TestDomainResolver:
+
+    def test_subdomains(self):
+        resolver = DomainResolver()
+        assert list(resolver.subdomains('iesl.cs.umass.edu')) == ['cs.umass.edu', 'iesl.cs.umass.edu', 'umass.edu']
+        assert list(resolver.subdomains('aberdeen.ac.uk')) == ['abdn.ac.uk']
+        assert list(resolver.subdomains('co.uk')) == []
+
+    def test_same_subdomains_as_tld(self):
+        resolver = DomainResolver()
+        domains = list(load_duplicate_domains().keys()) + [
+            'foo.ck', 'www.ck', 'a.www.ck', 'github.io', 'user.github.io', 'city.kawasaki.jp', 'x.city.kawasaki.jp',
+            'CS.MIT.EDU', 'under_score.com', 'bad..domain.com', '192.168.0.1', 'edu', 'com.'
+        ]
+        for domain in domains:
+            assert list(resolver.subdomains(domain)) == subdomains_with_tld(domain), domain
+
+    def test_without_tld_trie(self, monkeypatch):
+        monkeypatch.setattr(DomainResolver, '_DomainResolver__load_trie', staticmethod(lambda: None))
+        resolver = DomainResolver()
+        assert resolver.trie is None
+        for domain in ['iesl.cs.umass.edu', 'aberdeen.ac.uk', 'co.uk', 'user.github.io']:
+            assert list(resolver.subdomains(domain)) == subdomains_with_tld(domain), domain
+
+    def test_cache(self):
+        resolver = DomainResolver(duplicate_domains={}, maxsize=1)
+        resolver.subdomains('cs.umass.edu')
+        resolver.subdomains('cs.umass.edu')
+        resolver.subdomains('mit.edu')
+        cache_info = resolver.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 2
+        assert cache_info.currsize == 1
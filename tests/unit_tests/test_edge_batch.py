@@ -0,0 +1,64 @@
+import random
+import openreview
+from openreview.api import Edge
+from openreview.api import EdgeBatch
+
+
+class FakeClient:
+
+    def __init__(self):
+        self.requests = []
+
+    def post_edges(self, edges):
+        body = edges.to_json() if isinstance(edges, EdgeBatch) else [edge.to_json() for edge in edges]
+        self.requests.append(body)
+        return [Edge.from_json(edge) for edge in body]
+
+
+class TestEdgeBatch:
+
+    def test_same_payload_as_edges(self):
+        rng = random.Random(7)
+        batch = EdgeBatch(invitation='Venue/Reviewers/-/Affinity_Score', readers=['Venue', 'Venue/Area_Chairs', EdgeBatch.TAIL], writers=['Venue'], signatures=['Venue'])
+        edges = []
+        for _ in range(500):
+            head = f'paper{rng.randint(0, 20)}'
+            tail = f'~Reviewer_{rng.randint(0, 50)}1'
+            score = max(round(rng.uniform(-0.2, 1), 4), 0)
+            batch.add(head, tail, score)
+            edges.append(Edge(invitation='Venue/Reviewers/-/Affinity_Score', head=head, tail=tail, weight=float(str(score)), readers=['Venue', 'Venue/Area_Chairs', tail], writers=['Venue'], signatures=['Venue']))
+
+        assert len(batch) == 500
+        assert len(batch.ids) <= 72
+        assert batch.to_json() == [edge.to_json() for edge in edges]
+        assert [edge.to_json() for edge in batch] == [edge.to_json() for edge in edges]
+        assert batch[10:20].to_json() == [edge.to_json() for edge in edges[10:20]]
+
+    def test_label_and_head_placeholder(self):
+        batch = EdgeBatch(invitation='Venue/Reviewers/-/Conflict', label='Conflict', readers=['Venue', EdgeBatch.HEAD, EdgeBatch.TAIL], writers=['Venue'], signatures=['Venue'])
+        batch.add('paper1', '~Reviewer_One1', -1)
+
+        assert batch.to_json() == [{
+            'invitation': 'Venue/Reviewers/-/Conflict',
+            'head': 'paper1',
+            'tail': '~Reviewer_One1',
+            'readers': ['Venue', 'paper1', '~Reviewer_One1'],
+            'writers': ['Venue'],
+            'signatures': ['Venue'],
+            'weight': -1.0,
+            'label': 'Conflict'
+        }]
+
+    def test_post_bulk_edges(self):
+        batch = EdgeBatch(invitation='Venue/Reviewers/-/Affinity_Score', readers=['Venue', EdgeBatch.TAIL], writers=['Venue'], signatures=['Venue'])
+        for i in range(25):
+            batch.add(f'paper{i}', '~Reviewer_One1', i / 100)
+
+        client = FakeClient()
+        assert openreview.tools.post_bulk_edges(client, batch, batch_size=10, return_edges=False) == 25
+        assert [len(body) for body in client.requests] == [10, 10, 5]
+        assert client.requests[2][0]['head'] == 'paper20'
+        assert client.requests[2][0]['weight'] == 0.2
+
+        edges = openreview.tools.post_bulk_edges(client, batch, batch_size=10)
+        assert [edge.head for edge in edges] == [f'paper{i}' for i in range(25)]
@@ -0,0 +1,247 @@
+import copy
+import datetime
+import os
+import openreview
+from openreview.api import Invitation, Note
+from openreview.venue import Venue
+from openreview.stages import ReviewStage, SubmissionStage
+
+
+class BuilderClient:
+
+    def __init__(self):
+        self.baseurl = 'http://localhost:3001'
+        self.token = None
+
+    def get_invitation(self, id):
+        raise openreview.OpenReviewException({ 'name': 'NotFoundError', 'message': f'Invitation Not Found: {id}' })
+
+
+def build_parent():
+    ## the review invitation saved by the InvitationBuilder of a venue
+    venue = Venue(BuilderClient(), 'Venue', 'openreview.net/Support')
+    venue.submission_stage = SubmissionStage()
+    venue.review_stage = ReviewStage(start_date=datetime.datetime(2024, 1, 1), due_date=datetime.datetime(2030, 1, 1), remove_fields=['title', 'review', 'rating', 'confidence'])
+    saved = []
+    venue.invitation_builder.save_invitation = lambda invitation, replacement=None: saved.append(invitation) or invitation
+    venue.invitation_builder.set_review_invitation()
+    parent = saved[0]
+    parent.domain = 'Venue'
+    return parent
+
+
+def build_child(number, process):
+    ## the child invitation as the API stores it
+    return Invitation.from_json({
+        'id': f'Venue/Submission{number}/-/Official_Review',
+        'invitations': ['Venue/-/Official_Review'],
+        'domain': 'Venue',
+        'signatures': ['Venue'],
+        'readers': ['everyone'],
+        'writers': ['Venue'],
+        'invitees': ['Venue', f'Venue/Submission{number}/Reviewers'],
+        'maxReplies': 1,
+        'cdate': 1704067200000,
+        'duedate': 1893456000000,
+        'expdate': 1893457800000,
+        'process': process,
+        'edit': {
+            'signatures': { 'param': { 'items': [{ 'prefix': f'Venue/Submission{number}/Reviewer_.*', 'optional': True }] } },
+            'readers': ['${2/note/readers}'],
+            'nonreaders': ['${2/note/nonreaders}'],
+            'writers': ['Venue'],
+            'note': {
+                'id': { 'param': { 'withInvitation': f'Venue/Submission{number}/-/Official_Review', 'optional': True } },
+                'forum': f'note{number}',
+                'replyto': f'note{number}',
+                'ddate': { 'param': { 'range': [0, 9999999999999], 'optional': True, 'deletable': True } },
+                'signatures': ['${3/signatures}'],
+                'readers': ['Venue/Program_Chairs', '${3/signatures}'],
+                'nonreaders': [f'Venue/Submission{number}/Authors'],
+                'writers': ['Venue', '${3/signatures}'],
+                'content': {}
+            }
+        },
+        'tcdate': 1704067200000,
+        'tmdate': 1704067200000
+    })
+
+
+def load_process():
+    path = os.path.join(os.path.dirname(openreview.__file__), 'venue', 'process', 'invitation_edit_process.py')
+    scope = { 'openreview': openreview, 'datetime': datetime }
+    with open(path) as f:
+        exec(f.read(), scope)
+    return scope['process']
+
+
+def build_submission(number, replies=[]):
+    return Note(id=f'note{number}', number=number, readers=['everyone'], signatures=[f'Venue/Submission{number}/Authors'], invitations=['Venue/-/Submission'],
+        content={ 'venueid': { 'value': 'Venue/Submission' } }, details={ 'replies': replies })
+
+
+class FakeClient:
+
+    def __init__(self, submissions, children, process):
+        self.submissions = submissions
+        self.children = children
+        self.process = process
+        self.posted_invitation_edits = []
+        self.posted_note_edits = []
+        self.requests = []
+
+    def get_group(self, id):
+        return openreview.api.Group(id='Venue', content={
+            'submission_venue_id': { 'value': 'Venue/Submission' },
+            'rejected_venue_id': { 'value': 'Venue/Rejected_Submission' },
+            'meta_invitation_id': { 'value': 'Venue/-/Edit' },
+            'submission_name': { 'value': 'Submission' }
+        })
+
+    def get_all_notes(self, **kwargs):
+        return self.submissions
+
+    def get_all_invitations(self, **kwargs):
+        self.requests.append('get_all_invitations')
+        return list(self.children.values())
+
+    def get_invitation(self, id):
+        self.requests.append('get_invitation')
+        return self.children[id]
+
+    def get_notes(self, **kwargs):
+        self.requests.append('get_notes')
+        return []
+
+    def post_invitation_edit(self, invitations, readers=None, writers=None, signatures=None, content=None, invitation=None):
+        self.posted_invitation_edits.append((invitations, content, invitation))
+        if invitations == 'Venue/-/Official_Review':
+            child = build_child(content['noteNumber']['value'], self.process)
+            self.children[child.id] = child
+            return { 'invitation': { 'id': child.id } }
+        return { 'invitation': invitation.to_json() }
+
+    def post_invitation_edits(self, edits):
+        self.requests.append('post_invitation_edits')
+        return [self.post_invitation_edit(**edit) for edit in edits]
+
+    def post_note_edit(self, **kwargs):
+        self.posted_note_edits.append(kwargs)
+
+
+class TestInvitationFanOut:
+
+    def test_apply_invitation_template(self):
+        parent = build_parent()
+        template = parent.edit['invitation']
+        original = copy.deepcopy(template)
+        child = openreview.tools.apply_invitation_template(template, { 'content': { 'noteId': { 'value': 'note1' }, 'noteNumber': { 'value': 1 } }, 'signatures': ['Venue'] })
+
+        expected = build_child(1, template['process']).to_json()
+        assert { key: child[key] for key in child if key != 'description' } == { key: expected[key] for key in child if key != 'description' }
+        assert child['description'] == { 'delete': True }
+        assert template == original
+
+    def test_references_inside_lists(self):
+        template = {
+            'id': 'Venue/Submission${2/content/noteNumber/value}/-/Deletion',
+            'readers': ['Venue', 'Venue/Submission${3/content/noteNumber/value}/Authors'],
+            'edit': {
+                'signatures': { 'param': { 'items': [{ 'value': 'Venue/Submission${7/content/noteNumber/value}/Authors', 'optional': True }] } },
+                'readers': ['Venue', 'Venue/Submission${4/content/noteNumber/value}/Authors'],
+                'note': { 'id': '${4/content/noteId/value}', 'signatures': ['${3/signatures}'] }
+            }
+        }
+        child = openreview.tools.apply_invitation_template(template, { 'content': { 'noteId': { 'value': 'note1' }, 'noteNumber': { 'value': 1 } } })
+
+        assert child == {
+            'id': 'Venue/Submission1/-/Deletion',
+            'readers': ['Venue', 'Venue/Submission1/Authors'],
+            'edit': {
+                'signatures': { 'param': { 'items': [{ 'value': 'Venue/Submission1/Authors', 'optional': True }] } },
+                'readers': ['Venue', 'Venue/Submission1/Authors'],
+                'note': { 'id': 'note1', 'signatures': ['${3/signatures}'] }
+            }
+        }
+
+    def test_is_invitation_up_to_date(self):
+        parent = build_parent()
+        child = openreview.tools.apply_invitation_template(parent.edit['invitation'], { 'content': { 'noteId': { 'value': 'note1' }, 'noteNumber': { 'value': 1 } } })
+        invitation = build_child(1, parent.edit['invitation']['process'])
+
+        assert openreview.tools.is_invitation_up_to_date(child, invitation)
+        invitation.duedate = 1700000000000
+        assert not openreview.tools.is_invitation_up_to_date(child, invitation)
+        invitation.duedate = 1893456000000
+        invitation.description = 'Review the submission'
+        assert not openreview.tools.is_invitation_up_to_date(child, invitation)
+
+    def test_only_changed_children_are_posted(self):
+        process = load_process()
+        parent = build_parent()
+        submissions = [build_submission(number) for number in range(1, 4)]
+        client = FakeClient(submissions, {}, parent.edit['invitation']['process'])
+
+        process(client, parent)
+        assert len(client.posted_invitation_edits) == 3
+        assert client.requests.count('post_invitation_edits') == 1
+        assert client.requests.count('get_invitation') == 0
+        assert client.requests.count('get_notes') == 0
+
+        client.posted_invitation_edits = []
+        client.requests = []
+        process(client, parent)
+        assert client.posted_invitation_edits == []
+        assert client.requests == ['get_all_invitations']
+
+        client.children['Venue/Submission2/-/Official_Review'].duedate = 1700000000000
+        process(client, parent)
+        assert [content['noteNumber']['value'] for _, content, _ in client.posted_invitation_edits] == [2]
+
+    def test_readers_from_replies(self):
+        process = load_process()
+        parent = build_parent()
+        review = { 'id': 'review1', 'forum': 'note1', 'replyto': 'note1', 'invitations': ['Venue/Submission1/-/Official_Review'],
+            'readers': ['everyone'], 'writers': ['Venue'], 'signatures': ['Venue/Submission1/Reviewer_A'], 'content': {} }
+        comment = dict(review, id='comment1', invitations=['Venue/Submission1/-/Official_Comment'])
+        client = FakeClient([build_submission(1, [review, comment])], {}, parent.edit['invitation']['process'])
+
+        process(client, parent)
+        assert len(client.posted_note_edits) == 1
+        note = client.posted_note_edits[0]['note']
+        assert note.id == 'review1'
+        assert note.readers == ['Venue/Program_Chairs', 'Venue/Submission1/Reviewer_A']
+        assert note.nonreaders == ['Venue/Submission1/Authors']
+        assert note.writers == ['Venue', 'Venue/Submission1/Reviewer_A']
+
+    def test_readers_of_up_to_date_children(self):
+        process = load_process()
+        parent = build_parent()
+        client = FakeClient([build_submission(1)], {}, parent.edit['invitation']['process'])
+        process(client, parent)
+
+        review = { 'id': 'review1', 'forum': 'note1', 'replyto': 'note1', 'invitations': ['Venue/Submission1/-/Official_Review'],
+            'readers': ['everyone'], 'writers': ['Venue'], 'signatures': ['Venue/Submission1/Reviewer_A'], 'content': {} }
+        client.submissions = [build_submission(1, [review])]
+        client.posted_invitation_edits = []
+        client.requests = []
+        process(client, parent)
+        assert client.posted_invitation_edits == []
+        assert client.requests == ['get_all_invitations']
+        assert [edit['note'].readers for edit in client.posted_note_edits] == [['Venue/Program_Chairs', 'Venue/Submission1/Reviewer_A']]
+
+        client.submissions = [build_submission(1, [dict(review, readers=['Venue/Program_Chairs', 'Venue/Submission1/Reviewer_A'], writers=['Venue', 'Venue/Submission1/Reviewer_A'])])]
+        client.posted_note_edits = []
+        process(client, parent)
+        assert client.posted_note_edits == []
+
+    def test_stale_children_are_deleted(self):
+        process = load_process()
+        parent = build_parent()
+        stale = Invitation(id='Venue/Submission9/-/Official_Review')
+        client = FakeClient([build_submission(1)], { stale.id: stale }, parent.edit['invitation']['process'])
+
+        process(client, parent)
+        deleted = [invitation for invitations, _, invitation in client.posted_invitation_edits if invitations == 'Venue/-/Edit']
+        assert [invitation.id for invitation in deleted] == ['Venue/Submission9/-/Official_Review']
+        assert deleted[0].ddate
@@ -0,0 +1,101 @@
+import openreview
+from openreview.api import Group, Invitation, Note
+
+
+def build_invitation(id, content=None, edit_content=['noteId', 'noteNumber'], tmdate=1):
+    return Invitation(id=id, content=content, tmdate=tmdate, edit={ 'content': { key: { 'value': { 'param': { 'type': 'string' } } } for key in edit_content } })
+
+
+class FakeClient:
+
+    def __init__(self, invitations):
+        self.baseurl = 'http://localhost:3001'
+        self.token = None
+        self.invitations = invitations
+        self.domain = Group(id='Venue', tmdate=1, content={
+            'submission_venue_id': { 'value': 'Venue/Submission' },
+            'submission_name': { 'value': 'Submission' },
+            'review_name': { 'value': 'Official_Review' },
+            'accept_decision_options': { 'value': ['Accept'] }
+        })
+        self.requests = []
+
+    def get_group(self, id):
+        self.requests.append('get_group')
+        return self.domain
+
+    def get_invitations(self, prefix=None, type=None, sort=None, limit=None, with_count=None):
+        self.requests.append('get_invitations')
+        invitations = sorted(self.invitations, key=lambda i: i.tmdate, reverse=True)
+        return invitations[:limit], len(invitations)
+
+    def get_all_invitations(self, prefix=None, type=None):
+        self.requests.append('get_all_invitations')
+        return self.invitations
+
+
+def build_submission(venueid='Venue/Submission', readers=['everyone'], replies=[]):
+    return Note(id='note1', number=1, domain='Venue', readers=readers, invitations=['Venue/-/Submission'], content={ 'venueid': { 'value': venueid } }, details={ 'replies': replies })
+
+
+class TestInvitationSourceCache:
+
+    def setup_method(self):
+        openreview.tools.invitation_source_cache.clear()
+
+    def test_matches_like_should_match_invitation_source(self):
+        review = Note(id='review1', forum='note1', invitations=['Venue/Submission1/-/Official_Review'], signatures=['Venue/Submission1/Reviewer_A'])
+        decision = { 'id': 'decision1', 'invitations': ['Venue/Submission1/-/Decision'], 'content': { 'decision': { 'value': 'Accept' } } }
+        invitations = [
+            build_invitation('Venue/-/Official_Review'),
+            build_invitation('Venue/-/Public_Comment', content={ 'source': { 'value': 'public_submissions' } }),
+            build_invitation('Venue/-/Camera_Ready', content={ 'source': { 'value': 'accepted_submissions' } }),
+            build_invitation('Venue/-/Rebuttal', content={ 'reply_to': { 'value': 'reviews' } }, edit_content=['noteId', 'noteNumber', 'replyto']),
+            build_invitation('Venue/-/Withdrawal', edit_content=['noteId', 'noteNumber', 'withdrawalId']),
+            build_invitation('Venue/-/Ethics_Review', content={ 'source_submissions_query': { 'value': { 'flagged': True } } })
+        ]
+        client = FakeClient(invitations)
+        cases = [
+            (build_submission(), None),
+            (build_submission(readers=['Venue']), None),
+            (build_submission(venueid='Venue', replies=[decision]), None),
+            (build_submission(venueid='Venue', replies=[]), None),
+            (build_submission(), review)
+        ]
+        for submission, note in cases:
+            expected = [openreview.tools.should_match_invitation_source(client, invitation, submission, note) for invitation in invitations]
+            assert [matches for _, matches in openreview.tools.match_invitation_sources(client, submission, note)] == expected
+
+        assert [matches for _, matches in openreview.tools.match_invitation_sources(client, build_submission(), review)] == [False, False, False, True, False, False]
+
+    def test_sources_are_compiled_once(self):
+        client = FakeClient([build_invitation('Venue/-/Official_Review'), build_invitation('Venue/-/Public_Comment')])
+
+        for _ in range(3):
+            openreview.tools.match_invitation_sources(client, build_submission())
+        assert client.requests.count('get_all_invitations') == 1
+        assert client.requests.count('get_group') == 3
+        assert openreview.tools.invitation_source_cache.hits == 2
+
+    def test_invalidation(self):
+        invitation = build_invitation('Venue/-/Official_Review')
+        client = FakeClient([invitation])
+        openreview.tools.match_invitation_sources(client, build_submission())
+
+        ## a modified invitation of invitations
+        client.invitations = [build_invitation('Venue/-/Official_Review', content={ 'source': { 'value': 'public_submissions' } }, tmdate=2)]
+        assert openreview.tools.match_invitation_sources(client, build_submission(readers=['Venue']))[0][1] == False
+
+        ## a new invitation of invitations
+        client.invitations = client.invitations + [build_invitation('Venue/-/Comment', tmdate=1)]
+        assert len(openreview.tools.match_invitation_sources(client, build_submission())) == 2
+
+        ## a modified domain
+        client.domain.tmdate = 2
+        openreview.tools.match_invitation_sources(client, build_submission())
+        assert client.requests.count('get_all_invitations') == 4
+
+    def test_source_of_the_invitation_is_not_changed(self):
+        invitation = build_invitation('Venue/-/Rebuttal', content={ 'source': { 'value': { 'venueid': 'Venue/Submission' } }, 'reply_to': { 'value': 'reviews' } })
+        openreview.tools.InvitationSource(invitation, FakeClient([]).domain)
+        assert invitation.content['source']['value'] == { 'venueid': 'Venue/Submission' }
@@ -0,0 +1,42 @@
+import json
+import pytest
+from openreview.tools import JSONArrayDecoder
+
+
+class TestJSONArrayDecoder:
+
+    def test_decode_chunks(self):
+        response = {
+            'notes': [{ 'id': str(i), 'content': { 'title': { 'value': 'Título ' * i } }, 'weight': i / 3, 'ddate': None } for i in range(100)],
+            'count': 12345
+        }
+        data = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        for chunk_size in [1, 3, 17, 1024, len(data)]:
+            chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+            assert list(JSONArrayDecoder(chunks, 'notes')) == response['notes']
+
+    def test_skip_other_keys(self):
+        data = '{"count": 2, "other": {"edges": [1]}, "edges": [{"id": "1"}, {"id": "2"}], "after": [1, 2]}'
+        assert list(JSONArrayDecoder([data], 'edges')) == [{ 'id': '1' }, { 'id': '2' }]
+        assert list(JSONArrayDecoder(['{"edges": []}'], 'edges')) == []
+        assert list(JSONArrayDecoder(['{}'], 'edges')) == []
+
+    def test_lazy_decoding(self):
+        chunks = iter([b'{"edges": [{"id": "1"},', b' {"id": "2"}', b']}'])
+        decoder = iter(JSONArrayDecoder(chunks, 'edges'))
+        assert next(decoder) == { 'id': '1' }
+        assert next(chunks) == b' {"id": "2"}'
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError):
+            list(JSONArrayDecoder(['{"edges": [{"id": "1"}'], 'edges'))
+
+    def test_value_spanning_many_chunks(self):
+        data = json.dumps({ 'notes': [{ 'id': '1', 'abstract': 'x' * 10000 }] }).encode('utf-8')
+        decoder = JSONArrayDecoder([data[i:i + 10] for i in range(0, len(data), 10)], 'notes')
+        calls = []
+        raw_decode = decoder.json_decoder.raw_decode
+        decoder.json_decoder.raw_decode = lambda buffer, position: calls.append(position) or raw_decode(buffer, position)
+
+        assert list(decoder) == [{ 'id': '1', 'abstract': 'x' * 10000 }]
+        assert len(calls) < 20
@@ -0,0 +1,35 @@
+import openreview
+from openreview.tools import load_publications, PublicationRecord
+
+
+class FakeClient:
+
+    def __init__(self, notes_by_author):
+        self.notes_by_author = notes_by_author
+        self.queries = []
+
+    def get_all_notes(self, content):
+        self.queries.append(content['authorids'])
+        return self.notes_by_author.get(content['authorids'], [])
+
+
+class TestLoadPublications:
+
+    def test_load_from_all_clients(self):
+        client_v1 = FakeClient({ '~Author_One1': [openreview.Note(id='v1_paper', invitation='Venue/-/Submission', readers=['everyone'], writers=[], signatures=[], content={ 'title': 'Paper', 'year': '2020' }, cdate=1577836800000)] })
+        client_v2 = FakeClient({ '~Author_One1': [openreview.api.Note(id='v2_paper', pdate=1609459200000, content={ 'title': { 'value': 'Paper' }, 'venueid': { 'value': 'Venue' } })] })
+
+        publications = load_publications([client_v1, client_v2], ['~Author_One1', '~Author_Two1', '~Author_One1'], compact=True)
+
+        assert [publication.id for publication in publications['~Author_One1']] == ['v1_paper', 'v2_paper']
+        assert publications['~Author_Two1'] == []
+        assert sorted(client_v1.queries) == ['~Author_One1', '~Author_Two1']
+        assert sorted(client_v2.queries) == ['~Author_One1', '~Author_Two1']
+
+        v1_record, v2_record = publications['~Author_One1']
+        assert isinstance(v1_record, PublicationRecord)
+        assert v1_record.content == { 'year': '2020' }
+        assert v2_record.content == { 'venueid': { 'value': 'Venue' } }
+        assert not hasattr(v1_record, '__dict__')
+        assert openreview.tools.filter_publications_by_year([v1_record, v2_record], 2020) == set(['v2_paper'])
+        assert openreview.tools.filter_publications_by_year([v1_record, v2_record], 2019) == set(['v1_paper', 'v2_paper'])
@@ -0,0 +1,67 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from openreview.api import OpenReviewClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(0.02)
+        body = json.dumps({ 'notes': [], 'connection': self.headers.get('Connection') }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPooledHTTPAdapter:
+
+    def setup_method(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.baseurl = f'http://127.0.0.1:{self.server.server_address[1]}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def send_requests(self, client, count, workers):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda i: client.get_notes(invitation=f'Venue/-/Submission{i}'), range(count)))
+
+    def test_connections_are_reused(self):
+        client = OpenReviewClient(baseurl=self.baseurl)
+        self.send_requests(client, 40, 4)
+
+        stats = client.get_pool_stats()
+        assert stats['pool_maxsize'] == 32
+        assert stats['requests'] == 40
+        assert stats['connections'] <= 4
+        assert stats['reused'] >= 36
+        assert stats['saturated'] == 0
+        assert stats['in_flight'] == 0
+
+    def test_saturated_pool(self):
+        client = OpenReviewClient(baseurl=self.baseurl, pool_maxsize=1)
+        self.send_requests(client, 20, 4)
+
+        stats = client.get_pool_stats()
+        assert stats['peak_in_flight'] > 1
+        assert stats['saturated'] > 0
+        assert stats['connections'] > 1
+
+    def test_without_keep_alive(self):
+        client = OpenReviewClient(baseurl=self.baseurl, keep_alive=False)
+        self.send_requests(client, 5, 1)
+
+        stats = client.get_pool_stats()
+        assert stats['connections'] == 5
+        assert stats['reused'] == 0
@@ -0,0 +1,61 @@
+import pytest
+import threading
+from types import SimpleNamespace
+from openreview.tools import prefetch_iterget, efficient_iterget
+
+
+class FakeGetter:
+
+    def __init__(self, total, fail_after=None):
+        self.objects = [SimpleNamespace(id=f'id{index:05d}') for index in range(total)]
+        self.fail_after = fail_after
+        self.calls = []
+
+    def __call__(self, limit=None, offset=None, after=None, with_count=None, sort=None, **params):
+        self.calls.append({ 'limit': limit, 'offset': offset, 'after': after })
+        if self.fail_after is not None and len(self.calls) > self.fail_after:
+            raise Exception('Server error')
+        if after is not None:
+            start = next(index for index, obj in enumerate(self.objects) if obj.id == after) + 1
+        else:
+            start = offset or 0
+        batch = self.objects[start:start + limit]
+        if with_count:
+            return batch, len(self.objects)
+        return batch
+
+
+class TestPrefetchIterget:
+
+    def test_cursor_pagination(self):
+        getter = FakeGetter(2500)
+        objects = list(prefetch_iterget(getter, limit=1000))
+        assert [o.id for o in objects] == [o.id for o in getter.objects]
+        assert [c['after'] for c in getter.calls] == [None, 'id00999', 'id01999', 'id02499']
+        assert [o.id for o in efficient_iterget(FakeGetter(2500), limit=1000)] == [o.id for o in objects]
+
+    def test_offset_pagination(self):
+        getter = FakeGetter(250)
+        objects = list(prefetch_iterget(getter, paginate='offset', limit=100))
+        assert len(objects) == 250
+        assert [c['offset'] for c in getter.calls] == [0, 100, 200, 300]
+
+    def test_empty(self):
+        getter = FakeGetter(0)
+        assert list(prefetch_iterget(getter)) == []
+        assert len(getter.calls) == 1
+
+    def test_error(self):
+        getter = FakeGetter(5000, fail_after=2)
+        iterator = prefetch_iterget(getter, limit=1000)
+        with pytest.raises(Exception, match='Server error'):
+            list(iterator)
+
+    def test_bounded_prefetch(self):
+        getter = FakeGetter(10000)
+        iterator = prefetch_iterget(getter, limit=100, prefetch=2)
+        next(iterator)
+        threading.Event().wait(0.5)
+        ## first page, two pages in the buffer and one waiting to be added
+        assert len(getter.calls) <= 4
+        iterator.close()
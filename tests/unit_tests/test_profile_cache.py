@@ -0,0 +1,82 @@
+import openreview
+from openreview.tools import ProfileCache
+
+
+class FakeClient:
+
+    def __init__(self, profiles):
+        self.baseurl = 'http://localhost:3001'
+        self.token = 'token'
+        self.profiles = profiles
+        self.searches = []
+
+    def search_profiles(self, ids=None, confirmedEmails=None):
+        if ids:
+            self.searches.append(('ids', list(ids)))
+            return [openreview.Profile.from_json(profile.to_json()) for profile in self.profiles if profile.id in ids]
+        self.searches.append(('confirmedEmails', list(confirmedEmails)))
+        return { email: openreview.Profile.from_json(profile.to_json()) for profile in self.profiles for email in profile.content['emailsConfirmed'] if email in confirmedEmails }
+
+
+def build_profile(id, email, tmdate=1):
+    return openreview.Profile(id=id, tmdate=tmdate, content={
+        'names': [{ 'fullname': id, 'username': id }],
+        'emails': [email],
+        'emailsConfirmed': [email],
+        'relations': [{ 'username': '~Relation_One1', 'relation': 'Coworker' }]
+    })
+
+
+class TestProfileCache:
+
+    def test_profiles_are_retrieved_once(self):
+        client = FakeClient([build_profile('~Reviewer_One1', 'one@mail.com'), build_profile('~Reviewer_Two1', 'two@mail.com')])
+        cache = ProfileCache()
+
+        profiles = openreview.tools.get_profiles(client, ['~Reviewer_One1', 'two@mail.com'], cache=cache)
+        assert sorted(p.id for p in profiles) == ['~Reviewer_One1', '~Reviewer_Two1']
+        profiles[0].content['publications'] = ['paper1']
+        profiles[0].content['relations'][0]['profile_id'] = '~Relation_One1'
+
+        profiles_by_id = openreview.tools.get_profiles(client, ['one@mail.com', '~Reviewer_Two1', 'three@mail.com'], as_dict=True, cache=cache)
+        assert profiles_by_id['one@mail.com'].id == '~Reviewer_One1'
+        assert profiles_by_id['~Reviewer_Two1'].id == '~Reviewer_Two1'
+        assert profiles_by_id['three@mail.com'].id == 'three@mail.com'
+        assert 'publications' not in profiles_by_id['one@mail.com'].content
+        assert 'profile_id' not in profiles_by_id['one@mail.com'].content['relations'][0]
+
+        assert client.searches == [('ids', ['~Reviewer_One1']), ('confirmedEmails', ['two@mail.com']), ('confirmedEmails', ['three@mail.com'])]
+
+    def test_expiration_and_tmdate(self):
+        client = FakeClient([])
+        cache = ProfileCache(ttl=0)
+        cache.put(client, build_profile('~Reviewer_One1', 'one@mail.com'))
+        assert cache.get(client, '~Reviewer_One1') is None
+
+        cache = ProfileCache()
+        cache.put(client, build_profile('~Reviewer_One1', 'one@mail.com', tmdate=2))
+        cache.put(client, build_profile('~Reviewer_One1', 'one@mail.com', tmdate=1))
+        assert cache.get(client, 'one@mail.com').tmdate == 2
+
+        other_client = FakeClient([])
+        other_client.token = 'other_token'
+        assert cache.get(other_client, '~Reviewer_One1') is None
+
+        cache.invalidate(client, ['~Reviewer_One1'])
+        assert cache.get(client, '~Reviewer_One1') is None
+        assert cache.get(client, 'one@mail.com') is not None
+
+    def test_venue_cache_is_shared_by_committees(self):
+        client = FakeClient([build_profile('~Reviewer_One1', 'one@mail.com')])
+        client.token = None
+        venue = openreview.venue.Venue(client, 'Venue', 'openreview.net/Support')
+        reviewers = openreview.api.Group(id='Venue/Reviewers', members=['~Reviewer_One1'])
+        area_chairs = openreview.api.Group(id='Venue/Area_Chairs', members=['~Reviewer_One1'])
+        reviewer_matching = openreview.venue.matching.Matching(venue, reviewers)
+        area_chair_matching = openreview.venue.matching.Matching(venue, area_chairs, profile_cache=venue.profile_cache)
+
+        assert reviewer_matching.profile_cache is venue.profile_cache
+        assert area_chair_matching.profile_cache is venue.profile_cache
+        for matching in [reviewer_matching, area_chair_matching]:
+            openreview.tools.get_profiles(client, matching.match_group.members, cache=matching.profile_cache)
+        assert client.searches == [('ids', ['~Reviewer_One1'])]
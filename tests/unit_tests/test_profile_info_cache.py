@@ -0,0 +1,65 @@
+import openreview
+from openreview.tools import ProfileInfoCache, info_function_builder, get_profile_info
+
+
+def build_profile(id, tmdate, domain):
+    return openreview.Profile(id=id, tmdate=tmdate, content={
+        'emails': [f'user@{domain}'],
+        'history': [{ 'position': 'PhD Student', 'start': 2017, 'end': None, 'institution': { 'domain': domain } }],
+        'relations': []
+    })
+
+
+class TestProfileInfoCache:
+
+    def test_hits_and_misses(self):
+        cache = ProfileInfoCache()
+        info_function = info_function_builder(get_profile_info, cache=cache)
+
+        profile = build_profile('~User_One1', 1, 'cs.umass.edu')
+        info = info_function(profile)
+        assert sorted(info['domains']) == ['cs.umass.edu', 'umass.edu']
+        assert cache.stats() == { 'hits': 0, 'misses': 1, 'size': 1, 'maxsize': 100000 }
+
+        assert info_function(profile) == info
+        assert info_function(profile, n_years=3)
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+        ## a different policy does not reuse the entry
+        info_function_builder(openreview.tools.get_neurips_profile_info, cache=cache)(profile)
+        assert cache.misses == 3
+
+        ## the profile was updated
+        info = info_function(build_profile('~User_One1', 2, 'mit.edu'))
+        assert info['domains'] == ['mit.edu']
+        assert cache.misses == 4
+
+    def test_profile_without_tmdate(self):
+        cache = ProfileInfoCache()
+        info_function = info_function_builder(get_profile_info, cache=cache)
+        info_function(build_profile('user@mail.com', None, 'mail.com'))
+        info_function(build_profile('user@mail.com', None, 'mail.com'))
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ProfileInfoCache(maxsize=2)
+        cache.put('a', { 'id': 'a' })
+        cache.put('b', { 'id': 'b' })
+        assert cache.get('a') == { 'id': 'a' }
+        cache.put('c', { 'id': 'c' })
+        assert cache.get('b') is None
+        assert cache.get('a') == { 'id': 'a' }
+        assert cache.get('c') == { 'id': 'c' }
+        assert len(cache) == 2
+
+    def test_entries_are_not_shared(self):
+        cache = ProfileInfoCache()
+        info = { 'id': '~User_One1', 'domains': { 'umass.edu' }, 'emails': ['user@umass.edu'] }
+        cache.put('a', info)
+        info['domains'].add('mit.edu')
+
+        cached = cache.get('a')
+        assert cached['domains'] == { 'umass.edu' }
+        cached['emails'].append('user@mit.edu')
+        assert cache.get('a')['emails'] == ['user@umass.edu']
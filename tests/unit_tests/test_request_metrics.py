@@ -0,0 +1,90 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openreview
+from openreview.api import OpenReviewClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    failures = 0
+
+    def send_json(self, status, body):
+        body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith('/notes') and Handler.failures:
+            Handler.failures -= 1
+            return self.send_json(503, { 'name': 'Error', 'message': 'Unavailable' })
+        if self.path.startswith('/notes'):
+            return self.send_json(200, { 'notes': [{ 'id': 'note1', 'content': { 'title': { 'value': 'Paper' } } }] })
+        return self.send_json(404, { 'name': 'NotFoundError', 'message': 'Not found' })
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        return self.send_json(200, json.loads(body))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRequestMetrics:
+
+    def setup_method(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = OpenReviewClient(baseurl=f'http://127.0.0.1:{self.server.server_address[1]}')
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_records(self):
+        records = []
+        self.client.add_request_hook(records.append)
+        Handler.failures = 1
+        self.client.get_notes(invitation='Venue/-/Submission', limit=10)
+        self.client.post_edge(openreview.api.Edge(invitation='Venue/-/Bid', head='note1', tail='~Reviewer_One1', label='High'))
+        try:
+            self.client.get_groups(id='Venue')
+        except openreview.OpenReviewException:
+            pass
+        self.client.remove_request_hook(records.append)
+        self.client.get_notes(invitation='Venue/-/Submission')
+
+        assert [(r.method, r.endpoint, r.params, r.status, r.retries) for r in records] == [
+            ('GET', '/notes', 'invitation,limit', 200, 1),
+            ('POST', '/edges', '', 200, 0),
+            ('GET', '/groups', 'id', 404, 0)
+        ]
+        assert records[0].bytes_in > 0
+        assert records[1].bytes_out > 0
+        assert all(r.latency > 0 for r in records)
+
+    def test_metrics_and_exporter(self, tmp_path):
+        metrics = openreview.tools.RequestMetrics()
+        exporter = openreview.tools.OTLPFileExporter(str(tmp_path / 'spans.jsonl'), batch_size=3)
+        self.client.add_request_hook(metrics)
+        self.client.add_request_hook(exporter)
+        for _ in range(4):
+            self.client.get_notes(invitation='Venue/-/Submission')
+        exporter.close()
+
+        summary = metrics.summary()
+        assert list(summary.keys()) == ['GET /notes']
+        assert summary['GET /notes']['count'] == 4
+        assert summary['GET /notes']['p50'] <= summary['GET /notes']['p99']
+        assert summary['GET /notes']['params'] == { 'invitation': 4 }
+
+        with open(tmp_path / 'spans.jsonl') as f:
+            lines = [json.loads(line) for line in f]
+        spans = [span for line in lines for span in line['resourceSpans'][0]['scopeSpans'][0]['spans']]
+        assert [len(line['resourceSpans'][0]['scopeSpans'][0]['spans']) for line in lines] == [3, 1]
+        assert spans[0]['name'] == 'GET /notes'
+        assert int(spans[0]['endTimeUnixNano']) >= int(spans[0]['startTimeUnixNano'])
+        assert { 'key': 'http.response.status_code', 'value': { 'intValue': '200' } } in spans[0]['attributes']
@@ -0,0 +1,125 @@
+import threading
+import time
+import pytest
+import requests
+import openreview
+from openreview.tools import RequestScheduler, concurrent_requests
+
+
+def rate_limited_error(retry_after=None):
+    error = openreview.OpenReviewException({ 'name': 'TooManyRequestsError', 'message': 'Too many requests' })
+    error.status = 429
+    error.retry_after = retry_after
+    return error
+
+
+class TestRequestScheduler:
+
+    def test_map_keeps_order(self):
+        scheduler = RequestScheduler()
+        assert scheduler.map(lambda x: x * 2, list(range(50))) == [x * 2 for x in range(50)]
+        assert concurrent_requests(lambda x: x + 1, [1, 2, 3], scheduler=scheduler) == [2, 3, 4]
+
+    def test_in_flight_cap(self):
+        scheduler = RequestScheduler(max_in_flight=4, initial_limit=4)
+        lock = threading.Lock()
+        current = { 'in_flight': 0, 'max': 0 }
+
+        def request(x):
+            with lock:
+                current['in_flight'] += 1
+                current['max'] = max(current['max'], current['in_flight'])
+            time.sleep(0.01)
+            with lock:
+                current['in_flight'] -= 1
+            return x
+
+        scheduler.map(request, list(range(40)))
+        assert current['max'] <= 4
+        assert scheduler.limit <= 4
+
+    def test_additive_increase(self):
+        scheduler = RequestScheduler(max_in_flight=32, initial_limit=2, latency_factor=1000)
+        scheduler.map(lambda x: x, list(range(20)))
+        assert scheduler.limit > 2
+
+    def test_retry_rate_limited(self):
+        scheduler = RequestScheduler(initial_limit=8)
+        calls = []
+
+        def request(x):
+            calls.append(x)
+            if len(calls) == 1:
+                raise rate_limited_error(retry_after='0')
+            return x
+
+        assert scheduler.map(request, [1]) == [1]
+        assert len(calls) == 2
+        assert scheduler.stats['throttled'] == 1
+        assert scheduler.limit < 8
+
+    def test_other_errors_are_raised(self):
+        scheduler = RequestScheduler()
+
+        def request(x):
+            raise openreview.OpenReviewException('Not Found')
+
+        with pytest.raises(openreview.OpenReviewException, match='Not Found'):
+            scheduler.map(request, [1])
+
+    def test_max_retries(self):
+        scheduler = RequestScheduler(max_retries=2)
+
+        def request(x):
+            raise rate_limited_error(retry_after='0')
+
+        with pytest.raises(openreview.OpenReviewException):
+            scheduler.map(request, [1])
+        assert scheduler.stats['retries'] == 2
+
+    def test_nested_requests(self):
+        scheduler = RequestScheduler(max_in_flight=2, initial_limit=2)
+
+        def request(x):
+            return sum(scheduler.map(lambda y: y, list(range(x))))
+
+        assert scheduler.map(request, [3, 4, 5]) == [3, 6, 10]
+
+    def test_get_retry_after(self):
+        assert RequestScheduler.get_retry_after(rate_limited_error('5'), 0) == 5
+        assert RequestScheduler.get_retry_after(rate_limited_error(), 3) == 8
+        assert RequestScheduler.get_retry_after(openreview.OpenReviewException('error'), 0) is None
+        assert RequestScheduler.get_retry_after(requests.exceptions.RetryError('Max retries exceeded'), 0) is None
+
+    def test_nested_requests_are_retried(self):
+        scheduler = RequestScheduler()
+        calls = []
+
+        def nested_request(y):
+            calls.append(y)
+            if len(calls) == 1:
+                raise rate_limited_error(retry_after='0')
+            return y
+
+        assert scheduler.map(lambda x: sum(scheduler.map(nested_request, [x, x])), [2]) == [4]
+        assert len(calls) == 3
+        assert scheduler.stats['retries'] == 1
+        assert scheduler.stats['throttled'] == 1
+
+    def test_retry_error(self):
+        scheduler = RequestScheduler()
+        calls = []
+
+        def request(x):
+            calls.append(x)
+            if len(calls) == 1:
+                raise ConnectionError('Connection refused')
+            return x
+
+        assert scheduler.run(request, 1, retry_error=lambda error: isinstance(error, ConnectionError)) == 1
+        assert scheduler.stats['retries'] == 1
+        assert scheduler.stats['throttled'] == 0
+
+        calls.clear()
+        with pytest.raises(ConnectionError):
+            scheduler.run(request, 1)
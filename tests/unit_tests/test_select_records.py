@@ -0,0 +1,90 @@
+import json
+import pytest
+from openreview.api import OpenReviewClient
+from openreview.api import Record
+
+
+class FakeResponse:
+
+    def __init__(self, body):
+        self.body = json.dumps(body).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), 7):
+            yield self.body[start:start + 7]
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+
+    def __init__(self, body):
+        self.body = body
+        self.params = []
+
+    def get(self, url, params=None, headers=None, stream=False):
+        self.params.append(params)
+        return FakeResponse(self.body)
+
+
+def build_client(body):
+    client = object.__new__(OpenReviewClient)
+    client.baseurl = 'http://localhost:3001'
+    client.notes_url = client.baseurl + '/notes'
+    client.edges_url = client.baseurl + '/edges'
+    client.groups_url = client.baseurl + '/groups'
+    client.headers = {}
+    client.session = FakeSession(body)
+    return client
+
+
+class TestSelectRecords:
+
+    def test_parse_select(self):
+        assert Record.parse_select('id, number,content.title,content.venueid') == { 'id': None, 'number': None, 'content': { 'title', 'venueid' } }
+        assert Record.parse_select('content.title,content') == { 'content': None }
+        assert Record.parse_select('content,content.title') == { 'content': None }
+
+    def test_record_only_has_selected_fields(self):
+        NoteRecord = Record.get_class('NoteRecord', 'id,number,content.title')
+        assert Record.get_class('NoteRecord', 'id,number,content.title') is NoteRecord
+
+        record = NoteRecord.from_json({ 'id': 'abc', 'number': 3, 'content': { 'title': { 'value': 'Paper' }, 'abstract': { 'value': 'Long' } }, 'readers': ['everyone'] })
+        assert record.id == 'abc'
+        assert record.number == 3
+        assert record.content == { 'title': { 'value': 'Paper' } }
+        assert record.to_json() == { 'id': 'abc', 'number': 3, 'content': { 'title': { 'value': 'Paper' } } }
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.readers
+
+        record = NoteRecord.from_json({ 'id': 'def' })
+        assert record.number is None
+        assert record.content is None
+
+    def test_get_notes_with_select(self):
+        client = build_client({ 'notes': [{ 'id': 'abc', 'number': 1 }, { 'id': 'def', 'number': 2 }] })
+        notes = client.get_notes(invitation='Venue/-/Submission', select='id,number')
+        assert client.session.params[0]['select'] == 'id,number'
+        assert [(n.id, n.number) for n in notes] == [('abc', 1), ('def', 2)]
+        assert type(notes[0]).__name__ == 'NoteRecord'
+
+    def test_get_edges_with_select_and_decode_stream(self):
+        client = build_client({ 'edges': [{ 'head': 'abc', 'tail': '~Reviewer_One1', 'weight': 0.5 }, { 'head': 'def', 'tail': '~Reviewer_Two1', 'weight': 1 }] })
+        edges = list(client.get_edges(invitation='Venue/-/Affinity_Score', select='head,tail,weight', decode_stream=True))
+        assert [(e.head, e.tail, e.weight) for e in edges] == [('abc', '~Reviewer_One1', 0.5), ('def', '~Reviewer_Two1', 1)]
+        assert type(edges[0]).__name__ == 'EdgeRecord'
+
+    def test_get_groups_with_select(self):
+        client = build_client({ 'groups': [{ 'id': 'Venue/Submission1/Reviewer_abc', 'members': ['~Reviewer_One1'] }] })
+        groups = client.get_groups(prefix='Venue/Submission', select='id,members')
+        assert groups[0].id == 'Venue/Submission1/Reviewer_abc'
+        assert groups[0].members == ['~Reviewer_One1']
+        assert type(groups[0]).__name__ == 'GroupRecord'
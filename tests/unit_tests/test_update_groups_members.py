@@ -0,0 +1,66 @@
+import openreview
+from openreview.api import Group
+from openreview.api import OpenReviewClient
+
+
+def build_client(groups, failing=None):
+    client = object.__new__(OpenReviewClient)
+    client.edits = []
+    client.reads = []
+
+    def get_group(group_id):
+        client.reads.append(group_id)
+        return groups[group_id]
+
+    def post_group_edit(invitation, signatures, group, readers=None, writers=None):
+        if group.id == failing:
+            raise openreview.OpenReviewException('Forbidden')
+        client.edits.append((invitation, group.id, group.members))
+
+    client.get_group = get_group
+    client.post_group_edit = post_group_edit
+    return client
+
+
+class TestUpdateGroupsMembers:
+
+    def test_one_edit_per_group(self):
+        groups = {
+            'Venue/Submission1/Reviewers': Group(id='Venue/Submission1/Reviewers', domain='Venue', signatures=['Venue'], members=[]),
+            'Venue/Submission2/Reviewers': Group(id='Venue/Submission2/Reviewers', domain='Venue', signatures=['Venue'], members=['~Reviewer_Two1'])
+        }
+        client = build_client(groups)
+        results = client.update_groups_members({
+            'Venue/Submission1/Reviewers': { 'add': ['~Reviewer_One1', '~Reviewer_One1', '~Reviewer_Two1'] },
+            'Venue/Submission2/Reviewers': { 'remove': ['~Reviewer_Two1'] },
+            'Venue/Submission3/Reviewers': { 'add': [] }
+        }, groups={ 'Venue/Submission2/Reviewers': groups['Venue/Submission2/Reviewers'] })
+
+        assert list(results.keys()) == ['Venue/Submission1/Reviewers', 'Venue/Submission2/Reviewers']
+        assert all(result['success'] for result in results.values())
+        assert sorted(client.reads) == ['Venue/Submission1/Reviewers', 'Venue/Submission2/Reviewers']
+        assert sorted(client.edits) == [
+            ('Venue/-/Edit', 'Venue/Submission1/Reviewers', { 'add': ['~Reviewer_One1', '~Reviewer_Two1'] }),
+            ('Venue/-/Edit', 'Venue/Submission2/Reviewers', { 'remove': ['~Reviewer_Two1'] })
+        ]
+
+    def test_failures_are_returned(self):
+        groups = { f'Venue/Submission{i}/Reviewers': Group(id=f'Venue/Submission{i}/Reviewers', domain='Venue', signatures=['Venue'], members=[]) for i in range(1, 4) }
+        client = build_client(groups, failing='Venue/Submission2/Reviewers')
+        results = client.update_groups_members({ group_id: { 'add': ['~Reviewer_One1'] } for group_id in groups }, groups=groups, read_back=True)
+
+        assert [result['success'] for result in results.values()] == [True, False, True]
+        assert 'Forbidden' in str(results['Venue/Submission2/Reviewers']['error'])
+        assert results['Venue/Submission1/Reviewers']['group'].id == 'Venue/Submission1/Reviewers'
+        assert len(client.edits) == 2
+
+    def test_removals_use_the_current_group(self):
+        stale = Group(id='Venue/Submission1/Reviewers', domain='Venue', signatures=['Venue'], members=['~Reviewer_One1'], anonids=True)
+        stale.anon_members = ['Venue/Submission1/Reviewer_ABCD']
+        current = Group(id='Venue/Submission1/Reviewers', domain='Venue', signatures=['Venue'], members=['~Reviewer_One1'], anonids=True)
+        current.anon_members = ['Venue/Submission1/Reviewer_EFGH']
+        client = build_client({ current.id: current })
+
+        client.update_groups_members({ current.id: { 'remove': ['~Reviewer_One1'] } }, groups={ stale.id: stale })
+        assert client.reads == [current.id]
+        assert client.edits == [('Venue/-/Edit', current.id, { 'remove': ['Venue/Submission1/Reviewer_EFGH'] })]